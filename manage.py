@@ -3,21 +3,63 @@
 # === Import(s) ===
 # => Local <=
 from project.server import create_app
+from project.server.tasks import ina
+from project.server.tasks import router
+
+# => System <=
+import uuid
 
 # => External <=
 import redis
+import click
 from flask.cli import FlaskGroup
-from rq import Connection, Worker
+from rq import Connection, Worker, SimpleWorker
 
 # === Flask Group Application ===
 app = create_app()
 cli = FlaskGroup(create_app=create_app)
 
 @cli.command("run_worker")
-def run_worker():
-    with Connection(redis.from_url(app.config["REDIS_URL"])):
-        worker = Worker(app.config["QUEUES"])
-        worker.work()
+@click.option("--pool", default=0, type=int, help="Number of warm WebDriver sessions kept by a non-forking worker")
+@click.option("--tabs", default=1, type=int, help="Number of tabs a WebDriver session interleaves a user's rows across")
+@click.option("--name", default=None, help="Worker name, w/ a pool its dedicated queue receives the rows of the users it holds sessions of")
+def run_worker(pool, tabs, name):
+    connection = redis.from_url(app.config["REDIS_URL"])
+    name = name or uuid.uuid4().hex
+    ina.config.DEFAULT_TABS = max(1, tabs)
+    ina.history.install(ina.History(ina.history.RedisStore(connection)) if ina.config.DEFAULT_ADAPTIVE else None)
+    ina.session.install(ina.Sessions(ina.session.RedisStore(connection)) if ina.config.DEFAULT_CHECKPOINT else None)
+    with Connection(connection):
+        if pool > 0:
+            drivers = ina.Pool(pool, browser=app.config["WEBDRIVER"])
+            drivers.warm()
+            ina.pool.install(drivers)
+            # i.e. only a non-forking worker keeps its users' sessions between jobs, see router.Router
+            home = router.Router.dedicated(name)
+            router.install(router.Router(connection, queue=app.config["QUEUES"][0], home=home))
+            try:
+                worker = SimpleWorker([home] + app.config["QUEUES"], name=name)
+                worker.work()
+            finally:
+                router.install(None)
+                ina.pool.install(None)
+                drivers.close()
+        else:
+            worker = Worker(app.config["QUEUES"], name=name)
+            worker.work()
+
+@cli.command("history")
+@click.option("--prefix", default="", help="Only keys starting w/ <env>/<task>/...")
+def history(prefix):
+    learned = ina.History(ina.history.RedisStore(redis.from_url(app.config["REDIS_URL"])))
+    for key, stats in learned.inspect(prefix).items():
+        timeout = "default" if stats["timeout"] is None else f"{stats['timeout']:.2f}s"
+        click.echo(f"{key}: samples={stats['samples']} misses={stats['misses']} p50={stats['p50']}s p99={stats['p99']}s timeout={timeout}")
+
+@cli.command("reset_history")
+@click.option("--prefix", default="", help="Only keys starting w/ <env>/<task>/...")
+def reset_history(prefix):
+    ina.History(ina.history.RedisStore(redis.from_url(app.config["REDIS_URL"]))).reset(prefix)
 
 if __name__ == "__main__":
     cli()
@@ -5,6 +5,30 @@
 from . import ina
 from . import const
 from . import utils
+from . import router
+
+# => External <=
+from rq import get_current_job
+
+# === Utility Function(s) ===
+def publish(handler:ina.Job):
+    """Publish a deployed INA.Job Instance's EXTRACTed records & planned costs to its RQ job, see the API's job status
+
+    """
+
+    job = get_current_job()
+    if job and (handler.records or handler.costs):
+        if handler.records: job.meta["records"] = handler.records
+        if handler.costs: job.meta["costs"] = handler.costs
+        job.save_meta()
+
+def pin():
+    """Pin the users whose sessions this worker's Driver pool still holds to this worker, see router.Router
+
+    """
+
+    routing = router.installed(); drivers = ina.pool.installed()
+    if routing and drivers: routing.pin(drivers.users())
 
 # === Export(s) ===
 # => Tasks Module <=
@@ -31,42 +55,38 @@ def create_scan(raw:dict, uid:str=None, browser:str=None)->bool:
     receipt:str = raw.get("receipt"); data:list = raw.get("data")
     if data:
         try:
-            data.sort(key = lambda row: row.get("usrId") or "N/F")
-            trues, falses = utils.partition(lambda row: row.get("orderId"), data)
-            gets = map(
-                lambda row: {
-                    "lut": {**{
-                        "usrId": row.get("usrId") or "N/A",
-                        "orderId": row["orderId"]
-                    }, **(row["lut"] or {})}
-                },
-                trues
-            )
-            finds = map(
-                lambda row: {
-                    "lut": {**{
-                        "usrId": row["usrId"],
-                        "name": row["name"]
-                    }, **(row["lut"] or {})}
-                },
-                falses
-            )
-
-            handler = ina.Job(uid, browser=browser)
-            for get in gets:
-                lut = get["lut"]
-                handler.push(const.TASK_GET_ORDER_BY_ID, elut = lut)
-                
-            prev_id = None
-            for find in finds:
-                lut = find["lut"]; curr_id = find["lut"]["usrId"]
-
-                if prev_id != curr_id:
-                    handler.push(const.TASK_SWAP_USER, elut = lut, trace = False)
-                handler.push(const.TASK_FIND_ORDER, elut = lut)
-                
-                prev_id = curr_id
+            # malformed rows are skipped up front, i.e. before any browser work
+            def usrId(row:dict)->str:
+                keys = ("orderId", "lut") if isinstance(row, dict) and row.get("orderId") else ("usrId", "name", "lut")
+                return (row.get("usrId") or "N/F") if utils.wellformed(row, keys) else None
+
+            users = utils.group(data, usrId)
+
+            def entries():
+                # gets first, then a SWAP USER before each user's finds, users in order
+                for usrId in sorted(users):
+                    for idx in users[usrId]:
+                        row = data[idx]
+                        if not row.get("orderId"): continue
+                        lut = {**{"usrId": row.get("usrId") or "N/A", "orderId": row["orderId"]}, **(row["lut"] or {})}
+                        yield handler.entry(const.TASK_GET_ORDER_BY_ID, elut = lut)
+
+                for usrId in sorted(users):
+                    swapped = False
+                    for idx in users[usrId]:
+                        row = data[idx]
+                        if row.get("orderId"): continue
+                        lut = {**{"usrId": row["usrId"], "name": row["name"]}, **(row["lut"] or {})}
+                        if not swapped:
+                            yield handler.entry(const.TASK_SWAP_USER, elut = lut, trace = False)
+                            swapped = True
+                        yield handler.entry(const.TASK_FIND_ORDER, elut = lut)
+
+            handler = ina.Job(uid, browser=browser, pool=ina.pool.installed(), parallelism=utils.parallelism(data), pipeline=utils.pipeline(raw), plan=utils.plan(raw))
+            handler.feed(entries())
             handler.deploy(receipt)
+            publish(handler)
+            pin()
             return True
 
         except KeyError: print(f"server.tasks.create_scan: Key Error - {raw}, {uid}")
@@ -83,31 +103,33 @@ def create_job(raw:dict, uid:str=None, browser:str=None)->bool:
     receipt:str = raw.get("receipt"); data:list = raw.get("data")
     if data:
         try:
-            data = list( filter(lambda row: row.get("env") and row.get("name") and row.get("usrId"), data) )
-            data.sort(key = lambda row: row["usrId"])
-            tasks = map(
-                lambda row: {
-                    "env": row["env"],
-                    "name": row["name"],
-                    "lut": {**{
-                        "usrId": row["usrId"]
-                    }, **(row["lut"] or {})}
-                },
-                data
-            )
-
-            handler = ina.Job(uid, browser=browser); prev_id = None
-            for task in tasks:
-                key = ina.Key(task["env"], task["name"]); lut = task["lut"]
-                task = const.TASKS_DICT.get(key); curr_id = lut["usrId"]
-                
-                if task:
-                    if prev_id != curr_id:
-                        handler.push(const.TASK_SWAP_USER, elut = lut, trace = False)
-                    handler.push(task, elut = lut)
-                
-                prev_id = curr_id
+            # malformed rows are skipped up front, i.e. before any browser work
+            def usrId(row:dict)->str:
+                if not utils.wellformed(row, ("lut",)): return None
+                return row["usrId"] if row.get("env") and row.get("name") and row.get("usrId") else None
+
+            users = utils.group(data, usrId)
+
+            def entries():
+                # a SWAP USER before each user's rows, users in order
+                for usrId in sorted(users):
+                    swapped = False
+                    for idx in users[usrId]:
+                        row = data[idx]
+                        task = const.TASKS_DICT.get(ina.Key(row["env"], row["name"]))
+                        if not task: continue
+
+                        lut = {**{"usrId": usrId}, **(row["lut"] or {})}
+                        if not swapped:
+                            yield handler.entry(const.TASK_SWAP_USER, elut = lut, trace = False)
+                            swapped = True
+                        yield handler.entry(task, elut = lut)
+
+            handler = ina.Job(uid, browser=browser, pool=ina.pool.installed(), parallelism=utils.parallelism(data), pipeline=utils.pipeline(raw), plan=utils.plan(raw))
+            handler.feed(entries())
             handler.deploy(receipt)
+            publish(handler)
+            pin()
             return True
 
         except KeyError: print(f"server.tasks.create_job: Key Error - {raw}, {uid}")
@@ -19,6 +19,13 @@ PATH_JOURNAL=os.path.join(Path(__file__).parents[0], "journal/")
 # => Default(s) <=
 DEFAULT_NA="DELTA"
 DEFAULT_URL="https://www.google.com/"
+DEFAULT_PARALLELISM=4
+DEFAULT_PARALLEL_THRESHOLD=200
+DEFAULT_OPTIMIZE=True
+DEFAULT_ROUTING=True
+DEFAULT_ROUTE_SPILL=4
+DEFAULT_ROUTE_TTL=ina.config.DEFAULT_CHECKPOINT_TTL
+DEFAULT_ROUTE_RECORD_TTL=86400
 DEFAULT_PREFIX=[]
 DEFAULT_SUFFIX=[
     # TODO: Get Order Id & [Optionally] Memos
@@ -5,5 +5,15 @@
 from .models import Command
 from .models import Key
 from .models import Task
+from .models import Instruction
+from .models import Row
+from .compiler import compile_task
+from .optimizer import optimize
 from .driver import Driver
+from .lite import LiteDriver
 from .job import Job
+from .planner import Planner
+from .planner import Costs
+from .pool import Pool
+from .history import History
+from .session import Sessions
@@ -0,0 +1,322 @@
+# project/server/tasks/ina/compiler.py
+
+# === Import(s) ===
+# => Local <=
+from . import const
+from . import config
+from . import models
+
+# => System <=
+import re
+from dataclasses import replace
+
+# => External <=
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.utils import keys_to_typing
+from selenium.webdriver.common.actions.key_input import TypingInteraction
+
+# === Parser(s) ===
+def raw2keys(target:str)->str:
+    """Parse raw string into key characters
+
+    Special values are replace w/ their corresponding special characters
+
+    Parameters
+    ----------
+    target: str
+        The raw string
+
+    Returns
+    -------
+    str
+    """
+
+    for replacement in re.findall(const.RE_POSITIONAL, target):
+        target = target.replace(replacement, const.KEYS[replacement])
+    return target
+
+def raw2actions(argv:list)->tuple:
+    """Parse raw key arguments into a tuple of (key logic, key characters)
+
+    Parameters
+    ----------
+    argv: list
+        A list of key actions
+        e.g. [("KEY_DOWN", "${SHIFT}"), "uppercase", ("KEY_UP", "${SHIFT}")]
+
+    Returns
+    -------
+    tuple
+    """
+
+    actions = []
+    for arg in argv:
+        if isinstance(arg, list) or isinstance(arg, tuple):
+            try:
+                logic = arg[0]
+                keys = raw2keys(arg[1])
+            except IndexError: raise IndexError(f"INA.compiler.raw2actions: IndexError '{argv}'=>{arg}")
+        else:
+            logic = "SEND"
+            keys = raw2keys(str(arg))
+        actions.append((logic, keys))
+    return tuple(actions)
+
+def actions2typing(actions:tuple)->tuple:
+    """Build the W3C key interactions of parsed key actions, i.e. what a Selenium ActionChains builds per key & per execution
+    A SEND presses & releases each character, a KEY_DOWN or a KEY_UP only presses or releases each of them
+
+    Parameters
+    ----------
+    actions: tuple
+        A tuple of (key logic, key characters), see 'raw2actions'
+
+    Returns
+    -------
+    tuple: per action, a tuple of Selenium TypingInteraction
+    """
+
+    typing = []
+    for logic, keys in actions:
+        if logic == const.KEY_DOWN: typed = [TypingInteraction(None, "keyDown", key) for key in keys]
+        elif logic == const.KEY_UP: typed = [TypingInteraction(None, "keyUp", key) for key in keys]
+        else: 
+            typed = []
+            for key in keys_to_typing(keys): typed += [TypingInteraction(None, "keyDown", key), TypingInteraction(None, "keyUp", key)]
+        typing.append(tuple(typed))
+    return tuple(typing)
+
+def raw2ec(target:str, arg:str):
+    """Parse raw strings into an expected condition argument
+    ELEMENT arguments are left as XPATH values, they can only be found at runtime
+
+    Parameters
+    ----------
+    target: str
+        Either an Integer, an XPATH or a URL
+    arg: str
+        Either 'INTEGER', 'LOCATOR' or 'ELEMENT'
+
+    Returns
+    -------
+    expected_condition argument
+    """
+
+    if arg == "INTEGER": return int(target)
+    elif arg == "LOCATOR": return (By.XPATH, target)
+    else: return target
+
+def raw2offset(argv:list)->tuple:
+    """Parse raw [<XOFFSET>, <YOFFSET>] into a tuple of integers
+
+    Parameters
+    ----------
+    argv: list
+        The x & y offsets
+
+    Returns
+    -------
+    tuple
+    """
+
+    return (int(argv[0]), int(argv[1]))
+
+def raw2readiness(argv:list)->tuple:
+    """Parse raw [<READINESS>, <VALUE>] navigation arguments into a tuple
+
+    Parameters
+    ----------
+    argv: list, optional
+        The readiness mode & its value, i.e. idle milliseconds or an XPATH
+
+    Returns
+    -------
+    tuple: (mode, value), by default: config.DEFAULT_READINESS
+    """
+
+    if not argv: return config.DEFAULT_READINESS
+
+    mode = argv[0]
+    value = argv[1] if len(argv) > 1 else None
+    if mode == const.READY_NETWORK_IDLE and value is None: value = config.DEFAULT_IDLE
+    return (mode, value)
+
+def raw2fields(target:dict)->tuple:
+    """Parse a raw {<FIELD>: <SELECTOR>} map into a tuple of (field, kind, selector, all)
+
+    Parameters
+    ----------
+    target: dict
+        e.g. {"orderId": "//cite", "status": "css:span.status", "memos": "@//li[@class='memo']"}
+
+    Returns
+    -------
+    tuple
+    """
+
+    if not isinstance(target, dict): raise TypeError(f"INA.compiler.raw2fields: TypeError '{target}' is not a field map")
+
+    fields = []
+    for name, selector in target.items():
+        every = selector.startswith(const.FINDV)
+        if every: selector = selector[len(const.FINDV):]
+        if selector.startswith(const.FIELD_CSS_PREFIX): kind, selector = const.FIELD_CSS, selector[len(const.FIELD_CSS_PREFIX):]
+        else: kind = const.FIELD_XPATH
+        fields.append((str(name), kind, selector.strip(), every))
+    return tuple(fields)
+
+# === Resolver(s) ===
+# Each resolver returns (op, args) w/ pre-resolved arguments or raises, in which case the raw command is kept
+def resolve_pause(cmd:models.Command, options:dict)->tuple:
+    if options.get(const.OPTION_PAUSE) == const.PAUSE_BOUND: return "settle", (float(cmd.target), None)
+    return "pause", (float(cmd.target), None)
+
+def resolve_navigation(cmd:models.Command, options:dict)->tuple:
+    return cmd.label.lower(), (cmd.target, raw2readiness(cmd.argv))
+
+def resolve_wait(cmd:models.Command, options:dict)->tuple:
+    operation = cmd.argv[0]
+    condition, kind = const.EXPECTED_CONDITIONS[cmd.argv[1]]
+    value = cmd.argv[2] if len(cmd.argv) > 2 else None
+    return "wait_for", (operation, condition, kind, raw2ec(cmd.target, kind), value)
+
+def resolve_send_keys(cmd:models.Command, options:dict)->tuple:
+    actions = raw2actions(cmd.argv)
+    return "send_key_actions", (cmd.target, actions, actions2typing(actions))
+
+def resolve_dsend_keys(cmd:models.Command, options:dict)->tuple:
+    return "dsend_keys", (cmd.target, tuple(filter(lambda arg: isinstance(arg, str), cmd.argv)))
+
+def resolve_offset(cmd:models.Command, options:dict)->tuple:
+    return cmd.label.lower(), (cmd.target, raw2offset(cmd.argv))
+
+# Block commands' jump targets (i.e. program counters) are linked once the whole Task is compiled, see 'link'
+def resolve_branch(cmd:models.Command, options:dict)->tuple:
+    return "branch", (cmd.target, cmd.label.lower() == const.IF_PRESENT, None)
+
+def resolve_else(cmd:models.Command, options:dict)->tuple:
+    return "jump", (None,)
+
+def resolve_extract(cmd:models.Command, options:dict)->tuple:
+    return "extract", (raw2fields(cmd.target), None)
+
+def resolve_for_each(cmd:models.Command, options:dict)->tuple:
+    return "for_each", (cmd.target, None)
+
+def resolve_paginate(cmd:models.Command, options:dict)->tuple:
+    pages = int(cmd.argv[0]) if cmd.argv else config.DEFAULT_MAX_PAGES
+    return "paginate", (cmd.target, pages, None)
+
+def resolve_end(cmd:models.Command, options:dict)->tuple:
+    return "nop", ()
+
+RESOLVERS={
+    "get": resolve_navigation,
+    "dget": resolve_navigation,
+    "pause": resolve_pause,
+    "wait": resolve_wait,
+    "send_keys": resolve_send_keys,
+    "dsend_keys": resolve_dsend_keys,
+    "drag_and_drop_by_offset": resolve_offset,
+    "move_to_element_with_offset": resolve_offset,
+    "move_by_offset": resolve_offset,
+    const.IF_PRESENT: resolve_branch,
+    const.IF_NOT_PRESENT: resolve_branch,
+    const.ELSE: resolve_else,
+    "extract": resolve_extract,
+    const.FOR_EACH: resolve_for_each,
+    const.PAGINATE: resolve_paginate,
+    const.END: resolve_end
+}
+
+# === Compiler ===
+def compile_command(cmd:models.Command, options:dict=None)->models.Instruction:
+    """Compile a Command object into an Instruction object
+
+    Parameters
+    ----------
+    cmd: models.Command
+        The Command object
+    options: dict, optional
+        The Task's journal options, {"fail_fast": true} makes every non-optional Instruction critical
+
+    Returns
+    -------
+    models.Instruction
+    """
+
+    options = options or {}
+    label = cmd.label.lower()
+    critical = bool(cmd.critical or options.get(const.OPTION_FAIL_FAST)) and not cmd.optional
+    resolver = RESOLVERS.get(label)
+    if resolver:
+        try:
+            op, args = resolver(cmd, options)
+            return models.Instruction(op, args, cmd, critical)
+        except (IndexError, KeyError, TypeError, ValueError): pass
+    return models.Instruction(label, (cmd.target, cmd.argv), cmd, critical)
+
+def link(program:list)->tuple:
+    """Link the jump targets of a program's blocks
+    IF_PRESENT|IF_NOT_PRESENT ... [ELSE ...] END: a branch falls through into its block & otherwise jumps past its ELSE (or END), 
+    an ELSE jumps past its END
+    FOR_EACH|PAGINATE ... END: a loop jumps past its END if there is nothing to iterate, its END jumps back into the loop
+
+    Parameters
+    ----------
+    program: list
+        A list of Instruction objects
+
+    Returns
+    -------
+    tuple
+    """
+
+    program = list(program)
+    blocks = []     # a stack of [label, opening pc, else's pc]
+    for pc, instr in enumerate(program):
+        label = instr.cmd.label.lower()
+        if instr.op in ("branch", "for_each", "paginate") and label in (const.IF_PRESENT, const.IF_NOT_PRESENT, *const.LOOPS): 
+            blocks.append([label, pc, None])
+        elif label == const.ELSE:
+            if not blocks or blocks[-1][0] in const.LOOPS or blocks[-1][2] is not None: 
+                raise ValueError(f"INA.compiler.link: Unbalanced Block - ELSE #{pc}")
+            blocks[-1][2] = pc
+        elif label == const.END:
+            if not blocks: raise ValueError(f"INA.compiler.link: Unbalanced Block - END #{pc}")
+            opening, start, alternative = blocks.pop()
+            if opening in const.LOOPS:
+                program[start] = replace(program[start], args=program[start].args[:-1] + (pc + 1,))
+                program[pc] = replace(program[pc], op=const.LOOPS[opening], args=(start,))
+            else:
+                skip = (pc if alternative is None else alternative) + 1
+                program[start] = replace(program[start], args=program[start].args[:2] + (skip,))
+                if alternative is not None: program[alternative] = replace(program[alternative], args=(pc + 1,))
+    
+    if blocks: raise ValueError(f"INA.compiler.link: Unbalanced Block - {blocks[-1][0].upper()} #{blocks[-1][1]} w/o END")
+    return tuple(program)
+
+def compile_task(task:models.Task)->tuple:
+    """Compile a Task object's commands into a program (i.e. a tuple of Instruction objects)
+    An optional element command is preceded by a presence branch that skips it, see const.ELEMENT_COMMANDS
+    The program is cached on the Task object until its commands are modified
+
+    Parameters
+    ----------
+    task: models.Task
+        The Task object
+
+    Returns
+    -------
+    tuple
+    """
+
+    program = []
+    for cmd in task.cmds:
+        if cmd.optional and cmd.target and cmd.label.lower() in const.ELEMENT_COMMANDS: 
+            program.append(models.Instruction("branch", (cmd.target, True, len(program) + 2), cmd))
+        program.append(compile_command(cmd, task.options))
+    
+    program = link(program)
+    task.cache(program)
+    return program
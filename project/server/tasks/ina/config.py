@@ -19,13 +19,58 @@ PATH_WEBDRIVER=os.path.join(Path(__file__).parents[0], "resources/geckodriver")
 
 # => Default(s) <=
 DEFAULT_WAIT=0.5
+DEFAULT_IDLE=500
+DEFAULT_READINESS=(const.READY_DOCUMENT, None)
 DEFAULT_TIMEOUT=5.0
+DEFAULT_BUDGET=30.0    # seconds a Task's waits draw from, see the {"budget": <SECONDS>} option, None: no deadline
+DEFAULT_REVISIT=const.REVISIT_ALWAYS
+DEFAULT_FRESHNESS=60.0  # seconds a page can be revisited for w/ {"revisit": "SKIP"}, None: forever
+DEFAULT_SCRIPT_TIMEOUT=10.0
+DEFAULT_WAIT_ENGINE=const.WAIT_OBSERVER
+DEFAULT_POLL=0.1
+DEFAULT_PRESENCE=0.2    # IF_PRESENT, IF_NOT_PRESENT & optional commands' presence check timeout
+DEFAULT_MAX_PAGES=100   # PAGINATE's page limit
+DEFAULT_ELEMENT_CACHE=32    # WebElements kept per page for input commands, 0: disabled
+DEFAULT_PIPELINE=0      # background tabs a Job prefetches the next rows' navigations in, 0: disabled (see Job)
+DEFAULT_TABS=1          # tabs a Job interleaves a usrId's rows across, per Driver (see Job.interleave), 1: disabled
+DEFAULT_WINDOW=1000     # fed entries a Job queues at a time (see Job.windows)
+
+DEFAULT_PLAN=True               # if a Job orders its queue by estimated cost, see planner.py
+DEFAULT_COST_SWAP=5.0           # seconds, estimated per usrId change
+DEFAULT_COST_ASSIGN=0.05        # seconds, estimated per Task key change
+DEFAULT_COST_NAVIGATION=1.0     # seconds, estimated per page load
+DEFAULT_COST_WAIT=DEFAULT_WAIT  # seconds, estimated per wait
+
+DEFAULT_ADAPTIVE=True
+DEFAULT_HISTORY_BUCKETS=(25, 50, 100, 200, 400, 800, 1600, 3200, 6400)   # milliseconds
+DEFAULT_HISTORY_SAMPLES=20
+DEFAULT_HISTORY_MARGIN=1.5
+DEFAULT_HISTORY_FLOOR=0.25
+DEFAULT_HISTORY_CEILING=DEFAULT_SCRIPT_TIMEOUT - 1.0  # seconds, i.e. an in-page wait ends before its script times out
+DEFAULT_HISTORY_TTL=60.0
+DEFAULT_HISTORY_MISS_RATE=0.05
+
+DEFAULT_CHECKPOINT=True         # if session checkpoints are kept in-process by default, see session.py
+DEFAULT_CHECKPOINT_TTL=1800.0   # seconds
+DEFAULT_CHECKPOINT_PROBE=1.0    # seconds a checkpoint's probe is waited for
 DEFAULT_FORMAT=(
     "${usrId}," +       # user ID
     "${0}," +           # env, name
     "${" + const.LAST + "}"   # order ID, [Optionally] memos
 )
 
+DEFAULT_TEMPLATE_CACHE=1024
+
+DEFAULT_POOL_SIZE=1
+DEFAULT_POOL_RECYCLE=100
+DEFAULT_POOL_AFFINITY=True      # if a released Driver keeps its user's session until leased to another user, see Pool.acquire
+
+DEFAULT_LITE_POOL=10
+DEFAULT_LITE_HEADERS={
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+}
+
 DEFAULT_SMTP_SERVER="127.0.0.1"
 DEFAULT_SMTP_PORT=25
 DEFAULT_SENDER_EMAIL="support@nauto.com"
\ No newline at end of file
@@ -14,16 +14,291 @@ RE_POSITIONAL=re.compile(r"(\$\{.*?\})")
 
 # => Keyword(s) <=
 SNAPV="SNAPSHOTS"
+FAILV="FAILURE"
+RECORDV="RECORD"
+BLANK="about:blank"
+SCRUB_PATH="/robots.txt"    # a light page of any origin, i.e. w/o scripts, see Driver.scrub
 
 ARGV="@"
 ELUTV="@#"
 FINDV="@"
 LAST="-1"
 
+# => Script(s) <=
+JS_CLEAR_STORAGE="window.localStorage.clear(); window.sessionStorage.clear();"
+# => { local: {key: value}, session: {key: value} }
+JS_DUMP_STORAGE="""
+function dump(storage) {
+    var res = {};
+    for (var i = 0; i < storage.length; i++) { var key = storage.key(i); res[key] = storage.getItem(key); }
+    return res;
+}
+return { local: dump(window.localStorage), session: dump(window.sessionStorage) };
+"""
+# arguments: local {key: value}, session {key: value}
+JS_LOAD_STORAGE="""
+var local = arguments[0] || {}, session = arguments[1] || {};
+window.localStorage.clear(); window.sessionStorage.clear();
+Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+"""
+JS_OPEN_TAB="window.open(arguments[0], '_blank');"    # a background tab, the WebDriver stays on the current one
+# arguments: url => returns right away, the page being left is flagged (see JS_READY)
+JS_NAVIGATE="window.__inaLeaving = true; var url = arguments[0]; setTimeout(function () { window.location.href = url; }, 0);"
+
+# arguments: [xpaths], timeout (ms), callback => { xpath: [texts] } once every XPATH matches or on timeout
+JS_FIND_TEXTS="""
+var xpaths = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now();
+function texts(xpath) {
+    var snapshot, result = [];
+    try { snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null); }
+    catch (e) { return result; }
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var node = snapshot.snapshotItem(i);
+        var text = node.innerText !== undefined ? node.innerText : node.textContent;
+        result.push((text || "").trim());
+    }
+    return result;
+}
+(function poll() {
+    var found = {}, missing = false;
+    for (var i = 0; i < xpaths.length; i++) {
+        found[xpaths[i]] = texts(xpaths[i]);
+        if (!found[xpaths[i]].length) missing = true;
+    }
+    if (!missing || Date.now() - start >= timeout) done(found);
+    else setTimeout(poll, 50);
+})();
+"""
+
+# arguments: [[name, kind, selector]], scope (XPATH or null), timeout (ms), callback => { name: [texts] } once every field matches or on timeout
+# kind: "XPATH" or "CSS", both evaluated relative to the scope element (i.e. the current FOR_EACH item) if any
+JS_EXTRACT="""
+var fields = arguments[0], scope = arguments[1], timeout = arguments[2], done = arguments[arguments.length - 1];
+var start = Date.now();
+function text(node) {
+    var text = node.innerText !== undefined ? node.innerText : node.textContent;
+    return (text || "").trim();
+}
+function root() {
+    if (!scope) return document;
+    try { return document.evaluate(scope, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue; }
+    catch (e) { return null; }
+}
+function texts(context, kind, selector) {
+    var result = [];
+    if (!context) return result;
+    try {
+        if (kind === "CSS") {
+            var nodes = context.querySelectorAll(selector);
+            for (var i = 0; i < nodes.length; i++) result.push(text(nodes[i]));
+        } else {
+            var snapshot = document.evaluate(selector, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snapshot.snapshotLength; i++) result.push(text(snapshot.snapshotItem(i)));
+        }
+    } catch (e) {}
+    return result;
+}
+(function poll() {
+    var context = root(), found = {}, missing = false;
+    for (var i = 0; i < fields.length; i++) {
+        found[fields[i][0]] = texts(context, fields[i][1], fields[i][2]);
+        if (!found[fields[i][0]].length) missing = true;
+    }
+    if (!missing || Date.now() - start >= timeout) done(found);
+    else setTimeout(poll, 50);
+})();
+"""
+
+# arguments: mode, value, timeout (ms), callback => true once the page is ready, false on timeout
+JS_READY="""
+var mode = arguments[0], value = arguments[1], timeout = arguments[2], done = arguments[arguments.length - 1];
+var start = Date.now(), quiet = Date.now(), last = -1;
+if (window.__inaPending === undefined) {
+    window.__inaPending = 0;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__inaPending++;
+        this.addEventListener("loadend", function () { window.__inaPending--; });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            window.__inaPending++;
+            return fetch.apply(this, arguments).then(
+                function (response) { window.__inaPending--; return response; },
+                function (error) { window.__inaPending--; throw error; });
+        };
+    }
+}
+function ready() {
+    if (window.__inaLeaving || document.readyState !== "complete") return false;
+    if (mode === "ELEMENT") {
+        try { return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null; }
+        catch (e) { return false; }
+    }
+    if (mode === "NETWORK_IDLE") {
+        var count = performance.getEntriesByType("resource").length;
+        if (count !== last || window.__inaPending > 0) { last = count; quiet = Date.now(); return false; }
+        return Date.now() - quiet >= value;
+    }
+    return true;
+}
+(function poll() {
+    if (ready()) done(true);
+    else if (Date.now() - start >= timeout) done(false);
+    else setTimeout(poll, 25);
+})();
+"""
+
+# arguments: name, until (bool), target (XPATH, WebElement or string), value, timeout (ms), interval (ms), callback
+# => { ok: bool, value: element(s) | null }, re-checked on every DOM mutation & every <interval> (i.e. non-DOM changes)
+JS_WAIT="""
+var name = arguments[0], until = arguments[1], target = arguments[2], value = arguments[3];
+var timeout = arguments[4], interval = arguments[5], done = arguments[arguments.length - 1];
+var start = Date.now(), finished = false, observer = null, timer = null;
+function nodes() {
+    if (typeof target !== "string") return target ? [target] : [];
+    var snapshot, result = [];
+    try { snapshot = document.evaluate(target, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null); }
+    catch (e) { return result; }
+    for (var i = 0; i < snapshot.snapshotLength; i++) result.push(snapshot.snapshotItem(i));
+    return result;
+}
+function visible(node) {
+    if (!node.isConnected || !(node.offsetWidth || node.offsetHeight || node.getClientRects().length)) return false;
+    var style = window.getComputedStyle(node);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+function selected(node) { return !!(node.selected || node.checked); }
+function text(node) { return (node.innerText !== undefined ? node.innerText : node.textContent) || ""; }
+var conditions = {
+    ELEMENT_LOCATED_SELECTION_STATE_TO_BE: function (ns) { return ns.length > 0 && selected(ns[0]) === !!value; },
+    ELEMENT_LOCATED_TO_BE_SELECTED: function (ns) { return ns.length > 0 && selected(ns[0]); },
+    ELEMENT_TO_BE_CLICKABLE: function (ns) { return ns.length > 0 && visible(ns[0]) && !ns[0].disabled ? ns[0] : false; },
+    ELEMENT_TO_BE_SELECTED: function (ns) { return ns.length > 0 && selected(ns[0]); },
+    INVISIBILITY_OF_ELEMENT: function (ns) { return !ns.length || !visible(ns[0]); },
+    INVISIBILITY_OF_ELEMENT_LOCATED: function (ns) { return !ns.length || !visible(ns[0]); },
+    PRESENCE_OF_ALL_ELEMENTS_LOCATED: function (ns) { return ns.length ? ns : false; },
+    PRESENCE_OF_ELEMENT_LOCATED: function (ns) { return ns.length ? ns[0] : false; },
+    STALENESS_OF: function (ns) { return !ns.length || !ns[0].isConnected; },
+    TEXT_TO_BE_PRESENT_IN_ELEMENT: function (ns) { return ns.length > 0 && text(ns[0]).indexOf(value) >= 0; },
+    TEXT_TO_BE_PRESENT_IN_ELEMENT_VALUE: function (ns) { return ns.length > 0 && (ns[0].value || "").indexOf(value) >= 0; },
+    TITLE_CONTAINS: function () { return document.title.indexOf(target) >= 0; },
+    TITLE_IS: function () { return document.title === target; },
+    URL_CHANGES: function () { return window.location.href !== target; },
+    URL_CONTAINS: function () { return window.location.href.indexOf(target) >= 0; },
+    URL_MATCHES: function () { return new RegExp(target).test(window.location.href); },
+    URL_TO_BE: function () { return window.location.href === target; },
+    VISIBILITY_OF: function (ns) { return ns.length > 0 && visible(ns[0]) ? ns[0] : false; },
+    VISIBILITY_OF_ALL_ELEMENTS_LOCATED: function (ns) {
+        for (var i = 0; i < ns.length; i++) if (!visible(ns[i])) return false;
+        return ns.length ? ns : false;
+    },
+    VISIBILITY_OF_ANY_ELEMENTS_LOCATED: function (ns) {
+        var result = ns.filter(visible);
+        return result.length ? result : false;
+    },
+    VISIBILITY_OF_ELEMENT_LOCATED: function (ns) { return ns.length > 0 && visible(ns[0]) ? ns[0] : false; }
+};
+function check() {
+    if (finished) return true;
+    var result;
+    try { result = conditions[name](nodes()); }
+    catch (e) { result = false; }
+    var ok = until ? !!result : !result;
+    if (!ok && Date.now() - start < timeout) return false;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done({ok: ok, value: ok && until && result !== true ? result : null});
+    return true;
+}
+if (!check()) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    (function tick() { if (!check()) timer = setTimeout(tick, interval); })();
+}
+"""
+
+# => Navigation Readiness <=
+READY_DOCUMENT="DOCUMENT"
+READY_NETWORK_IDLE="NETWORK_IDLE"
+READY_ELEMENT="ELEMENT"
+READY_PAUSE="PAUSE"
+READY_NONE="NONE"
+
+# => Journal Option(s) <=
+OPTION_PAUSE="pause"
+PAUSE_BOUND="BOUND"
+OPTION_ENGINE="engine"
+ENGINE_LITE="LITE"
+ENGINE_BROWSER="BROWSER"
+OPTION_OPTIMIZE="optimize"
+OPTION_FAIL_FAST="fail_fast"
+OPTION_BUDGET="budget"
+OPTION_REVISIT="revisit"
+REVISIT_ALWAYS="ALWAYS"
+REVISIT_SKIP="SKIP"
+OPTION_FRESHNESS="freshness"
+OPTION_CHECKPOINT="checkpoint"  # true or {"probe": <XPATH>, "ttl": <SECONDS>}, see Driver.resume
+CHECKPOINT_PROBE="probe"
+CHECKPOINT_TTL="ttl"
+
+# => Lite Engine <=
+# Commands a LiteDriver can run (i.e. w/o a browser), PAUSE is a no-op
+LITE_COMMANDS=(
+    "GET", "DGET", "PRINTF", "EMIT", "SNAP", "PAUSE", 
+    "IF_PRESENT", "IF_NOT_PRESENT", "ELSE", "FOR_EACH", "PAGINATE", "END", "EXTRACT")
+
+# => Control Flow <=
+# Blocks: IF_PRESENT|IF_NOT_PRESENT <XPATH> ... [ELSE ...] END, compiled to jumps (see compiler.link)
+# Loops: FOR_EACH <XPATH> ... END & PAGINATE <NEXT XPATH> ... END, each iteration is a row (i.e. an output line)
+IF_PRESENT="if_present"
+IF_NOT_PRESENT="if_not_present"
+ELSE="else"
+FOR_EACH="for_each"
+PAGINATE="paginate"
+END="end"
+LOOPS={FOR_EACH: "next", PAGINATE: "turn"}   # a loop's END handler
+# Commands whose target is an element's XPATH, i.e. an optional one is skipped when the element is absent
+ELEMENT_COMMANDS=(
+    "click", "click_and_hold", "release", "context_click", "double_click", 
+    "drag_and_drop", "drag_and_drop_by_offset", "move_to_element", "move_to_element_with_offset", 
+    "send_keys", "dsend_keys")
+
+# => Extract Field(s) <=
+# {<FIELD>: <SELECTOR>}, a selector is an XPATH by default, prefixed w/ "css:" a CSS selector,
+# prefixed w/ "@" all matches (a list) instead of the first one (a string, None if absent)
+FIELD_XPATH="XPATH"
+FIELD_CSS="CSS"
+FIELD_CSS_PREFIX="css:"
+
 # => Wait Operation <=
 UNTIL="UNTIL"
 UNTIL_NOT="UNTIL_NOT"
 
+# => Metric(s) <=
+METRIC_SAVED_ROUND_TRIPS="saved_round_trips"    # element look-ups served w/o a presence wait
+METRIC_FAILURES="failures"                      # Tasks aborted, see Driver.exec
+METRIC_FUSED_ACTIONS="fused_actions"            # input round trips saved by fusing action chains, see Driver.commit
+METRIC_SKIPPED_NAVIGATIONS="skipped_navigations" # GETs & DGETs of the current, untouched page, see Driver.revisit
+METRIC_ELEMENT_CACHE_HITS="element_cache_hits"  # input commands' element look-ups served by the element cache, see Driver.cached
+METRIC_ELEMENT_CACHE_MISSES="element_cache_misses"
+METRIC_STALE_ELEMENTS="stale_elements"          # action chains re-found after a StaleElementReferenceException, see Driver.commit
+METRIC_PREFETCHED="prefetched_navigations"      # GETs & DGETs served by a tab opened while the previous row ran, see Driver.prefetch
+METRIC_PREFETCH_WASTED="wasted_prefetches"      # prefetched tabs closed unused
+METRIC_INTERLEAVED="interleaved_navigations"    # GETs & DGETs left loading while another tab's row ran, see Driver.execution
+METRIC_RESTORED_SESSIONS="restored_sessions"    # Tasks (e.g. SWAP USER) skipped by restoring a session checkpoint, see Driver.resume
+METRIC_STALE_SESSIONS="stale_sessions"          # session checkpoints that failed their probe, i.e. the Task ran in full
+METRIC_WARM_SESSIONS="warm_sessions"            # SWAP USERs skipped as the leased Driver was still logged in as their user, see Job.run
+
+# => Wait Engine <=
+WAIT_OBSERVER="OBSERVER"    # in-page MutationObserver, one round trip
+WAIT_POLL="POLL"            # WebDriverWait polling, one round trip per poll
+
 # => Expected Condition(s) <=
 EXPECTED_CONDITIONS={
     "ELEMENT_LOCATED_SELECTION_STATE_TO_BE": (EC.element_located_selection_state_to_be, "LOCATOR"),
@@ -52,9 +327,18 @@ EXPECTED_CONDITIONS={
     "VISIBILITY_OF_ELEMENT_LOCATED": (EC.visibility_of_element_located, "LOCATOR")
 }
 
+CONDITION_NAMES={condition: name for name, (condition, kind) in EXPECTED_CONDITIONS.items()}
+
+# Expected conditions evaluable in-page by JS_WAIT, keyed by condition (i.e. the remainder need the WebDriver, e.g. windows & frames)
+OBSERVABLE_CONDITIONS={
+    condition: name for name, (condition, kind) in EXPECTED_CONDITIONS.items()
+    if name not in ("FRAME_TO_BE_AVAILABLE_AND_SWITCH_TO_IT", "NEW_WINDOW_IS_OPENED", "NUMBER_OF_WINDOWS_TO_BE")
+}
+
 # => Key Logic <=
 KEY_UP="KEY_UP"
 KEY_DOWN="KEY_DOWN"
+W3C_PAUSE={"type": "pause", "duration": 0}     # a pointer's no-op, i.e. what keeps it in step w/ every key interaction
 
 # => Special Key Character(s) <=
 KEYS={
@@ -6,16 +6,23 @@ from . import utils
 from . import const
 from . import config
 from . import models
+from . import compiler
+from . import formatter
+from . import history
+from . import session
 
 # => System <=
 import re
 import json
+import time
+from collections import Counter, OrderedDict
 
 # => External <=
 from selenium import webdriver
 from selenium.common import exceptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 
 # === Object Definition ===
@@ -26,6 +33,17 @@ class Driver(object):
     The Task Executor
     """
 
+    # input handlers, i.e. queued on a single action chain while they run back-to-back (see 'queue')
+    INPUTS = frozenset((
+        "click", "click_and_hold", "release", "context_click", "double_click", 
+        "drag_and_drop", "drag_and_drop_by_offset", "move_to_element", "move_to_element_with_offset", "move_by_offset",
+        "send_keys", "send_key_actions"))     # DSEND_KEYS is left out: it reads the page, i.e. the pending chain is performed first
+
+    # a Task execution's state, i.e. saved & restored per tab while interleaving rows (see 'save')
+    STATE = (
+        "task", "program", "lut", "results", "rows", "loops", "scope", "pc", "deadline", "failure", "failed", "step", "found",
+        "chain", "chained", "steps", "chain_size", "chain_critical", "fusing", "visited", "elements", "metrics")
+
     def __init__(self, uid:str, browser:str=None):
         self.uid = uid
         self.log = utils.get_logger(f"INA.Driver.{self.uid}")
@@ -34,9 +52,26 @@ class Driver(object):
             self.driver = self.chromedriver()
         else:
             self.driver = self.geckodriver()
+        self.driver.set_script_timeout(config.DEFAULT_SCRIPT_TIMEOUT)
+        self.found = {}
+        self.metrics = Counter()
+        self.failure = None
+        self.failed = False     # if any command of the executing Task failed, see 'checkpoint'
+        self.landing = None     # the (URL, readiness) of a GET or DGET left loading while interleaving, see 'execution'
+        self.step = None        # the executing command's (handler, args, critical), see 'queue'
+        self.fusing = False     # if input commands are fused into a single action chain, i.e. while a Task executes
+        self.deadline = None
+        self.visited = None     # (URL, landed URL, monotonic time) of the current page, see 'revisit'
+        self.elements = OrderedDict()   # the current page's WebElements, keyed by XPATH, least recently used first, see 'cached'
+        self.tabs = OrderedDict()       # background tabs' window handles, keyed by their prefetched URL, see 'prefetch'
+        self.handle = None              # the current tab's window handle, once a tab is opened
+        self.interleaving = False       # if GETs & DGETs return right away, the execution yields until they land (see 'execution')
+        self.opened = []                # the tabs' window handles, the first tab first, see 'windows'
+        self.origins = set()            # the origins navigated to, see 'scrub'
+        self.user = None                # the usrId whose session the browser holds, see Job.run & Pool.acquire
 
     def __del__(self):
-        self.driver.quit()
+        self.quit()
 
     def __enter__(self):
         return self
@@ -95,13 +130,37 @@ class Driver(object):
     # === Setter(s) ===
     def assign(self, task:models.Task):
         """Assign the Task object to this driver
+        Its compiled program is bound to this driver's handlers
 
         """
 
         self.reset()
         self.task = task
+        self.program = self.bind(task.program or compiler.compile_task(task))
         self.log.debug(f"assigned: {self.task}")
 
+    def bind(self, program:tuple)->tuple:
+        """Bind a compiled program to this driver's handlers
+
+        Parameters
+        ----------
+        program: tuple
+            A tuple of Instruction objects
+
+        Returns
+        -------
+        tuple: A tuple of (handler, args, critical)
+        """
+
+        bound = []
+        for instr in program:
+            handler = getattr(self, instr.op, None)
+            if handler: bound.append((handler, instr.args, instr.critical))
+            else: 
+                self.log.error(f"bind: Attribute Error - Unknown Command '{instr.cmd.label}' - {self.task}")
+                bound.append((self.nop, (), False))     # kept, so jump targets stay aligned
+        return tuple(bound)
+
     def reset(self):
         """Reset state information
 
@@ -109,10 +168,104 @@ class Driver(object):
 
         self.lut = {}
         self.results = {}
+        self.rows = []      # a results snapshot per FOR_EACH & PAGINATE iteration
+        self.loops = []     # the active loops, innermost last
+        self.scope = None   # the current FOR_EACH item, i.e. what './' XPATHs are relative to
+        self.chain = None   # the pending action chain, see 'queue'
+        self.discard()
     
+    def scrub(self):
+        """Scrub browser state (i.e. windows, storage & cookies) so the instance can be re-used
+        Storage & cookies are cleared for every origin navigated to (see 'get') & the current page's:
+        over CDP if available (i.e. Chrome), otherwise by loading a light page of each (see const.SCRUB_PATH),
+        as WebDriver only clears the current document's
+
+        """
+
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.tabs.clear(); self.opened = []; self.handle = None
+
+        try: self.origins.add(utils.origin(self.driver.current_url))
+        except exceptions.WebDriverException: pass
+        self.origins.discard(None)
+
+        try: self.driver.execute_script(const.JS_CLEAR_STORAGE)
+        except exceptions.WebDriverException: pass
+        self.driver.delete_all_cookies()
+
+        cdp = hasattr(self.driver, "execute_cdp_cmd")
+        for origin in sorted(self.origins):
+            try:
+                if cdp:
+                    self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                    continue
+
+                self.driver.get(origin + const.SCRUB_PATH)
+                self.driver.execute_script(const.JS_CLEAR_STORAGE)
+                self.driver.delete_all_cookies()
+            except exceptions.WebDriverException:
+                self.log.error(f"scrub: WebDriver Exception - {origin}")
+        self.origins.clear()
+        self.user = None
+
+        if cdp:
+            try: self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except exceptions.WebDriverException: pass
+        
+        self.driver.get(const.BLANK)
+        self.visited = None
+        self.invalidate()
+        self.reset()
+        if hasattr(self, "task"): del self.task
+        self.log.debug("scrubbed")
+
+    def quit(self):
+        """Quit the Selenium WebDriver instance
+
+        """
+
+        if getattr(self, "driver", None):
+            self.driver.quit()
+            self.driver = None
+
+    def save(self)->dict:
+        """Save the state of the current Task execution, see 'restore'
+
+        Returns
+        -------
+        dict
+        """
+
+        return {name: getattr(self, name, None) for name in self.STATE}
+
+    def restore(self, state:dict):
+        """Restore the state of a Task execution, see 'save'
+
+        Parameters
+        ----------
+        state: dict
+            A saved state
+        """
+
+        for name, value in state.items(): setattr(self, name, value)
+
+    def switch(self, handle:str):
+        """Switch to the tab of <handle>, unless it is the current one
+
+        """
+
+        if handle != self.handle: self.driver.switch_to.window(handle)
+        self.handle = handle
+
     # === Functional ===
     def exec(self, lut:dict=None)->dict:
-        """Execute (i.e. run) the Task object
+        """Execute (i.e. run) the Task object, i.e. its program from its first instruction (see 'branch' & 'jump')
+        The Task is aborted if a critical command fails or if its deadline budget runs out,
+        in which case the last result is the failure status, i.e. "FAILURE: <REASON>"
         
         Parameters
         ----------
@@ -124,11 +277,201 @@ class Driver(object):
         dict: An internal look-up table
         """
 
-        self.lut = lut
-        for cmd in self.task.cmds: 
-            try: getattr(self, cmd.label.lower())(target=cmd.target, argv=cmd.argv)
-            except Exception: pass
+        for _ in self.execution(lut): pass
         return self.results
+
+    def execution(self, lut:dict=None):
+        """Execute the Task object step by step, see 'exec'
+        While interleaving, it yields every time a GET or DGET is left loading (see 'get') & resumes by waiting for it to land,
+        i.e. the caller may run another tab's execution in between (see Job.interleave)
+
+        Parameters
+        ----------
+        lut: dict, optional
+            An external look-up table
+
+        Yields
+        ------
+        str: The URL being loaded
+        """
+
+        self.lut = lut
+        budget = (self.task.options or {}).get(const.OPTION_BUDGET, config.DEFAULT_BUDGET)
+        self.deadline = time.monotonic() + float(budget) if budget else None
+        self.pc = 0; self.fusing = True; self.failed = False; self.failure = None; self.landing = None
+        try:
+            if self.resume(): return
+            program = self.program; size = len(program); deadline = self.deadline
+            # failure & landing stay None, unless a command failed or left a page loading, i.e. handled off the common path
+            while self.pc < size: 
+                step = program[self.pc]
+                handler, args, critical = step
+                # the pending action chain is performed before any other command or any new element look-up
+                if self.chain is not None and not self.resolved(handler.__name__, args):
+                    if not self.commit(): break
+                    self.failure = None
+                
+                self.pc += 1    # a branch or jump handler may re-assign it
+                self.step = step
+                try: handler(*args)
+                except Exception as e: self.failure = self.failure or f"{handler.__name__}: {type(e).__name__}"
+
+                if self.failure is not None or self.landing is not None:
+                    failure, landing = self.failure, self.landing
+                    self.failure = self.landing = None
+                    if failure: self.failed = True
+                    if landing:
+                        self.metrics[const.METRIC_INTERLEAVED] += 1
+                        yield landing[0]
+                        self.land(*landing)
+                        failure = failure or self.failure
+                        self.failure = None
+
+                    if failure and critical:
+                        self.commit()
+                        self.abort(failure)
+                        break
+                # a Task whose last command ran is done, even if late
+                if deadline and self.pc < size and time.monotonic() > deadline:
+                    self.commit()
+                    self.abort(f"deadline exceeded ({budget}s)")
+                    break
+            else: 
+                if self.commit() and not self.failed: self.checkpoint()
+        finally: 
+            self.deadline = None
+            self.fusing = False
+            self.step = None
+
+    def commit(self, refind:bool=True)->bool:
+        """Perform the pending action chain, i.e. every input command queued since the last commit, in one round trip
+        If one of its elements is stale, the element cache is invalidated & the chain's commands are re-run once (see 'replay')
+        If it fails & one of its commands is critical, the Task is aborted
+
+        Parameters
+        ----------
+        refind: bool, optional
+            If a stale element is re-found
+
+        Returns
+        -------
+        bool: False if the Task is aborted
+        """
+
+        if self.chain is None: return True
+        chain, steps, size, critical = self.chain, self.steps, self.chain_size, self.chain_critical
+        self.discard()
+
+        self.failure = None
+        try: chain.perform()
+        except exceptions.StaleElementReferenceException as e:
+            self.invalidate()
+            # a cached element is never fused into a pending chain (see 'resolved'), i.e. it fails before the previous commands' actions are performed
+            if refind and steps and None not in steps: 
+                self.metrics[const.METRIC_STALE_ELEMENTS] += 1
+                return self.replay(steps, critical)
+            self.fail(f"perform: {type(e).__name__}")
+        except exceptions.WebDriverException as e: self.fail(f"perform: {type(e).__name__}")
+        if size > 1: self.metrics[const.METRIC_FUSED_ACTIONS] += size - 1
+
+        if self.failure and critical:
+            self.abort(self.failure)
+            return False
+        return True
+
+    def replay(self, steps:list, critical:bool)->bool:
+        """Re-run the input commands of an action chain w/ freshly found elements, then perform it (see 'commit')
+
+        Parameters
+        ----------
+        steps: list
+            The chain's commands, a list of (handler, args, critical)
+        critical: bool
+            If one of them is critical
+
+        Returns
+        -------
+        bool: False if the Task is aborted
+        """
+
+        self.failure = None
+        for step in steps:
+            handler, args, _ = self.step = step
+            try: handler(*args)
+            except Exception as e: self.failure = self.failure or f"{handler.__name__}: {type(e).__name__}"
+        
+        if self.failure:
+            failure = self.failure
+            self.discard()
+            if critical: 
+                self.abort(failure)
+                return False
+            self.failure = failure
+            return True
+
+        self.chain_critical = critical
+        return self.commit(refind=False)
+
+    def discard(self):
+        """Discard the pending action chain
+        
+        """
+
+        self.chain = None   # the pending action chain, see 'queue'
+        self.chained = {}   # the elements resolved by the pending action chain, keyed by XPATH
+        self.steps = []     # the (handler, args, critical) of its commands, see 'replay'
+        self.chain_size = 0
+        self.chain_critical = False
+
+    def invalidate(self):
+        """Invalidate the element cache, i.e. on navigation or on a stale element
+
+        """
+
+        self.elements.clear()
+
+    def fail(self, message:str):
+        """Log & record a command's failure, see 'exec'
+
+        Parameters
+        ----------
+        message: str
+            The failure reason
+        """
+
+        self.log.error(f"{message} - {getattr(self, 'task', None)}")
+        self.failure = message
+        self.failed = True
+
+    def abort(self, reason:str):
+        """Record the Task's failure status as its last result
+
+        Parameters
+        ----------
+        reason: str
+            The failure reason
+        """
+
+        self.results[const.FAILV] = f"{const.FAILV}: {reason}"
+        self.metrics[const.METRIC_FAILURES] += 1
+        self.log.error(f"aborted: {reason} - {getattr(self, 'task', None)}")
+
+    def budget(self, timeout:float=None)->float:
+        """Get a wait's timeout, bounded by the remaining deadline budget of the executing Task
+
+        Parameters
+        ----------
+        timeout: float, optional
+            By default: config.DEFAULT_TIMEOUT
+
+        Returns
+        -------
+        float: In seconds
+        """
+
+        timeout = config.DEFAULT_TIMEOUT if timeout is None else timeout
+        if self.deadline is None: return timeout
+        return max(0.0, min(timeout, self.deadline - time.monotonic()))
     
     # === Utility Function(s) ===
     def argv_key(self)->str:
@@ -147,6 +490,443 @@ class Driver(object):
 
     def find_element_by_xpath(self, target:str, wait:bool=True):
         """Find first element by XPATH
+        Optimistic: the element is found right away & only on a miss, waited for (i.e. the wait's element is kept)
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        wait: bool, optional
+            If a miss waits for the element's presence
+
+        Returns
+        -------
+        WebElement
+        """
+
+        target = self.scoped(target)
+        try: 
+            elem = self.driver.find_element_by_xpath(target)
+            if wait: self.metrics[const.METRIC_SAVED_ROUND_TRIPS] += 1
+            return elem
+        except exceptions.NoSuchElementException: pass
+
+        if wait:
+            elem = self.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, target))
+            if elem is True: elem = self.driver.find_element_by_xpath(target)
+            if elem: return elem
+        
+        self.fail(f"find_element_by_xpath: No Such Element Exception - '{target}'")
+        return None
+
+    def find_elements_by_xpath(self, target:str, wait:bool=True)->list:
+        """Find all elements by XPATH
+        Optimistic: the elements are found right away & only on a miss, waited for (i.e. the wait's elements are kept)
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        wait: bool, optional
+            If a miss waits for the elements' presence
+
+        Returns
+        -------
+        list: A list of Selenium WebElement(s)
+        """
+
+        target = self.scoped(target)
+        elems = self.driver.find_elements_by_xpath(target)
+        if elems:
+            if wait: self.metrics[const.METRIC_SAVED_ROUND_TRIPS] += 1
+            return elems
+
+        if wait:
+            elems = self.wait_for(const.UNTIL, EC.presence_of_all_elements_located, "LOCATOR", (By.XPATH, target))
+            if elems is True: elems = self.driver.find_elements_by_xpath(target)
+            if elems: return elems
+        
+        self.fail(f"find_elements_by_xpath: No Such Element Exception - '{target}'")
+        return []
+
+    def present(self, target:str, timeout:float=None)->bool:
+        """Check if an element is present, w/ a near-zero timeout & w/o failing the command
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        timeout: float, optional
+            By default: config.DEFAULT_PRESENCE
+
+        Returns
+        -------
+        bool
+        """
+
+        target = self.scoped(target)
+        try:
+            if self.driver.find_elements_by_xpath(target): return True
+            timeout = self.budget(config.DEFAULT_PRESENCE if timeout is None else timeout)
+            if not timeout: return False
+
+            WebDriverWait(self.driver, timeout, poll_frequency=config.DEFAULT_POLL).until(
+                EC.presence_of_element_located((By.XPATH, target)))
+            return True
+        except (exceptions.TimeoutException, exceptions.WebDriverException): return False
+
+    def element(self, target:str):
+        """Find first element by XPATH for an input command, 
+        an element already resolved by the pending action chain is re-used (see 'resolved')
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+
+        Returns
+        -------
+        WebElement
+        """
+
+        key = self.scoped(target)
+        if key in self.chained: return self.chained[key]
+
+        elem = self.cached(key)
+        if elem is None:
+            elem = self.find_element_by_xpath(target)
+            if elem is not None: self.cache(key, elem)
+        if elem is not None: self.chained[key] = elem
+        return elem
+
+    def cached(self, key:str):
+        """Get a WebElement of the current page from the element cache
+        Hits are not re-validated: a stale element fails its action chain, which is then re-found (see 'commit')
+
+        Parameters
+        ----------
+        key: str
+            An absolute XPATH value
+
+        Returns
+        -------
+        WebElement: None on a miss
+        """
+
+        if not config.DEFAULT_ELEMENT_CACHE: return None
+        elem = self.elements.get(key)
+        if elem is None: 
+            self.metrics[const.METRIC_ELEMENT_CACHE_MISSES] += 1
+            return None
+
+        self.elements.move_to_end(key)
+        self.metrics[const.METRIC_ELEMENT_CACHE_HITS] += 1
+        return elem
+
+    def cache(self, key:str, elem):
+        """Add a WebElement of the current page to the element cache, evicting the least recently used one past config.DEFAULT_ELEMENT_CACHE
+
+        """
+
+        if not config.DEFAULT_ELEMENT_CACHE: return
+        self.elements[key] = elem
+        self.elements.move_to_end(key)
+        while len(self.elements) > config.DEFAULT_ELEMENT_CACHE: self.elements.popitem(last=False)
+
+    def actions(self)->ActionChains:
+        """Get the pending action chain, i.e. a single W3C actions request performed by 'commit'
+
+        Returns
+        -------
+        ActionChains
+        """
+
+        if self.chain is None: self.chain = ActionChains(self.driver)
+        return self.chain
+
+    def queue(self, chain:ActionChains):
+        """Count an input command queued on the pending action chain
+        While a Task executes (see 'exec'), back-to-back input commands are fused, otherwise it is performed right away
+
+        Parameters
+        ----------
+        chain: ActionChains
+            The pending action chain
+        """
+
+        self.visited = None     # the page is no longer untouched
+        self.steps.append(self.step)
+        self.chain_size += 1
+        self.chain_critical = self.chain_critical or bool(self.step and self.step[2])
+        if not self.fusing: self.commit()
+
+    def resolved(self, name:str, args:tuple)->bool:
+        """Check if a handler can be fused into the pending action chain,
+        i.e. an input command whose elements (if any) the chain already resolved
+
+        Parameters
+        ----------
+        name: str
+            The handler name
+        args: tuple
+            The handler arguments
+
+        Returns
+        -------
+        bool
+        """
+
+        if name not in self.INPUTS: return False
+        if name == "drag_and_drop" and len(args) > 1 and args[1] and self.scoped(args[1][0]) not in self.chained: return False
+        return not args or not args[0] or self.scoped(args[0]) in self.chained
+
+    def checkpointing(self)->tuple:
+        """Get the session checkpoint key & settings of the executing Task, w/ the journal option
+        {"checkpoint": {"probe": <XPATH>, "ttl": <SECONDS>}}, keyed by its env & the row's usrId
+        The probe (i.e. an element only present once logged in) is required: a session is never trusted w/o it
+
+        Returns
+        -------
+        tuple: (key, settings), None if the Task is not checkpointed or session checkpoints are disabled
+        """
+
+        option = self.task.options.get(const.OPTION_CHECKPOINT) if self.task.options else None
+        if not option: return None
+        usrId = self.lut.get("usrId") if isinstance(self.lut, dict) else None
+        if not usrId or not session.installed(): return None
+        if not isinstance(option, dict) or not option.get(const.CHECKPOINT_PROBE):
+            self.log.error(f"checkpointing: Missing Probe - {self.task}")
+            return None
+        return session.Sessions.key(self.task.key.env, usrId), option
+
+    def resume(self)->bool:
+        """Restore the executing Task's session checkpoint, if any, instead of executing it (e.g. SWAP USER)
+        i.e. load its URL, restore its cookies & storage & reload, then check its probe is present & the page was not redirected
+        On failure, the checkpoint is forgotten & the session cleared, so the Task executes in full
+
+        Returns
+        -------
+        bool: True if the Task can be skipped
+        """
+
+        checkpoint = self.checkpointing()
+        if not checkpoint: return False
+        key, settings = checkpoint
+        snapshot = session.installed().get(key)
+        if not snapshot: return False
+
+        self.visited = None
+        self.invalidate()
+        self.origins.add(utils.origin(snapshot["url"]))
+        try:
+            self.driver.get(snapshot["url"])    # i.e. cookies can only be added to the current domain
+            self.driver.delete_all_cookies()
+            for cookie in snapshot["cookies"]: self.driver.add_cookie(cookie)
+            self.driver.execute_script(const.JS_LOAD_STORAGE, snapshot["local"], snapshot["session"])
+            self.driver.refresh()
+            valid = self.location() == snapshot["url"] and self.present(settings[const.CHECKPOINT_PROBE], config.DEFAULT_CHECKPOINT_PROBE)
+        except exceptions.WebDriverException: valid = False
+
+        if valid:
+            self.metrics[const.METRIC_RESTORED_SESSIONS] += 1
+            self.log.debug(f"resume: restored {key} - {self.task}")
+            return True
+
+        self.log.error(f"resume: Stale Session - {key} - {self.task}")
+        self.metrics[const.METRIC_STALE_SESSIONS] += 1
+        session.installed().forget(key)
+        try:
+            self.driver.execute_script(const.JS_CLEAR_STORAGE)
+            self.driver.delete_all_cookies()
+        except exceptions.WebDriverException: pass
+        return False
+
+    def checkpoint(self):
+        """Checkpoint the session the executing Task left, if it is checkpointed & its probe is present
+        Never called once any of its commands failed, see 'execution'
+
+        """
+
+        checkpoint = self.checkpointing()
+        if not checkpoint: return
+        key, settings = checkpoint
+
+        probe = settings[const.CHECKPOINT_PROBE]
+        try:
+            if not self.present(probe, config.DEFAULT_CHECKPOINT_PROBE): 
+                self.log.error(f"checkpoint: Probe Not Found - '{probe}' - {self.task}")
+                return
+            storage = self.driver.execute_script(const.JS_DUMP_STORAGE) or {}
+            snapshot = {"url": self.location(), "cookies": self.driver.get_cookies(), "local": storage.get("local"), "session": storage.get("session")}
+        except exceptions.WebDriverException:
+            self.log.error(f"checkpoint: WebDriver Exception - {self.task}")
+            return
+
+        if snapshot["url"]: session.installed().put(key, snapshot, settings.get(const.CHECKPOINT_TTL))
+
+    def revisit(self, target:str)->bool:
+        """Check if a navigation to <target> can be skipped, w/ the journal option {"revisit": "SKIP"}:
+        the current page is <target>, loaded within the freshness window (see config.DEFAULT_FRESHNESS) & untouched since,
+        i.e. no input command was performed on it
+
+        Parameters
+        ----------
+        target: str
+            A URL string
+
+        Returns
+        -------
+        bool
+        """
+
+        if not self.visited or not self.revisits(): return False
+
+        options = self.task.options or {}
+        url, landed, loaded = self.visited
+        freshness = options.get(const.OPTION_FRESHNESS, config.DEFAULT_FRESHNESS)
+        if url != target or (freshness is not None and time.monotonic() - loaded > float(freshness)): return False
+        return self.location() == landed
+
+    def revisits(self)->bool:
+        """Check if the Task object's pages can be revisited, i.e. w/ the journal option {"revisit": "SKIP"}
+
+        """
+
+        options = getattr(self, "task", None) and self.task.options or {}
+        return options.get(const.OPTION_REVISIT, config.DEFAULT_REVISIT) == const.REVISIT_SKIP
+
+    def prefetch(self, upcoming:list, bound:int):
+        """Open the upcoming navigations in background tabs, at most <bound> in flight, so their pages load while the current row runs
+        A later GET or DGET of a prefetched URL switches to its tab (see 'adopt'), the other tabs are closed
+
+        Parameters
+        ----------
+        upcoming: list
+            The URLs of the current & next rows' first navigation, in order, None if unknown
+        bound: int
+            The maximum number of background tabs
+        """
+
+        wanted = [url for url in upcoming[:bound + 1] if url]
+        for url in [url for url in self.tabs if url not in wanted]: self.drop(url)
+
+        try:
+            for url in wanted[1:]:
+                if len(self.tabs) >= bound: break
+                if url in self.tabs or (self.visited and self.visited[0] == url): continue
+
+                handle = self.open(url, self.tabs.values())
+                if handle is None: break
+                self.tabs[url] = handle
+        except exceptions.WebDriverException:
+            self.log.error(f"prefetch: WebDriver Exception - {getattr(self, 'task', None)}")
+
+    def windows(self, n:int)->list:
+        """Get <n> tabs' window handles, the current tab first, opening the missing ones (see Job.interleave)
+
+        Parameters
+        ----------
+        n: int
+            The number of tabs
+
+        Returns
+        -------
+        list: At most <n> window handles
+        """
+
+        if not self.opened: self.opened = [self.handle or self.driver.current_window_handle]
+        self.handle = self.handle or self.opened[0]
+        try:
+            while len(self.opened) < n:
+                handle = self.open(const.BLANK, self.opened)
+                if handle is None: break
+                self.opened.append(handle)
+        except exceptions.WebDriverException:
+            self.log.error(f"windows: WebDriver Exception - {getattr(self, 'task', None)}")
+        return self.opened[:n]
+
+    def open(self, url:str=const.BLANK, known=())->str:
+        """Open a background tab on <url>
+
+        Parameters
+        ----------
+        url: str, optional
+            A URL string
+        known: iterable, optional
+            The other window handles already opened
+
+        Returns
+        -------
+        str: The tab's window handle, None if it cannot be told apart (e.g. the page opened a popup)
+        """
+
+        if self.handle is None: self.handle = self.driver.current_window_handle
+        self.origins.add(utils.origin(url))
+        self.driver.execute_script(const.JS_OPEN_TAB, url)
+        handles = set(self.driver.window_handles) - set(known) - {self.handle}
+        if len(handles) == 1: return handles.pop()
+
+        self.log.error(f"open: Unknown Window Handles - {handles} - {getattr(self, 'task', None)}")
+        return None
+
+    def adopt(self, target:str)->bool:
+        """Switch to the tab prefetched for <target> & close the current one
+
+        Parameters
+        ----------
+        target: str
+            A URL string
+
+        Returns
+        -------
+        bool: False if there is no such tab
+        """
+
+        handle = self.tabs.pop(target, None)
+        if handle is None: return False
+
+        try:
+            self.driver.close()
+            self.driver.switch_to.window(handle)
+        except exceptions.WebDriverException:
+            self.log.error(f"adopt: WebDriver Exception - {self.task}")
+            self.handle = self.driver.window_handles[0]     # i.e. the current tab may be closed, navigate in any other
+            self.driver.switch_to.window(self.handle)
+            return False
+
+        self.handle = handle
+        self.metrics[const.METRIC_PREFETCHED] += 1
+        return True
+
+    def drop(self, target:str=None):
+        """Close the tab prefetched for <target>, by default every prefetched tab, i.e. wasted prefetches
+
+        """
+
+        for url in ([target] if target else list(self.tabs)):
+            handle = self.tabs.pop(url, None)
+            if handle is None: continue
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+                self.driver.switch_to.window(self.handle)
+            except exceptions.WebDriverException: 
+                self.log.error(f"drop: WebDriver Exception - {getattr(self, 'task', None)}")
+            self.metrics[const.METRIC_PREFETCH_WASTED] += 1
+
+    def location(self)->str:
+        """Get the current page's URL
+
+        Returns
+        -------
+        str: None if unknown
+        """
+
+        try: return self.driver.current_url
+        except exceptions.WebDriverException: return None
+
+    def scoped(self, target:str)->str:
+        """Get an XPATH relative to the current FOR_EACH item (i.e. starting w/ '.') as an absolute XPATH
 
         Parameters
         ----------
@@ -155,41 +935,47 @@ class Driver(object):
 
         Returns
         -------
-        WebElement
+        str: e.g. './span' => '(//li)[2]/span' while iterating over the 2nd '//li'
         """
 
-        if wait and self.wait(target, (const.UNTIL, "PRESENCE_OF_ELEMENT_LOCATED")):
-            elem = self.driver.find_element_by_xpath(target)
-        else:
-            elem = None
-            try: elem = self.driver.find_element_by_xpath(target)
-            except exceptions.NoSuchElementException:
-                self.log.error(f"find_element_by_xpath: No Such Element Exception - {self.task}")
-            
-        return elem
+        if self.scope and isinstance(target, str) and target.startswith("."): return self.scope + target[1:]
+        return target
 
-    def find_elements_by_xpath(self, target:str, wait:bool=True)->list:
-        """Find all elements by XPATH
+    def count(self, target:str)->int:
+        """Count the elements found by XPATH, right away
 
         Parameters
         ----------
         target: str
-            An XPATH value
+            An absolute XPATH value
 
         Returns
         -------
-        list: A list of Selenium WebElement(s)
+        int
         """
 
-        if wait and self.wait(target, (const.UNTIL, "PRESENCE_OF_ELEMENT_LOCATED")):
-            elems = self.driver.find_elements_by_xpath(target)
-        else:
-            elems = []
-            try: elems = self.driver.find_elements_by_xpath(target)
-            except exceptions.NoSuchElementException:
-                self.log.error(f"find_elements_by_xpath: No Such Element Exception - {self.task}")
+        try: return len(self.driver.find_elements_by_xpath(target))
+        except exceptions.WebDriverException: return 0
+
+    def follow(self, target:str):
+        """Navigate to the page linked by an element, i.e. PAGINATE's next page
+        Its 'href' is fetched (see 'get'), otherwise it is clicked
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        """
 
-        return elems
+        elem = self.find_element_by_xpath(target, wait=False)
+        if elem is None: return
+        href = elem.get_attribute("href")
+        if href: self.get(href)
+        else:
+            self.visited = None
+            self.invalidate()
+            ActionChains(self.driver).click(elem).perform()
+            if not self.ready(*config.DEFAULT_READINESS): self.fail(f"follow: Timeout Exception - Page Not Ready")
 
     def find(self, target:str)->str:
         """Find first element by XPATH & get its text value
@@ -204,11 +990,9 @@ class Driver(object):
         str
         """
         
-        res = "N/F"
-        elem = self.find_element_by_xpath(target)
-        if elem: res = elem.text
-        
-        return res
+        texts = self.texts(target)
+        if texts: return texts[0]
+        else: return "N/F"
 
     def find_all(self, target:str)->str:
         """Find all elements by XPATH & get their text values
@@ -223,14 +1007,70 @@ class Driver(object):
         str: A semicolon separated string of WebElement.text
         """
 
-        lst = []
-        elems = self.find_elements_by_xpath(target)
-        for elem in elems:
-            if elem: lst.append(elem.text)
-        
-        if lst: return "; ".join(lst)
+        texts = self.texts(target)
+        if texts: return "; ".join(texts)
         else: return "N/F"
 
+    def texts(self, target:str)->list:
+        """Get the text values of all elements found by XPATH
+        Served from the batch gathered by 'scan' when available
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+
+        Returns
+        -------
+        list
+        """
+
+        if target in self.found: return self.found[target]
+        else: return self.find_texts([target]).get(target, [])
+
+    def find_texts(self, targets:list)->dict:
+        """Find all elements of every XPATH in <targets> & get their text values in a single round trip
+        Waits in-page until every XPATH matches or the timeout elapses
+
+        Parameters
+        ----------
+        targets: list
+            A list of XPATH values
+
+        Returns
+        -------
+        dict: A list of text values keyed by XPATH
+        """
+
+        try: found = self.driver.execute_async_script(const.JS_FIND_TEXTS, list(targets), int(self.budget() * 1000)) or {}
+        except exceptions.WebDriverException:
+            self.fail("find_texts: WebDriver Exception")
+            return {}
+
+        for target in targets:
+            if not found.get(target): self.log.error(f"find_texts: No Such Element Exception - '{target}' - {self.task}")
+        return found
+
+    def find_fields(self, fields:tuple)->dict:
+        """Find all elements of every field's selector & get their text values in a single round trip
+        Waits in-page until every field matches or the timeout elapses
+
+        Parameters
+        ----------
+        fields: tuple
+            A tuple of (field, kind, selector, all)
+
+        Returns
+        -------
+        dict: A list of text values keyed by field
+        """
+
+        spec = [[name, kind, selector] for name, kind, selector, _ in fields]
+        try: return self.driver.execute_async_script(const.JS_EXTRACT, spec, self.scope, int(self.budget() * 1000)) or {}
+        except exceptions.WebDriverException:
+            self.fail("find_fields: WebDriver Exception")
+            return {}
+
     def enqueue_key_action(self, ac, logic:str, keys:str, target=None):
         """Enqueue key action, however do not perform
 
@@ -263,22 +1103,53 @@ class Driver(object):
             A list of key actions
         """
 
-        ac = ActionChains(self.driver)
-        for arg in argv:
-            if isinstance(arg, list) or isinstance(arg, tuple):
-                try:
-                    logic = arg[0]
-                    keys = self.raw2keys(arg[1])
-                except IndexError: raise IndexError(f"INA.Driver.enact_keyboard_actions: IndexError '{argv}'=>{arg}")
-            else:
-                logic = "SEND"
-                keys = self.raw2keys(str(arg))
-            
-            if logic == "SEND": 
-                self.enqueue_key_action(ac, logic, keys, target)
-            else: 
-                for key in keys: self.enqueue_key_action(ac, logic, key, target)
-        ac.perform()
+        self.perform_key_actions(target, compiler.raw2actions(argv))
+
+    def perform_key_actions(self, target, actions:tuple, typing:tuple=None):
+        """Perform a series of parsed keyboard actions, queued on the pending action chain (see 'queue')
+
+        Parameters
+        ----------
+        target: WebElement, optional
+            A Selenium WebElement
+        actions: tuple
+            A tuple of (key logic, key characters)
+        typing: tuple, optional
+            Their pre-built W3C key interactions (see 'compiler.actions2typing'), appended as is to a W3C action chain
+        """
+
+        ac = self.actions()
+        if typing is not None and getattr(self.driver, "w3c", False):
+            for (logic, keys), typed in zip(actions, typing):
+                # i.e. as Selenium does, the element is clicked once before a SEND, & before every key otherwise
+                if target and logic != "SEND":
+                    for interaction in typed: 
+                        ac.click(target)
+                        self.type_keys(ac, (interaction,))
+                    continue
+                if target: ac.click(target)
+                self.type_keys(ac, typed)
+        else:
+            for logic, keys in actions:
+                if logic == "SEND": 
+                    self.enqueue_key_action(ac, logic, keys, target)
+                else: 
+                    for key in keys: self.enqueue_key_action(ac, logic, key, target)
+        self.queue(ac)
+
+    def type_keys(self, ac, typed:tuple):
+        """Append pre-built W3C key interactions to a W3C action chain, w/ the pointer pauses that keep its devices in step
+
+        Parameters
+        ----------
+        ac: ActionChains
+            A Selenium ActionChains object
+        typed: tuple
+            A tuple of Selenium TypingInteraction
+        """
+
+        ac.w3c_actions.key_action.source.actions.extend(typed)
+        ac.w3c_actions.pointer_action.source.actions.extend([const.W3C_PAUSE] * len(typed))
 
     def raw2ec(self, target:str, arg:str):
         """Parse raw strings into an expected condition
@@ -295,12 +1166,8 @@ class Driver(object):
         expected_condition
         """
 
-        if arg == "INTEGER": result = int(target)
-        elif arg == "LOCATOR": result = (By.XPATH, target)
-        elif arg == "ELEMENT": result = self.find_element_by_xpath(target)
-        else: result = target
-
-        return result
+        if arg == "ELEMENT": return self.find_element_by_xpath(target)
+        else: return compiler.raw2ec(target, arg)
 
     def raw2keys(self, target:str)->str:
         """Parse raw string into key characters
@@ -317,9 +1184,7 @@ class Driver(object):
         str
         """
 
-        for replacement in re.findall(const.RE_POSITIONAL, target):
-            target = target.replace(replacement, const.KEYS[replacement])
-        return target
+        return compiler.raw2keys(target)
 
     def peek(self, target:str)->str:
         """Peek the external look-up table.
@@ -347,6 +1212,7 @@ class Driver(object):
     
     def scan(self, target:str)->str:
         """Parse raw string into formatted string
+        Every XPATH look-up in the string is resolved in a single round trip
 
         Parameters
         ----------
@@ -358,39 +1224,237 @@ class Driver(object):
         str
         """
         
-        for placeholder in re.findall(const.RE_POSITIONAL, target):
-            value = placeholder[2:-1]
-            if value == const.ELUTV: 
-                span = []
-                for i, j in self.lut.items(): span.append(f"{i}: {j}")
-                target = target.replace(placeholder, ", ".join(span))
-            elif value == const.ARGV: target = target.replace(placeholder, ", ".join(self.results.values()))
-            elif value.isdigit(): target = target.replace(placeholder, self.results.get(placeholder, "N/A"))
-            elif value[0] == const.FINDV: target = target.replace(placeholder, self.find_all(value[1:]))
-            else: target = target.replace(placeholder, self.peek(value))
+        template = formatter.parse(target); lut = self.lut or {}
+        xpaths = [value for kind, value in template.segments if kind is formatter.FIND_ALL or (kind is formatter.LUT and not lut.get(value))]
         
-        return target
+        scoped = {xpath: self.scoped(xpath) for xpath in xpaths}
+        found = self.find_texts(list(dict.fromkeys(scoped.values()))) if xpaths else {}
+        self.found = {xpath: found.get(scoped[xpath], []) for xpath in xpaths}
+        try: return template.render(self.lookup)
+        finally: self.found = {}
+
+    def lookup(self, kind:str, value:str)->str:
+        """Look-up a Template placeholder
+
+        Parameters
+        ----------
+        kind: str
+            The formatter segment kind
+        value: str
+            The placeholder value
+
+        Returns
+        -------
+        str
+        """
+
+        if kind is formatter.LUT: return self.peek(value)
+        elif kind is formatter.INDEX: return self.results.get(value, "N/A")
+        elif kind is formatter.FIND_ALL: return self.find_all(value)
+        elif kind is formatter.ARGV: return ", ".join(utils.texts(self.results))
+        elif kind is formatter.ELUT: return ", ".join(f"{i}: {j}" for i, j in self.lut.items())
+        elif kind is formatter.LAST: return (utils.texts(self.results) or ["N/A"])[-1]
+        return "N/A"
     
     # === Command Function(s) ===
+    # => Control Flow <=
+    def branch(self, target:str, expected:bool, pc:int):
+        """Jump to <pc> unless the element's presence is <expected>, i.e. IF_PRESENT & IF_NOT_PRESENT
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        expected: bool
+            True for IF_PRESENT, False for IF_NOT_PRESENT
+        pc: int
+            The program counter of the block's ELSE or END
+        """
+
+        if self.present(target) != expected: self.pc = pc
+
+    def jump(self, pc:int):
+        """Jump to <pc>, i.e. ELSE
+
+        """
+
+        self.pc = pc
+
+    def nop(self, *args):
+        """Do nothing, i.e. END
+
+        """
+
+        pass
+
+    def for_each(self, target:str, pc:int):
+        """Enter a FOR_EACH loop over the elements found by XPATH, jump to <pc> if there is none
+        While iterating, XPATHs starting w/ '.' are relative to the current element (see 'scoped')
+
+        Parameters
+        ----------
+        target: str
+            An XPATH value
+        pc: int
+            The program counter past the loop's END
+        """
+
+        target = self.scoped(target)
+        n = self.count(target)
+        if not n: 
+            self.pc = pc
+            return
+        
+        self.enter({"target": target, "i": 1, "n": n, "start": self.pc})
+        self.scope = f"({target})[1]"
+
+    def next(self, pc:int):
+        """Next FOR_EACH iteration, i.e. its END
+
+        Parameters
+        ----------
+        pc: int
+            The program counter of the FOR_EACH
+        """
+
+        loop = self.iterate()
+        loop["i"] += 1
+        if loop["i"] > loop["n"]: return self.leave()
+
+        self.scope = f"({loop['target']})[{loop['i']}]"
+        self.pc = loop["start"]
+
+    def paginate(self, target:str, pages:int, pc:int):
+        """Enter a PAGINATE loop, i.e. its block runs on the current page & every next page linked by XPATH
+
+        Parameters
+        ----------
+        target: str
+            The next page link's XPATH value
+        pages: int
+            The maximum number of pages
+        pc: int
+            The program counter past the loop's END
+        """
+
+        self.enter({"target": target, "i": 1, "n": pages, "start": self.pc})
+
+    def turn(self, pc:int):
+        """Turn to the next page of a PAGINATE loop, i.e. its END
+        The loop is left at the last page, i.e. once the next page link is absent
+
+        Parameters
+        ----------
+        pc: int
+            The program counter of the PAGINATE
+        """
+
+        loop = self.iterate()
+        if loop["i"] >= loop["n"] or not self.present(loop["target"]): return self.leave()
+
+        loop["i"] += 1
+        self.follow(loop["target"])
+        self.pc = loop["start"]
+
+    def enter(self, loop:dict):
+        """Enter a loop: its iterations start from the current results
+
+        """
+
+        loop["outer"] = dict(self.results)
+        loop["scope"] = self.scope
+        loop["rows"] = len(self.rows)
+        self.loops.append(loop)
+
+    def iterate(self)->dict:
+        """End the current loop iteration: its results are a row, unless an inner loop already made rows
+
+        Returns
+        -------
+        dict: The current loop
+        """
+
+        loop = self.loops[-1]
+        if len(self.rows) == loop["rows"]: self.rows.append(dict(self.results))
+        self.results = dict(loop["outer"])
+        loop["rows"] = len(self.rows)
+        return loop
+
+    def leave(self):
+        """Leave the current loop
+
+        """
+
+        loop = self.loops.pop()
+        self.scope = loop["scope"]
+
     # => Page <=
     def get(self, target:str, argv:list=None):
-        """Get URL page
+        """Get URL page & wait until it is ready
 
         Parameters
         ----------
         target: str
             A URL string
+        argv: list, optional
+            The readiness [<MODE>, <VALUE>]: 
+            ["DOCUMENT"], ["NETWORK_IDLE", <MILLISECONDS>], ["ELEMENT", <XPATH>], ["PAUSE"] or ["NONE"]
+            By default: config.DEFAULT_READINESS
         """
 
+        if self.revisit(target):
+            self.metrics[const.METRIC_SKIPPED_NAVIGATIONS] += 1
+            return
+
+        self.visited = None
+        self.invalidate()
+        self.origins.add(utils.origin(target))
         try: 
-            self.driver.get(target)
-            self.pause(config.DEFAULT_WAIT)
+            if self.interleaving and not self.tabs:
+                self.driver.execute_script(const.JS_NAVIGATE, target)
+                self.landing = (target, argv)   # i.e. see 'land'
+                return
+
+            if not self.adopt(target): self.driver.get(target)
+            if not self.ready(*compiler.raw2readiness(argv)): self.fail(f"get: Timeout Exception - '{target}' is not ready")
+            elif self.revisits(): self.visited = (target, self.location(), time.monotonic())
         
         except exceptions.InvalidArgumentException:
-            self.log.error(f"get: Invalid Argument Exception - Malformed URL - '{target}' is not a valid URL - {self.task}")
+            self.fail(f"get: Invalid Argument Exception - Malformed URL - '{target}' is not a valid URL")
 
         except exceptions.WebDriverException:
-            self.log.error(f"get: WebDriver Exception - Reached Error Page - {self.task}")
+            self.fail("get: WebDriver Exception - Reached Error Page")
+
+    def land(self, target:str, argv:list=None):
+        """Wait until a GET or DGET left loading while interleaving lands (see 'execution'), i.e. the new page is ready
+        The readiness script is re-run until it runs on the new page; "NONE" & "PAUSE" wait for the document first,
+        like a blocking GET
+
+        Parameters
+        ----------
+        target: str
+            A URL string
+        argv: list, optional
+            The readiness [<MODE>, <VALUE>], see 'get'
+        """
+
+        mode, value = compiler.raw2readiness(argv)
+        end = time.monotonic() + self.budget()
+        while True:
+            try: 
+                res = self.driver.execute_async_script(const.JS_READY, const.READY_DOCUMENT if mode in (const.READY_NONE, const.READY_PAUSE) else mode, 
+                    value, int(max(end - time.monotonic(), 0) * 1000))
+                break
+            except exceptions.WebDriverException:
+                # i.e. the script ran on the page being left
+                if time.monotonic() >= end: 
+                    res = False
+                    break
+                time.sleep(config.DEFAULT_POLL)
+
+        if not res: return self.fail(f"get: Timeout Exception - '{target}' is not ready")
+        if mode == const.READY_PAUSE: self.pause(config.DEFAULT_WAIT)
+        if self.revisits(): self.visited = (target, self.location(), time.monotonic())
 
     def dget(self, target:str, argv:list=None):
         """Dynamic get
@@ -400,9 +1464,42 @@ class Driver(object):
         ----------
         target: str
             The string format
+        argv: list, optional
+            The readiness [<MODE>, <VALUE>], see 'get'
+        """
+
+        self.get(self.scan(target), argv)
+
+    def ready(self, mode:str, value=None, timeout:float=None)->bool:
+        """Wait in-page until the current page is ready
+
+        Parameters
+        ----------
+        mode: str
+            Either 'DOCUMENT', 'NETWORK_IDLE', 'ELEMENT', 'PAUSE' or 'NONE'
+        value: object, optional
+            The idle milliseconds for 'NETWORK_IDLE' or the XPATH for 'ELEMENT'
+        timeout: float, optional
+            By default: config.DEFAULT_TIMEOUT, bounded by the Task's deadline budget
+
+        Returns
+        -------
+        bool: False on timeout
         """
 
-        self.get(self.scan(target))
+        if mode == const.READY_NONE: return True
+        if mode == const.READY_PAUSE:
+            self.pause(config.DEFAULT_WAIT)
+            return True
+
+        timeout = self.budget(timeout)
+        try: res = self.driver.execute_async_script(const.JS_READY, mode, value, int(timeout * 1000))
+        except exceptions.WebDriverException:
+            self.log.error(f"ready: WebDriver Exception - {self.task}")
+            return False
+
+        if not res: self.log.error(f"ready: Timeout Exception - {mode} - {self.task}")
+        return bool(res)
 
     def snap(self, target:str, argv:list=None):
         """Take a snapshot of the web page source code
@@ -410,14 +1507,14 @@ class Driver(object):
         """
 
         try:
-            WebDriverWait(self.driver, timeout=config.DEFAULT_TIMEOUT).until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            WebDriverWait(self.driver, timeout=self.budget()).until(lambda driver: driver.execute_script("return document.readyState") == "complete")
             if not self.results.get(const.SNAPV):
                 self.results[const.SNAPV] = {}
                 self.results[const.SNAPV][self.driver.title] = self.driver.page_source
             else: self.results[const.SNAPV][self.driver.title] = self.driver.page_source
         
         except exceptions.TimeoutException:
-            self.log.error("snap: Timeout Exception")
+            self.fail("snap: Timeout Exception")
 
     def pause(self, target:str, argv:list=None):
         """Pause WebDriver instance
@@ -430,12 +1527,25 @@ class Driver(object):
         
         try:
             seconds = float(target)
-            ActionChains(self.driver).pause(seconds).perform()
+            self.queue(self.actions().pause(seconds))     # i.e. fused w/ the input commands that follow
 
         except ValueError:
             self.log.error(f"pause: Value Error - {self.task}")
             raise ValueError(f"INA.Driver.pause: Value Error - {target} - {self.task}")
 
+    def settle(self, target:str, argv:list=None):
+        """Pause WebDriver instance until the page is idle, at most <target> seconds
+        i.e. a bounded PAUSE, w/ the journal option {"pause": "BOUND"}
+
+        Parameters
+        ----------
+        target: str
+            A float, the maximum number of seconds to pause
+        """
+
+        seconds = float(target)
+        self.ready(const.READY_NETWORK_IDLE, config.DEFAULT_IDLE, timeout=min(seconds, config.DEFAULT_TIMEOUT))
+
     def printf(self, target:str, argv:list=None):
         """Print formatted
 
@@ -452,12 +1562,45 @@ class Driver(object):
         
         if target: self.results[key] = self.scan(target)
 
+    def extract(self, target, argv=None):
+        """Extract a record, i.e. every field of a {<FIELD>: <SELECTOR>} map, in a single round trip
+        The record is stored in the results under const.RECORDV, merged w/ the previous EXTRACTs' fields
+
+        Parameters
+        ----------
+        target: tuple
+            The fields, a tuple of (field, kind, selector, all), see compiler.raw2fields
+        """
+
+        fields = target if isinstance(target, tuple) else compiler.raw2fields(target)
+        found = self.find_fields(fields)
+
+        record = {}
+        for name, kind, selector, every in fields:
+            texts = found.get(name) or []
+            if not texts: self.log.error(f"extract: No Such Element Exception - '{name}': '{selector}' - {self.task}")
+            record[name] = texts if every else (texts[0] if texts else None)
+        self.results[const.RECORDV] = {**self.results.get(const.RECORDV, {}), **record}
+
+    def emit(self, target:str, argv:list=None):
+        """Print a constant string, i.e. a PRINTF w/o placeholders (see optimizer.emit_constants)
+
+        Parameters
+        ----------
+        target: str
+            The string
+        """
+
+        self.results[self.argv_key()] = target or ""
+
     def refresh(self, target:str=None, argv:list=None):
         """Refresh current page
 
         """
 
+        self.invalidate()
         self.driver.refresh()
+        if self.visited: self.visited = (*self.visited[:2], time.monotonic())
     
     def wait(self, target:str, argv:list)->bool:
         """Wait for expected condition
@@ -468,28 +1611,158 @@ class Driver(object):
             Either an Integer, an XPATH or a URL
         argv: [str]
             A string tuple2 containing the operation and expected condition
+            [Optionally] followed by the condition's value, e.g. the text of 'TEXT_TO_BE_PRESENT_IN_ELEMENT'
         """
 
         try:
             operation = argv[0]
             expected_condition = const.EXPECTED_CONDITIONS.get(argv[1])
 
-            if expected_condition:
-                res = self.raw2ec(target, expected_condition[1])
-                if operation == const.UNTIL_NOT: WebDriverWait(self.driver, timeout=config.DEFAULT_TIMEOUT).until_not(expected_condition[0](res))
-                else: WebDriverWait(self.driver, timeout=config.DEFAULT_TIMEOUT).until(expected_condition[0](res))
-                
-                return True
-            else:
-                self.log.error(f"wait: Value Error - {self.task}")
-                raise ValueError(f"INA.Driver.wait: Value Error - {argv[1]} - {self.task}")
-
         except IndexError:
             self.log.error(f"wait: Index Error - {self.task}")
             raise IndexError(f"INA.Driver.wait: Index Error - {argv} - {self.task}")
+
+        if expected_condition:
+            condition, kind = expected_condition
+            value = argv[2] if len(argv) > 2 else None
+            return self.wait_for(operation, condition, kind, compiler.raw2ec(target, kind), value)
+        else:
+            self.log.error(f"wait: Value Error - {self.task}")
+            raise ValueError(f"INA.Driver.wait: Value Error - {argv[1]} - {self.task}")
+
+    def wait_for(self, operation:str, condition, kind:str, arg, value=None):
+        """Wait for a pre-resolved expected condition
+        In-page (see 'observe') when the condition is observable, else by polling (see 'poll')
+        W/ a timeout learned from the wait's History, if any, & recorded to it
+
+        Parameters
+        ----------
+        operation: str
+            Either 'UNTIL' or 'UNTIL_NOT'
+        condition: func
+            A Selenium expected condition
+        kind: str
+            Either 'INTEGER', 'LOCATOR', 'ELEMENT' or 'STRING'
+        arg: object
+            The expected condition argument, an XPATH value if <kind> is 'ELEMENT'
+        value: object, optional
+            The expected condition's second argument, e.g. a text or a selection state
+
+        Returns
+        -------
+        object: The located WebElement(s) if any, else True; False on timeout
+        """
+
+        key = self.locator(operation, condition, kind, arg)
+        if kind == "ELEMENT": 
+            arg = self.find_element_by_xpath(arg)
+            if arg is None: return False
+
+        learned = history.installed() if key else None
+        timeout = self.budget(learned.timeout(key) if learned else None)
+        start = time.monotonic(); res = None
+        name = const.OBSERVABLE_CONDITIONS.get(condition)
+        if name and config.DEFAULT_WAIT_ENGINE == const.WAIT_OBSERVER:
+            res = self.observe(operation, name, arg, value, timeout)
+        if res is None: res = self.poll(operation, condition, arg, value, max(start + timeout - time.monotonic(), 0))
+
+        if learned:
+            if res is False: learned.miss(key)
+            else: learned.record(key, time.monotonic() - start)
+        return res
+
+    def locator(self, operation:str, condition, kind:str, arg)->str:
+        """Get the History key of a wait, i.e. (env, task, condition, locator)
+
+        Parameters
+        ----------
+        operation: str
+            Either 'UNTIL' or 'UNTIL_NOT'
+        condition: func
+            A Selenium expected condition
+        kind: str
+            Either 'INTEGER', 'LOCATOR', 'ELEMENT' or 'STRING'
+        arg: object
+            The expected condition argument
+
+        Returns
+        -------
+        str: None if adaptive timeouts are disabled or no Task object is assigned
+        """
+
+        if not history.installed() or not hasattr(self, "task"): return None
+
+        name = const.CONDITION_NAMES.get(condition, getattr(condition, "__name__", "CONDITION"))
+        if operation == const.UNTIL_NOT: name = f"{const.UNTIL_NOT}_{name}"
+        target = arg[1] if kind == "LOCATOR" else arg
+        return history.History.key(self.task.key.env, self.task.key.name, name, target)
+
+    def observe(self, operation:str, name:str, arg, value=None, timeout:float=None):
+        """Wait in-page for an expected condition, in a single round trip
+        The condition is re-checked on every DOM mutation & every config.DEFAULT_POLL seconds
+
+        Parameters
+        ----------
+        operation: str
+            Either 'UNTIL' or 'UNTIL_NOT'
+        name: str
+            The expected condition name, see const.OBSERVABLE_CONDITIONS
+        arg: object
+            The expected condition argument
+        value: object, optional
+            The expected condition's second argument
+        timeout: float, optional
+            By default: config.DEFAULT_TIMEOUT, bounded by the Task's deadline budget
+
+        Returns
+        -------
+        object: The located WebElement(s) if any, else True; False on timeout
+            None if the page cannot run the script (e.g. it navigated or the WebElement is stale)
+        """
+
+        timeout = self.budget() if timeout is None else timeout
+        target = arg[1] if isinstance(arg, tuple) else arg
+        try: 
+            res = self.driver.execute_async_script(const.JS_WAIT, name, operation != const.UNTIL_NOT, target, value, 
+                int(timeout * 1000), int(config.DEFAULT_POLL * 1000))
+        except exceptions.WebDriverException: return None
+        
+        if not res: return None
+        elif res.get("ok"): return res.get("value") or True
+        else:
+            self.fail(f"wait: Timeout Exception - {name}")
+            return False
+
+    def poll(self, operation:str, condition, arg, value=None, timeout:float=None):
+        """Wait for an expected condition by polling the WebDriver every config.DEFAULT_POLL seconds
+
+        Parameters
+        ----------
+        operation: str
+            Either 'UNTIL' or 'UNTIL_NOT'
+        condition: func
+            A Selenium expected condition
+        arg: object
+            The expected condition argument
+        value: object, optional
+            The expected condition's second argument
+        timeout: float, optional
+            By default: config.DEFAULT_TIMEOUT, bounded by the Task's deadline budget
+
+        Returns
+        -------
+        object: The expected condition's result, False on timeout
+        """
+
+        timeout = self.budget() if timeout is None else timeout
+        method = condition(arg) if value is None else condition(arg, value)
+        try:
+            waiter = WebDriverWait(self.driver, timeout=timeout, poll_frequency=config.DEFAULT_POLL)
+            if operation == const.UNTIL_NOT: return waiter.until_not(method) or True
+            else: return waiter.until(method)
         
         except exceptions.TimeoutException:
-            self.log.error("wait: Timeout Exception")
+            self.fail("wait: Timeout Exception")
             return False
 
     # => Mouse Cursor <=
@@ -503,9 +1776,9 @@ class Driver(object):
         """
 
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: ActionChains(self.driver).click(on_element=elem).perform()
-        else: ActionChains(self.driver).click().perform()
+            elem = self.element(target)
+            if elem: self.queue(self.actions().click(on_element=elem))
+        else: self.queue(self.actions().click())
 
     def click_and_hold(self, target:str=None, argv:list=None):
         """Click and hold a Selenium WebElement
@@ -517,9 +1790,9 @@ class Driver(object):
         """
 
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: ActionChains(self.driver).click_and_hold(on_element=elem).perform()
-        else: ActionChains(self.driver).click_and_hold().perform()
+            elem = self.element(target)
+            if elem: self.queue(self.actions().click_and_hold(on_element=elem))
+        else: self.queue(self.actions().click_and_hold())
     
     def release(self, target:str=None, argv:list=None):
         """Release mouse click
@@ -531,9 +1804,9 @@ class Driver(object):
         """
 
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: ActionChains(self.driver).release(on_element=elem).perform()
-        else: ActionChains(self.driver).release().perform()
+            elem = self.element(target)
+            if elem: self.queue(self.actions().release(on_element=elem))
+        else: self.queue(self.actions().release())
 
     def context_click(self, target:str=None, argv:list=None):
         """Context click (i.e. right-click) a Selenium WebElement
@@ -545,9 +1818,9 @@ class Driver(object):
         """
 
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: ActionChains(self.driver).context_click(on_element=elem).perform()
-        else: ActionChains(self.driver).context_click().perform()
+            elem = self.element(target)
+            if elem: self.queue(self.actions().context_click(on_element=elem))
+        else: self.queue(self.actions().context_click())
     
     def double_click(self, target:str=None, argv:list=None):
         """Double click a Selenium WebElement
@@ -559,9 +1832,9 @@ class Driver(object):
         """
 
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: ActionChains(self.driver).double_click(on_element=elem).perform()
-        else: ActionChains(self.driver).double_click().perform()
+            elem = self.element(target)
+            if elem: self.queue(self.actions().double_click(on_element=elem))
+        else: self.queue(self.actions().double_click())
     
     def drag_and_drop(self, target:str, argv:list):
         """Drag and drop from source to destination
@@ -575,9 +1848,9 @@ class Driver(object):
         """
 
         try:
-            src = self.find_element_by_xpath(target)
-            dest = self.find_element_by_xpath(argv[0])
-            if src and dest: ActionChains(self.driver).drag_and_drop(source=src, target=dest).perform()
+            src = self.element(target)
+            dest = self.element(argv[0])
+            if src and dest: self.queue(self.actions().drag_and_drop(source=src, target=dest))
             
         except IndexError:
             self.log.error(f"drag_and_drop: Index Error - {self.task}")
@@ -595,10 +1868,10 @@ class Driver(object):
         """
 
         try:
-            src = self.find_element_by_xpath(target)
+            src = self.element(target)
             xoffset = int(argv[0])
             yoffset = int(argv[1])
-            if src: ActionChains(self.driver).drag_and_drop_by_offset(source=src, xoffset=xoffset, yoffset=yoffset).perform()
+            if src: self.queue(self.actions().drag_and_drop_by_offset(source=src, xoffset=xoffset, yoffset=yoffset))
             
         except IndexError:
             self.log.error(f"drag_and_drop_by_offset: Index Error - {self.task}")
@@ -613,8 +1886,8 @@ class Driver(object):
             An XPATH value
         """
 
-        elem = self.find_element_by_xpath(target)
-        if elem: ActionChains(self.driver).move_to_element(to_element=elem).perform()
+        elem = self.element(target)
+        if elem: self.queue(self.actions().move_to_element(to_element=elem))
         
     def move_to_element_with_offset(self, target:str, argv:list):
         """Move mouse cursor to a Selenium WebElement plus offset
@@ -628,10 +1901,10 @@ class Driver(object):
         """
 
         try:
-            elem = self.find_element_by_xpath(target)
+            elem = self.element(target)
             xoffset = int(argv[0])
             yoffset = int(argv[1])
-            if elem: ActionChains(self.driver).move_to_element_with_offset(to_element=elem, xoffset=xoffset, yoffset=yoffset).perform()
+            if elem: self.queue(self.actions().move_to_element_with_offset(to_element=elem, xoffset=xoffset, yoffset=yoffset))
 
         except IndexError:
             self.log.error(f"move_to_element_with_offset: Index Error - {self.task}")
@@ -649,7 +1922,7 @@ class Driver(object):
         try:
             xoffset = int(argv[0])
             yoffset = int(argv[1])
-            ActionChains(self.driver).move_by_offset(xoffset=xoffset, yoffset=yoffset).perform()
+            self.queue(self.actions().move_by_offset(xoffset=xoffset, yoffset=yoffset))
 
         except IndexError:
             self.log.error(f"move_by_offset: Index Error - {self.task}")
@@ -669,10 +1942,25 @@ class Driver(object):
             e.g. [("KEY_DOWN", "${SHIFT}"), "uppercase", ("KEY_UP", "${SHIFT}")]
         """
 
+        self.send_key_actions(target, compiler.raw2actions(argv))
+
+    def send_key_actions(self, target:str, actions:tuple, typing:tuple=None):
+        """Send parsed keys
+
+        Parameters
+        ----------
+        target: str, optional
+            An XPATH value
+        actions: tuple
+            A tuple of (key logic, key characters)
+        typing: tuple, optional
+            Their pre-built W3C key interactions, see 'perform_key_actions'
+        """
+
         if target:
-            elem = self.find_element_by_xpath(target)
-            if elem: self.enact_keyboard_actions(elem, argv)
-        else: self.enact_keyboard_actions(None, argv)
+            elem = self.element(target)
+            if elem: self.perform_key_actions(elem, actions, typing)
+        else: self.perform_key_actions(None, actions, typing)
     
     def dsend_keys(self, target:str, argv:list):
         """Dynamic send keys
@@ -689,6 +1977,6 @@ class Driver(object):
 
         values = map(lambda arg: self.scan(arg), filter(lambda arg: isinstance(arg, str), argv))
         if target:
-            elem = self.find_element_by_xpath(target)
+            elem = self.element(target)
             if elem: self.enact_keyboard_actions(elem, values)
         else: self.enact_keyboard_actions(None, values)
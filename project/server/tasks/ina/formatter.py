@@ -0,0 +1,115 @@
+# project/server/tasks/ina/formatter.py
+
+# === Import(s) ===
+# => Local <=
+from . import const
+from . import config
+
+# => System <=
+import re
+from functools import lru_cache
+
+# === Constant(s) ===
+# => Segment Kind(s) <=
+LITERAL="LITERAL"       # plain text
+LUT="LUT"               # ${<KEY>}: a look-up table key (the Driver falls back to an XPATH find)
+INDEX="INDEX"           # ${<NUMBER>}: one Driver argument
+ARGV="ARGV"             # ${@}: all Driver arguments
+ELUT="ELUT"             # ${@#}: all Job arguments
+FIND_ALL="FIND_ALL"     # ${@<XPATH>}: all Web Element finds
+LAST="LAST"             # ${-1}: the last Driver argument
+
+# === Object Definition ===
+class Template(object):
+    """Define a Template Object
+
+    A string format parsed once into a tuple of (kind, value) segments
+    """
+
+    __slots__ = ("fmt", "segments")
+
+    def __init__(self, fmt:str, segments:tuple):
+        self.fmt = fmt
+        self.segments = segments
+
+    def __str__(self):
+        return f"INA.Template(fmt={self.fmt})"
+
+    def placeholders(self, *kinds)->list:
+        """Get the values of every placeholder segment of the given <kinds>
+
+        Returns
+        -------
+        list
+        """
+
+        return [value for kind, value in self.segments if kind in kinds]
+
+    def render(self, lookup)->str:
+        """Render the formatted string in one pass
+
+        Parameters
+        ----------
+        lookup: func
+            Called as lookup(kind, value) for each placeholder segment, returns a str
+
+        Returns
+        -------
+        str
+        """
+
+        parts = []; memo = {}
+        for segment in self.segments:
+            kind, value = segment
+            if kind is LITERAL: parts.append(value)
+            else:
+                if segment not in memo: memo[segment] = lookup(kind, value)
+                parts.append(memo[segment])
+        return "".join(parts)
+
+# === Parser(s) ===
+def classify(value:str)->str:
+    """Get the segment kind of a placeholder's inner value
+
+    Parameters
+    ----------
+    value: str
+        The placeholder value, i.e. without the enclosing '${' & '}'
+
+    Returns
+    -------
+    str
+    """
+
+    if value == const.ELUTV: return ELUT
+    elif value == const.ARGV: return ARGV
+    elif value == const.LAST: return LAST
+    elif value.isdigit(): return INDEX
+    elif value[:1] == const.FINDV: return FIND_ALL
+    else: return LUT
+
+@lru_cache(maxsize=config.DEFAULT_TEMPLATE_CACHE)
+def parse(fmt:str)->Template:
+    """Parse (i.e. compile) a string format into a Template object, cached per string
+
+    Parameters
+    ----------
+    fmt: str
+        The string format
+
+    Returns
+    -------
+    Template
+    """
+
+    segments = []
+    for i, part in enumerate(re.split(const.RE_POSITIONAL, fmt)):
+        if i % 2 == 0:
+            if part: segments.append((LITERAL, part))
+        else:
+            value = part[2:-1]
+            kind = classify(value)
+            if kind is INDEX: value = part
+            elif kind is FIND_ALL: value = value[1:]
+            segments.append((kind, value))
+    return Template(fmt, tuple(segments))
@@ -0,0 +1,241 @@
+# project/server/tasks/ina/history.py
+
+# === Import(s) ===
+# => Local <=
+from . import config
+
+# => System <=
+import time
+import bisect
+import threading
+
+# === Utility Function(s) ===
+def decode(value)->str:
+    """Decode a Redis value
+
+    """
+
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+# === Store(s) ===
+class LocalStore(object):
+    """Define a LocalStore Object
+
+    An In-Process Store of Wait Histograms, i.e. key => {field: count}
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def incr(self, key:str, field:str):
+        with self.lock:
+            counts = self.data.setdefault(key, {})
+            counts[field] = counts.get(field, 0) + 1
+
+    def counts(self, key:str)->dict:
+        with self.lock: return dict(self.data.get(key, {}))
+
+    def keys(self)->list:
+        with self.lock: return list(self.data)
+
+    def delete(self, keys:list):
+        with self.lock:
+            for key in keys: self.data.pop(key, None)
+
+class RedisStore(object):
+    """Define a RedisStore Object
+
+    A Store of Wait Histograms Shared by Every Worker, One Redis Hash per Key
+    """
+
+    def __init__(self, connection, prefix:str="ina:history:"):
+        self.connection = connection
+        self.prefix = prefix
+
+    def incr(self, key:str, field:str):
+        pipe = self.connection.pipeline()
+        pipe.hincrby(self.prefix + key, field, 1)
+        pipe.sadd(self.prefix + "keys", key)
+        pipe.execute()
+
+    def counts(self, key:str)->dict:
+        raw = self.connection.hgetall(self.prefix + key)
+        return {decode(field): int(count) for field, count in raw.items()}
+
+    def keys(self)->list:
+        return [decode(key) for key in self.connection.smembers(self.prefix + "keys")]
+
+    def delete(self, keys:list):
+        if not keys: return
+        pipe = self.connection.pipeline()
+        pipe.delete(*[self.prefix + key for key in keys])
+        pipe.srem(self.prefix + "keys", *keys)
+        pipe.execute()
+
+# === Object Definition ===
+class History(object):
+    """Define a History Object
+
+    How Long Each (env, task, condition, locator) Wait Took, as a Compact Histogram
+    i.e. a count per config.DEFAULT_HISTORY_BUCKETS bucket (in milliseconds) & a count of misses
+    Learned timeouts are p99 x margin, bounded by [floor, ceiling], once there are <samples> waits
+    """
+
+    MISS = "miss"
+
+    def __init__(self, store=None, buckets:tuple=None, margin:float=None, floor:float=None, ceiling:float=None, samples:int=None, ttl:float=None):
+        self.store = store or LocalStore()
+        self.buckets = buckets or config.DEFAULT_HISTORY_BUCKETS
+        self.margin = margin or config.DEFAULT_HISTORY_MARGIN
+        self.floor = config.DEFAULT_HISTORY_FLOOR if floor is None else floor
+        self.ceiling = ceiling or config.DEFAULT_HISTORY_CEILING
+        self.samples = samples or config.DEFAULT_HISTORY_SAMPLES
+        self.ttl = config.DEFAULT_HISTORY_TTL if ttl is None else ttl
+        self.misses = config.DEFAULT_HISTORY_MISS_RATE
+
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def __str__(self):
+        return f"INA.History(store={type(self.store).__name__})"
+
+    # === Getter(s) ===
+    @staticmethod
+    def key(env:str, name:str, condition:str, locator:str)->str:
+        """Get the History key of a wait
+
+        Returns
+        -------
+        str
+        """
+
+        return f"{env}/{name}/{condition}/{locator}"
+
+    def histogram(self, key:str)->tuple:
+        """Get the histogram of <key>
+
+        Returns
+        -------
+        tuple: (a count per bucket, the last one being the overflow, the number of misses)
+        """
+
+        counts = self.store.counts(key)
+        return [counts.get(str(i), 0) for i in range(len(self.buckets) + 1)], counts.get(self.MISS, 0)
+
+    def percentile(self, key:str, q:float)->float:
+        """Get the <q> percentile (i.e. its bucket's upper bound) of <key>'s waits
+
+        Parameters
+        ----------
+        key: str
+            The History key
+        q: float
+            The percentile, e.g. 0.99
+
+        Returns
+        -------
+        float: In seconds, None if there is no history
+        """
+
+        counts, _ = self.histogram(key)
+        total = sum(counts)
+        if not total: return None
+
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= q * total: break
+        return self.buckets[i] / 1000 if i < len(self.buckets) else self.ceiling
+
+    def timeout(self, key:str)->float:
+        """Get the learned timeout of <key>, cached for <ttl> seconds once learned
+
+        Returns
+        -------
+        float: In seconds, None if there is not enough history or too many misses
+        """
+
+        now = time.monotonic()
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached and cached[0] > now: return cached[1]
+
+        counts, misses = self.histogram(key)
+        # too many misses: the learned timeout may be too short, let the next waits re-learn w/ the default
+        if sum(counts) < self.samples or misses > sum(counts) * self.misses: timeout = None
+        else: timeout = min(self.ceiling, max(self.floor, self.percentile(key, 0.99) * self.margin))
+
+        # only learned timeouts are cached, so a key starts adapting as soon as it has enough samples
+        if timeout is not None:
+            with self.lock: self.cache[key] = (now + self.ttl, timeout)
+        return timeout
+
+    def inspect(self, prefix:str="")->dict:
+        """Get the learned values of every key starting w/ <prefix>
+
+        Returns
+        -------
+        dict: {key: {"samples", "misses", "p50", "p99", "timeout"}}
+        """
+
+        res = {}
+        for key in sorted(self.store.keys()):
+            if not key.startswith(prefix): continue
+            counts, misses = self.histogram(key)
+            res[key] = {
+                "samples": sum(counts),
+                "misses": misses,
+                "p50": self.percentile(key, 0.5),
+                "p99": self.percentile(key, 0.99),
+                "timeout": self.timeout(key)
+            }
+        return res
+
+    # === Setter(s) ===
+    def record(self, key:str, seconds:float):
+        """Record a wait that succeeded after <seconds>
+
+        """
+
+        self.store.incr(key, str(bisect.bisect_left(self.buckets, seconds * 1000)))
+
+    def miss(self, key:str):
+        """Record a wait that timed out
+
+        """
+
+        self.store.incr(key, self.MISS)
+
+    def reset(self, prefix:str=""):
+        """Forget every key starting w/ <prefix>
+
+        """
+
+        self.store.delete([key for key in self.store.keys() if key.startswith(prefix)])
+        with self.lock: self.cache.clear()
+
+# === Worker History ===
+HISTORY=History() if config.DEFAULT_ADAPTIVE else None
+
+def install(history:History):
+    """Install <history> as this process's wait History
+
+    Parameters
+    ----------
+    history: History
+        The History object, or None to disable adaptive timeouts
+    """
+
+    global HISTORY
+    HISTORY = history
+
+def installed()->History:
+    """Get this process's wait History
+
+    Returns
+    -------
+    History: None if adaptive timeouts are disabled
+    """
+
+    return HISTORY
@@ -7,15 +7,22 @@ from . import const
 from . import config
 from . import models
 from . import driver
+from . import lite
 from . import template
+from . import formatter
+from . import planner
 
 # => System <=
 import os
-import re
+import time
 import uuid
 import smtplib
 import datetime
-from collections import deque
+import threading
+from itertools import islice
+from collections import deque, Counter, OrderedDict, defaultdict
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
@@ -26,22 +33,49 @@ class Job(object):
     """ Define a Job Object
 
     A List of Task Objects Executed Linearly
+    Or, w/ <parallelism> > 1, Sharded by usrId Across Multiple Drivers
+    Extraction-only Task objects (see lite.eligible) run on a LiteDriver, w/o a browser,
+    unless another Task object of their usrId needs a browser (see 'eligible')
+    W/ <pipeline> > 0, the next rows' first navigation is prefetched in that many background tabs (see 'prefetch')
+    W/ <tabs> > 1, a usrId's rows are interleaved across that many tabs of a Driver instead (see 'interleave')
+    W/ <plan>, the queue is executed in the Planner's order & its results collected in the original order (see 'plan')
+    Entries can also be fed lazily (see 'feed'), the queue then holds up to <window> of them at a time
     """
 
-    def __init__(self, uid:str=None, browser:str=None):
+    def __init__(self, uid:str=None, browser:str=None, pool=None, parallelism:int=1, pipeline:int=None, tabs:int=None, plan:bool=None, window:int=None):
         self.id = uid or str(uuid.uuid4())
         self.log = utils.get_logger(f"INA.Job.{self.id}")
         self.dt = datetime.datetime.now()
 
         self.browser = browser
         self.driver = None
+        self.lite = None
+        self.pool = pool
+        self.parallelism = parallelism or 1
+        self.tabs = tabs or config.DEFAULT_TABS
+        self.pipeline = 0 if self.tabs > 1 else (config.DEFAULT_PIPELINE if pipeline is None else pipeline)
+        self.planner = planner.Planner() if (config.DEFAULT_PLAN if plan is None else plan) else None
         
         self.queue = deque([])
+        self.source = None
+        self.window = window or config.DEFAULT_WINDOW
         self.snaps = {}
         self.lines = []
+        self.records = []
+        self.metrics = Counter()
+        self.breakdown = defaultdict(Counter)    # metrics per Task, keyed by "<env>/<name>"
+        self.costs = {}                         # the planned order's estimated cost vs the actual one, see 'plan'
+        self.browsers = set()                   # the usrIds w/ a Task object that needs a browser, see 'eligible'
+        self.workers = {}                       # the shard workers' (Driver, LiteDriver) by number, see 'deploy_shards'
+        self.warm = set()                       # the ids of leased Drivers still logged in as their first row's user, see 'lease'
+        self.order = None                       # the original queue index per planned one, see 'plan'
+        self.placed = {}                        # traced results keyed by original queue index, see 'settle'
+        self.cursor = 0
+        self.lock = threading.Lock()
 
     def __del__(self):
         if self.driver: del self.driver
+        if self.lite: self.lite.quit()
     
     def __enter__(self):
         return self
@@ -56,8 +90,18 @@ class Job(object):
         """
 
         self.queue.clear()
+        self.source = None
         self.snaps.clear()
         self.lines.clear()
+        self.records.clear()
+        self.metrics.clear()
+        self.breakdown.clear()
+        self.costs.clear()
+        self.browsers.clear()
+        self.warm.clear()
+        self.placed.clear()
+        self.order = None
+        self.cursor = 0
 
     # === Functional ===
     def push(self, task:models.Task, fmt:str=None, elut:dict=None, trace:bool=True):
@@ -75,41 +119,491 @@ class Job(object):
             If 'lines' will be appended
         """
 
-        self.queue.append((task, fmt, elut, trace))
+        self.queue.append(self.entry(task, fmt, elut, trace))
+
+    def feed(self, entries):
+        """Enqueue new Task objects lazily, i.e. <entries> is only consumed by 'deploy', a window at a time (see 'windows')
+
+        Parameters
+        ----------
+        entries: iter
+            An iterator of queue entries, see 'entry'
+        """
+
+        self.source = entries
+
+    @staticmethod
+    def entry(task:models.Task, fmt:str=None, elut:dict=None, trace:bool=True)->models.Row:
+        """Get a queue entry, see 'push' for its parameters
+
+        Returns
+        -------
+        models.Row: Unpacked like (task, fmt, elut, trace)
+        """
+
+        return models.Row(task, fmt, elut, trace)
     
     def pop(self):
         """Dequeue (i.e. assign & exec) the oldest Task object
 
         """
         
-        task, fmt, elut, trace = self.queue.popleft()
+        entry = self.queue.popleft(); at = self.cursor; self.cursor += 1
+        row = self.run(self.driver, entry, self.lite, list(islice(self.queue, 0, self.pipeline)))
+        if row: self.collect(*row, at=at)
+    
+    def run(self, instance:driver.Driver, entry:tuple, engine:lite.LiteDriver=None, ahead:list=None)->tuple:
+        """Assign & exec a queue entry on the <instance> Driver
+        Or on the <engine> LiteDriver, if given & the Task object is eligible
+
+        Parameters
+        ----------
+        instance: driver.Driver
+            The executing Driver object
+        entry: tuple
+            A queue entry: (task, fmt, elut, trace)
+        engine: lite.LiteDriver, optional
+            The executing LiteDriver object
+        ahead: list, optional
+            The next queue entries, prefetched w/ <pipeline> > 0
+
+        Returns
+        -------
+        tuple: (lines, snaps, records) if traced, otherwise None
+            i.e. a line per FOR_EACH & PAGINATE iteration (see Driver.rows), if any, else a single line
+            & a record per line that EXTRACTed one, keyed by usrId, env, name & then its fields
+        """
+
+        task, fmt, elut, trace = entry
         if task:
-            if task.key != self.driver.taskkey(): 
-                self.driver.assign(task)
+            if engine and self.eligible(entry): instance = engine
+            elif id(instance) in self.warm:
+                # its untraced first row (i.e. a SWAP USER) is skipped, see Pool.acquire
+                self.warm.discard(id(instance))
+                if not trace and instance.user == planner.Planner.usrId(entry): 
+                    self.measure(Counter({const.METRIC_WARM_SESSIONS: 1}), task.key)
+                    return None
+            if task.key != instance.taskkey(): 
+                instance.assign(task)
             else: 
-                self.driver.reset()
-            ilut = self.driver.exec(elut)
+                instance.reset()
+            
+            before = Counter(instance.metrics)
+            if self.pipeline and instance is not engine: self.prefetch(instance, entry, ahead or [])
+            ilut = instance.exec(elut)
+            # the session the browser holds, i.e. none once an untraced row (e.g. a SWAP USER) failed
+            if instance is not engine: instance.user = None if not trace and instance.failed else planner.Planner.usrId(entry)
+            self.measure(instance.metrics - before, task.key)
+            return self.harvest(instance, entry, ilut)
+        return None
+
+    def harvest(self, instance:driver.Driver, entry:tuple, ilut:dict)->tuple:
+        """Get the traced result of a queue entry executed by <instance>, see 'run'
+
+        Returns
+        -------
+        tuple: (lines, snaps, records) if traced, otherwise None
+        """
 
-            if trace:
-                if ilut.get(const.SNAPV): self.snaps = {**self.snaps, **ilut[const.SNAPV]}
+        task, fmt, elut, trace = entry
+        if not trace: return None
+
+        fmt = fmt or config.DEFAULT_FORMAT
+        rows = list(instance.rows)
+        if not rows or const.FAILV in ilut: rows.append(ilut)
+        
+        lines = [self.task2str(fmt, elut, row) for row in rows]
+        records = [self.task2record(task, elut, row) for row in rows if row.get(const.RECORDV)]
+        return lines, ilut.get(const.SNAPV), records
+
+    def collect(self, lines:list, snaps:dict=None, records:list=None, at:int=None):
+        """Append a traced result
+
+        Parameters
+        ----------
+        lines: list
+            The formatted strings
+        snaps: dict, optional
+            The page snapshots
+        records: list, optional
+            The extracted records
+        at: int, optional
+            The queue index of its entry, if the queue was planned its result is held until 'settle'
+        """
+
+        if snaps: self.snaps = {**self.snaps, **snaps}
+        if self.order is not None and at is not None:
+            self.placed[self.order[at]] = (lines, records)
+            return
+
+        self.lines.extend(lines)
+        if records: self.records.extend(records)
+
+    def settle(self):
+        """Append the traced results held by 'collect' in their original queue order
+
+        """
+
+        order = self.order; self.order = None
+        if order is None: return
+        for idx in sorted(self.placed):
+            lines, records = self.placed[idx]
+            self.collect(lines, records=records)
+        self.placed.clear()
+
+    def plan(self):
+        """Reorder the queue by the Planner's execution order & add its estimated cost, see planner.Planner
+        A fed Job is planned a window at a time
+
+        """
+
+        entries = list(self.queue)
+        order, baseline, estimate = self.planner.plan(entries)
+        self.costs["baseline"] = self.costs.get("baseline", 0.0) + baseline
+        self.costs["estimated"] = self.costs.get("estimated", 0.0) + estimate
+        self.costs["actual"] = None
+        self.cursor = 0
+
+        if order == list(range(len(entries))): return
+        self.queue.clear()
+        self.queue.extend(entries[idx] for idx in order)
+        self.order = order
+
+    def measure(self, metrics:Counter, key:models.Key=None):
+        """Add a Driver's metrics (e.g. saved round trips, fused actions) to this Job's metrics
+
+        Parameters
+        ----------
+        metrics: Counter
+            The metrics of a single Task execution
+        key: models.Key, optional
+            The Task ID, its metrics are also broken down
+        """
+
+        with self.lock: 
+            self.metrics.update(metrics)
+            if key and metrics: self.breakdown[f"{key.env}/{key.name}"].update(metrics)
+
+    def prefetch(self, instance:driver.Driver, entry:tuple, ahead:list):
+        """Prefetch the next queue entries' first navigation in background tabs while <entry> runs (see Driver.prefetch)
+        Only the entries of the same Task object & usrId are, up to the first one that is not or cannot be (see 'task2url'),
+        i.e. nothing is prefetched while a SWAP USER runs & its tabs are closed
+
+        Parameters
+        ----------
+        instance: driver.Driver
+            The executing Driver object
+        entry: tuple
+            The current queue entry
+        ahead: list
+            The next queue entries
+        """
+
+        usrId = planner.Planner.usrId
+        upcoming = [self.task2url(entry[0], entry[2])]
+        for queued in ahead:
+            if queued[0] is not entry[0] or usrId(queued) != usrId(entry): break
+            url = self.task2url(queued[0], queued[2])
+            if not url: break
+            upcoming.append(url)
+        instance.prefetch(upcoming, self.pipeline)
+
+    def eligible(self, entry:tuple)->bool:
+        """Check if a queue entry can run on a LiteDriver, see lite.eligible
+        i.e. not if another Task object of its usrId needs a browser, the LiteDriver would lack the browser's session
+
+        Returns
+        -------
+        bool
+        """
+
+        return lite.eligible(entry[0], planner.Planner.usrId(entry) in self.browsers)
+
+    def needs_browser(self)->bool:
+        """Check if any queued Task object needs a browser (i.e. a Driver instead of a LiteDriver)
+
+        Returns
+        -------
+        bool
+        """
+
+        return any(entry[0] and not self.eligible(entry) for entry in self.queue)
+
+    def shards(self)->deque:
+        """Partition the queue into runs of the same usrId
+        i.e. a SWAP USER entry always stays w/ the entries that follow it
+
+        Returns
+        -------
+        deque: A deque list of shards, each a list of (index, entry)
+        """
+
+        shards = deque([]); prev = None
+        for idx, entry in enumerate(self.queue):
+            curr = planner.Planner.usrId(entry)
+            if not shards or curr != prev: shards.append([])
+            shards[-1].append((idx, entry))
+            prev = curr
+        return shards
+
+    @contextmanager
+    def lease(self, n:int=0, user:str=None):
+        """Lease a Driver from the Pool or, if there is none, launch one for the duration of a 'with' block
+        A leased Driver still logged in as <user> skips its first row if it is an untraced one of <user> (see 'run')
+
+        Parameters
+        ----------
+        n: int, optional
+            The shard worker number
+        user: str, optional
+            The usrId of its first row
+
+        Yields
+        ------
+        driver.Driver
+        """
+
+        if self.pool:
+            with self.pool.lease(user) as instance: 
+                if user and instance.user == user: self.warm.add(id(instance))
+                yield instance
+        else:
+            instance = driver.Driver(f"{self.id}.{n}", browser=self.browser)
+            try: yield instance
+            finally: instance.quit()
 
-                if fmt: line = self.task2str(fmt, elut, ilut)
-                else: line = self.task2str(config.DEFAULT_FORMAT, elut, ilut)
-                
-                self.lines.append(line)
-    
     def deploy(self, receipt:str=None):
         """Pop until the queue is empty and then notify the <receipt>
 
+        If a Pool is given, a Driver is leased from it instead of launched
+        If <parallelism> > 1, the queue is sharded by usrId & executed on that many Drivers, leased or launched once for all windows
+        If no Task object needs a browser, no Driver is leased nor launched
+        If a Planner is set, the queue is reordered first & 'costs' holds its estimated vs actual cost
+        If entries were fed, the above applies to each window of them (see 'windows')
+
         """
 
-        if len(self.queue) > 0:
-            if not self.driver: 
-                self.driver = driver.Driver(self.id, browser=self.browser)
+        if len(self.queue) > 0 or self.source is not None:
+            if not self.lite: self.lite = lite.LiteDriver(f"{self.id}.lite")
+            self.costs.clear(); self.browsers.clear()
+            start = time.perf_counter()
+
+            with ExitStack() as stack:
+                for _ in self.windows():
+                    if self.planner: self.plan()
+                    self.execute(stack)
+                    self.settle()
+                if self.pipeline and self.driver and not self.pool: self.driver.drop()
             
-            while len(self.queue) > 0: self.pop()
+            if self.costs: self.costs["actual"] = time.perf_counter() - start
+            self.log.info(f"metrics: {dict(self.metrics)}")
+            if self.costs: self.log.info(f"costs: {self.costs}")
+            for key, metrics in self.breakdown.items(): self.log.info(f"metrics: {key}: {dict(metrics)}")
             if receipt: self.notify(receipt)
 
+    def windows(self):
+        """Fill the queue w/ the fed entries (see 'feed'), up to <window> at a time, after whatever was pushed
+        W/ <parallelism> > 1, a usrId shard cut by a window re-runs its first entry, if untraced (e.g. SWAP USER),
+        at the start of the next one, i.e. whichever Driver runs it; a single Driver's session is still live
+
+        Yields
+        ------
+        None: Every time the queue holds the next window, it is to be emptied before resuming
+        """
+
+        source = self.source; self.source = None
+        if source is None:
+            yield
+            return
+
+        head = None; prev = object()
+        for entry in source:
+            curr = planner.Planner.usrId(entry)
+            if len(self.queue) >= self.window:
+                yield
+                if curr == prev and head is not None and self.parallelism > 1: self.queue.append(head)
+            if curr != prev: head = None if entry[3] else entry
+            prev = curr
+            self.queue.append(entry)
+        if self.queue: yield
+
+    def execute(self, stack:ExitStack):
+        """Pop until the queue is empty, see 'deploy'
+        A Driver is leased or launched once, on the first window that needs a browser
+
+        Parameters
+        ----------
+        stack: ExitStack
+            Releases a leased Driver once 'deploy' is done
+        """
+
+        users = [planner.Planner.usrId(entry) for entry in self.queue if entry[0] and not lite.eligible(entry[0])]
+        self.browsers.update(users)
+        if self.parallelism > 1:
+            self.deploy_shards(stack)
+        elif not self.needs_browser():
+            while len(self.queue) > 0: self.pop()
+        else:
+            if not self.driver:
+                if self.pool:
+                    self.driver = stack.enter_context(self.lease(user=users[0] if users else None))
+                    stack.callback(setattr, self, "driver", None)
+                else: self.driver = driver.Driver(self.id, browser=self.browser)
+            self.consume()
+
+    def consume(self):
+        """Pop until the queue is empty
+        W/ <tabs> > 1, its usrId shards are interleaved across that many tabs of the Driver (see 'interleave')
+        Traced results are collected in their original queue order
+
+        """
+
+        if self.tabs <= 1:
+            while len(self.queue) > 0: self.pop()
+            return
+
+        rows = {}
+        for shard in self.shards(): rows.update(self.interleave(self.driver, self.lite, shard))
+        self.queue.clear()
+        for idx in sorted(rows): self.collect(*rows[idx], at=idx)
+
+    def interleave(self, instance:driver.Driver, engine:lite.LiteDriver, shard:list)->dict:
+        """Execute a usrId shard across <tabs> tabs of the <instance> Driver
+        Its first entry (e.g. a SWAP USER) runs alone, then its other entries are interleaved: 
+        every time one leaves a GET or DGET loading, the next tab's entry runs (see Driver.execution),
+        i.e. page loads overlap w/ one another instead of running back-to-back
+        Each entry still has its own state (see Driver.save), each tab its own page (i.e. revisits & cached elements)
+        An entry that does not start w/ such a navigation (see 'task2url') depends on the page it starts on,
+        it runs alone on the home tab once the running entries are done
+
+        Parameters
+        ----------
+        instance: driver.Driver
+            The executing Driver object
+        engine: lite.LiteDriver
+            The executing LiteDriver object, for eligible Task objects
+        shard: list
+            A list of (index, entry), see 'shards'
+
+        Returns
+        -------
+        dict: The traced results keyed by index
+        """
+
+        rows = {}
+        for idx, entry in shard[:1]:
+            row = self.run(instance, entry, engine)
+            if row: rows[idx] = row
+        
+        waiting = deque(shard[1:])
+        if not waiting: return rows
+
+        handles = deque(instance.windows(self.tabs)); home = handles[0]
+        base = instance.save(); running = deque([])
+        pages = {handle: {"visited": None, "elements": OrderedDict()} for handle in handles}
+        pages[home] = {"visited": base["visited"], "elements": base["elements"]}
+        
+        instance.interleaving = True
+        try:
+            while waiting or running:
+                while waiting and handles:
+                    idx, entry = waiting[0]
+                    browser = entry[0] and not (engine and self.eligible(entry))
+                    if browser and not self.task2url(entry[0], entry[2]):
+                        if running: break
+                        instance.switch(home)
+                        instance.restore({**base, **pages[home]})
+                    elif browser:
+                        waiting.popleft()
+                        running.append([idx, entry, handles.popleft(), None, None])
+                        continue
+
+                    waiting.popleft()
+                    row = self.run(instance, entry, engine)
+                    if row: rows[idx] = row
+                    if browser: pages[home] = {"visited": instance.visited, "elements": instance.elements}
+                if not running: break
+
+                slot = running.popleft()
+                idx, entry, handle, execution, state = slot
+                instance.switch(handle)
+                if execution is None:
+                    instance.restore({**pages[handle], "metrics": Counter()})
+                    instance.assign(entry[0])
+                    slot[3] = execution = instance.execution(entry[2])
+                else: instance.restore(state)
+
+                try: next(execution)
+                except StopIteration:
+                    self.measure(instance.metrics, entry[0].key)
+                    base["metrics"].update(instance.metrics)
+                    row = self.harvest(instance, entry, instance.results)
+                    if row: rows[idx] = row
+
+                    pages[handle] = {"visited": instance.visited, "elements": instance.elements}
+                    handles.append(handle)
+                    continue
+                slot[4] = instance.save()
+                running.append(slot)
+        finally:
+            instance.interleaving = False
+            instance.restore({**base, "visited": pages[home]["visited"], "elements": pages[home]["elements"]})
+            instance.switch(home)
+        return rows
+
+    def deploy_shards(self, stack:ExitStack):
+        """Execute the queue's usrId shards on <parallelism> Drivers
+        Traced results are collected in their original queue order
+        A worker's Driver is leased or launched once, on the first window that needs a browser, & kept across windows
+
+        Parameters
+        ----------
+        stack: ExitStack
+            Releases the workers' Drivers & LiteDrivers once 'deploy' is done
+        """
+
+        browser = self.needs_browser()
+        shards = self.shards(); self.queue.clear()
+        rows = {}; lock = threading.Lock()
+        if not self.workers: stack.callback(self.workers.clear)
+
+        def drain(instance:driver.Driver, engine:lite.LiteDriver):
+            while True:
+                with lock:
+                    if not shards: return
+                    shard = shards.popleft()
+                
+                if instance and self.tabs > 1:
+                    done = self.interleave(instance, engine, shard)
+                    with lock: rows.update(done)
+                    continue
+
+                for i, (idx, entry) in enumerate(shard):
+                    ahead = [queued for _, queued in shard[i + 1:i + 1 + self.pipeline]]
+                    row = self.run(instance, entry, engine, ahead)
+                    if row:
+                        with lock: rows[idx] = row
+
+        def work(n:int):
+            instance, engine = self.workers.get(n, (None, None))
+            if not engine:
+                engine = lite.LiteDriver(f"{self.id}.lite.{n}")
+                with lock: stack.callback(engine.quit)
+            if browser and not instance:
+                # i.e. the user of the shard it most likely drains first
+                with lock: user = planner.Planner.usrId(shards[n][0][1]) if n < len(shards) else None
+                lease = self.lease(n, user); instance = lease.__enter__()
+                with lock: stack.push(lease.__exit__)
+            with lock: self.workers[n] = (instance, engine)
+            drain(instance, engine)
+
+        workers = min(self.parallelism, len(shards))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(work, n) for n in range(workers)]
+        
+        for idx in sorted(rows): self.collect(*rows[idx], at=idx)
+        for future in futures: future.result()
+
     # === Utility Function(s) ===
     def task2str(self, fmt:str, elut:dict, ilut:dict)->str:
         """Parse the Task response to a formatted string
@@ -128,21 +622,52 @@ class Job(object):
         str: The formatted string
         """
 
-        for placeholder in re.findall(const.RE_POSITIONAL, fmt):
-            value = placeholder[2:-1]
-            if value == const.ELUTV: 
-                span = []
-                for i, j in elut.items(): span.append(f"{i}: {j}")
-                fmt = fmt.replace(placeholder, ", ".join(span))
+        def lookup(kind:str, value:str)->str:
+            if kind is formatter.LUT: return elut.get(value, "N/F") if isinstance(elut, dict) else "N/F"
+            elif kind is formatter.INDEX: return ilut.get(value, "N/A")
+            elif kind is formatter.LAST: return (utils.texts(ilut) or ["N/A"])[-1]
+            elif kind is formatter.ARGV: return ", ".join(utils.texts(ilut))
+            elif kind is formatter.ELUT: return ", ".join(f"{i}: {j}" for i, j in elut.items())
+            else: return elut.get(const.FINDV + value, "N/F") if isinstance(elut, dict) else "N/F"
 
-            elif value == const.ARGV: fmt = fmt.replace(placeholder, ", ".join(ilut.values()))
-            elif value == const.LAST: fmt = fmt.replace(placeholder, ilut.get(list(ilut.keys())[-1], "N/A"))
-            elif value.isdigit(): fmt = fmt.replace(placeholder, ilut.get(placeholder, "N/A"))
-            else: 
-                if isinstance(elut, dict): fmt = fmt.replace(placeholder, elut.get(value, "N/F"))
-                else: fmt = fmt.replace(placeholder, "N/F")
-        
-        return fmt
+        return formatter.parse(fmt).render(lookup)
+
+    def task2url(self, task:models.Task, elut:dict)->str:
+        """Get the URL of the Task's first command, if it is a navigation that only depends on the external look-up table
+
+        Parameters
+        ----------
+        task: models.Task
+            The Task object
+        elut: dict
+            An external look-up table
+
+        Returns
+        -------
+        str: None otherwise, e.g. a DGET w/ an XPATH look-up
+        """
+
+        return planner.task2url(task, elut)
+
+    def task2record(self, task:models.Task, elut:dict, ilut:dict)->dict:
+        """Get the Task response's record, i.e. its EXTRACTed fields w/ the row's usrId, env & name
+
+        Parameters
+        ----------
+        task: models.Task
+            The Task object
+        elut: dict
+            An external look-up table
+        ilut: dict
+            An internal look-up table
+
+        Returns
+        -------
+        dict
+        """
+
+        usrId = elut.get("usrId", "N/A") if isinstance(elut, dict) else "N/A"
+        return {"usrId": usrId, "env": task.key.env, "name": task.key.name, **ilut[const.RECORDV]}
 
     def ig(self, lst:list, idx:int):
         """Safe Index Get
@@ -223,6 +748,11 @@ class Job(object):
                 self.ig(lastrow, 0), self.ig(lastrow, 1), 
                 self.ig(lastrow, 2), self.ig(lastrow, 3), True
             )
+        if self.records:
+            fields = utils.columns(self.records)
+            body += template.body_content_columns(fields)
+            for i, record in enumerate(self.records):
+                body += template.body_content_record([utils.cell(record.get(field)) for field in fields], i == len(self.records) - 1)
         body += template.body_content_summary(True)
         html = template.header + body + template.footer(email=sender)
 
@@ -252,6 +782,13 @@ class Job(object):
 
         attachments = [ self.make_attachment(report) ]
         paths = [ report ]
+        if self.records:
+            path = os.path.join(config.PATH_CACHE, f"{self.id}.records.csv")
+            utils.write_records(self.records, path)
+
+            attachments.append( self.make_attachment(path) )
+            paths.append(path)
+
         for key, value in self.snaps.items():
             key = key.replace(" ", "")
             path = os.path.join(config.PATH_CACHE, f"{key}.html")
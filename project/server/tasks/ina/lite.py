@@ -0,0 +1,317 @@
+# project/server/tasks/ina/lite.py
+
+# === Import(s) ===
+# => Local <=
+from . import utils
+from . import const
+from . import config
+from . import models
+from . import driver
+
+# => System <=
+import time
+from collections import Counter
+from urllib.parse import urljoin
+
+# => External <=
+import requests
+import lxml.html
+from lxml import etree
+from requests.adapters import HTTPAdapter
+
+# === Eligibility ===
+def eligible(task:models.Task, browser:bool=False)->bool:
+    """Check if the Task object can run on a LiteDriver (i.e. w/o a browser)
+    Opt-in/out w/ the journal option {"engine": "LITE"} or {"engine": "BROWSER"},
+    otherwise eligible if it only uses const.LITE_COMMANDS & its user's session does not live in a browser
+
+    Parameters
+    ----------
+    task: models.Task
+        The Task object
+    browser: bool, optional
+        Whether another Task object of the same usrId needs a browser (e.g. a SWAP USER),
+        its cookies are then only known to the browser Driver
+
+    Returns
+    -------
+    bool
+    """
+
+    engine = (task.options or {}).get(const.OPTION_ENGINE)
+    if engine: return engine == const.ENGINE_LITE
+    return not browser and all(cmd.label.upper() in const.LITE_COMMANDS for cmd in task.cmds)
+
+# === Object Definition ===
+class LiteDriver(driver.Driver):
+    """Define a LiteDriver Object
+
+    An HTTP-Only Driver, i.e. a Pooled HTTP Client & an lxml XPATH Evaluator
+    The Task Executor of Extraction-Only Tasks: GET, DGET, PRINTF, SNAP, IF_[NOT_]PRESENT blocks & loops (PAUSE is a no-op)
+    """
+
+    OPS = ("get", "dget", "printf", "emit", "snap", "pause", "settle", "refresh", "branch", "jump", "nop", "for_each", "next", "paginate", "turn", "extract")
+
+    def __init__(self, uid:str, browser:str=None):
+        self.uid = uid
+        self.log = utils.get_logger(f"INA.LiteDriver.{self.uid}")
+
+        self.driver = None
+        self.session = self.client()
+        self.found = {}
+        self.metrics = Counter()
+        self.failure = None
+        self.deadline = None
+        self.visited = None
+        self.clear()
+
+    def __str__(self):
+        return f"INA.LiteDriver(uid={self.uid})"
+
+    # === Getter(s) ===
+    def client(self)->requests.Session:
+        """Get a pooled HTTP client, i.e. a requests Session w/ keep-alive connections
+
+        Returns
+        -------
+        requests.Session
+        """
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=config.DEFAULT_LITE_POOL, pool_maxsize=config.DEFAULT_LITE_POOL)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(config.DEFAULT_LITE_HEADERS)
+        return session
+
+    # === Setter(s) ===
+    def bind(self, program:tuple)->tuple:
+        """Bind a compiled program to this driver's handlers
+        Commands that need a browser are no-ops
+
+        Parameters
+        ----------
+        program: tuple
+            A tuple of Instruction objects
+
+        Returns
+        -------
+        tuple: A tuple of (handler, args, critical)
+        """
+
+        bound = []
+        for instr in program:
+            if instr.op in self.OPS: bound.append((getattr(self, instr.op), instr.args, instr.critical))
+            else: 
+                self.log.error(f"bind: Unsupported Command '{instr.cmd.label}' - {self.task}")
+                bound.append((self.nop, (), False))     # kept, so jump targets stay aligned
+        return tuple(bound)
+
+    def clear(self):
+        """Clear the current page
+
+        """
+
+        self.url = const.BLANK
+        self.source = ""
+        self.document = None
+
+    def scrub(self):
+        """Scrub client state (i.e. cookies & the current page) so the instance can be re-used
+
+        """
+
+        if self.session: self.session.cookies.clear()
+        self.visited = None
+        self.clear()
+        self.reset()
+        if hasattr(self, "task"): del self.task
+        self.log.debug("scrubbed")
+
+    def quit(self):
+        """Close the HTTP client
+
+        """
+
+        if getattr(self, "session", None):
+            self.session.close()
+            self.session = None
+
+    # === Utility Function(s) ===
+    def resume(self)->bool:
+        """Sessions are not checkpointed w/o a browser, see Driver.resume
+
+        """
+
+        return False
+
+    def checkpoint(self):
+        """Sessions are not checkpointed w/o a browser, see Driver.checkpoint
+
+        """
+
+        pass
+
+    def location(self)->str:
+        """Get the current page's URL
+
+        """
+
+        return self.url
+
+    def find_texts(self, targets:list)->dict:
+        """Find all elements of every XPATH in <targets> & get their text values
+
+        Parameters
+        ----------
+        targets: list
+            A list of XPATH values
+
+        Returns
+        -------
+        dict: A list of text values keyed by XPATH
+        """
+
+        found = {}
+        for target in targets:
+            found[target] = []
+            if self.document is None: continue
+
+            try: nodes = self.document.xpath(target)
+            except etree.XPathError:
+                self.log.error(f"find_texts: XPATH Error - '{target}' - {self.task}")
+                continue
+
+            if not isinstance(nodes, list): nodes = [nodes]
+            for node in nodes:
+                text = node.text_content() if hasattr(node, "text_content") else str(node)
+                found[target].append(text.strip())
+            if not found[target]: self.log.error(f"find_texts: No Such Element Exception - '{target}' - {self.task}")
+        return found
+
+    def present(self, target:str, timeout:float=None)->bool:
+        """Check if an element is present, right away: a fetched page does not change
+
+        """
+
+        return self.count(self.scoped(target)) > 0
+
+    def count(self, target:str)->int:
+        """Count the elements found by XPATH
+
+        """
+
+        if self.document is None: return 0
+        try: 
+            nodes = self.document.xpath(target)
+            return len(nodes) if isinstance(nodes, list) else int(bool(nodes))
+        except etree.XPathError: return 0
+
+    def follow(self, target:str):
+        """Navigate to the page linked by an element, i.e. its 'href'
+
+        """
+
+        nodes = self.document.xpath(self.scoped(target)) if self.document is not None else []
+        href = nodes[0].get("href") if nodes and hasattr(nodes[0], "get") else None
+        if href: self.get(urljoin(self.url, href))
+        else: self.fail(f"follow: No Such Link - '{target}'")
+
+    def find_fields(self, fields:tuple)->dict:
+        """Find all elements of every field's selector & get their text values
+        CSS selectors need the 'cssselect' package
+
+        Parameters
+        ----------
+        fields: tuple
+            A tuple of (field, kind, selector, all)
+
+        Returns
+        -------
+        dict: A list of text values keyed by field
+        """
+
+        root = self.document
+        if root is not None and self.scope:
+            nodes = root.xpath(self.scope)
+            root = nodes[0] if nodes else None
+        if root is None: return {}
+
+        found = {}
+        for name, kind, selector, _ in fields:
+            try: nodes = root.cssselect(selector) if kind == const.FIELD_CSS else root.xpath(selector)
+            except ImportError:
+                self.fail(f"find_fields: Import Error - CSS selectors need the 'cssselect' package")
+                continue
+            except etree.XPathError:
+                self.log.error(f"find_fields: XPATH Error - '{selector}' - {self.task}")
+                continue
+
+            if not isinstance(nodes, list): nodes = [nodes]
+            found[name] = [(node.text_content() if hasattr(node, "text_content") else str(node)).strip() for node in nodes]
+        return found
+
+    # === Command Function(s) ===
+    # => Page <=
+    def get(self, target:str, argv=None):
+        """Get URL page
+
+        Parameters
+        ----------
+        target: str
+            A URL string
+        argv: list, optional
+            The readiness, ignored: the page is fully loaded once fetched
+        """
+
+        if self.revisit(target):
+            self.metrics[const.METRIC_SKIPPED_NAVIGATIONS] += 1
+            return
+
+        self.clear(); self.visited = None
+        try:
+            response = self.session.get(target, timeout=self.budget())
+            self.url = response.url
+            self.source = response.text
+            if response.content.strip(): self.document = lxml.html.fromstring(response.content, base_url=response.url)
+            if self.revisits(): self.visited = (target, self.url, time.monotonic())
+
+        except (requests.exceptions.MissingSchema, requests.exceptions.InvalidSchema, requests.exceptions.InvalidURL):
+            self.fail(f"get: Invalid Argument Exception - Malformed URL - '{target}' is not a valid URL")
+
+        except requests.exceptions.RequestException:
+            self.fail("get: Request Exception - Reached Error Page")
+
+        except etree.ParserError:
+            self.fail("get: Parser Error")
+
+    def refresh(self, target:str=None, argv:list=None):
+        """Refresh current page
+
+        """
+
+        self.visited = None
+        if self.url != const.BLANK: self.get(self.url)
+
+    def snap(self, target:str, argv:list=None):
+        """Take a snapshot of the page source code
+
+        """
+
+        title = self.document.findtext(".//title") if self.document is not None else None
+        if not self.results.get(const.SNAPV): self.results[const.SNAPV] = {}
+        self.results[const.SNAPV][(title or self.url).strip()] = self.source
+
+    def pause(self, target:str, argv:list=None):
+        """Pause, a no-op: a fetched page does not change
+
+        """
+
+        pass
+
+    def settle(self, target:str, argv:list=None):
+        """Bounded pause, a no-op: a fetched page does not change
+
+        """
+
+        pass
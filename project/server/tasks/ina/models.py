@@ -2,12 +2,14 @@
 
 # === Import(s) ===
 # => System <=
+import weakref
+import threading
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, FrozenInstanceError
 
 # === Data Model(s) ===
-@dataclass(frozen=True)
-class Command:
+# Command, Key & Task are slotted (i.e. w/o a per-instance __dict__) & frozen, their hash is computed once
+class Command(object):
     """Define a Command Object
     
     For executing a particular command
@@ -20,20 +22,76 @@ class Command:
         The primary command argument
     argv: list
         A list of secondary command arguments
+    critical: bool, optional
+        If its failure aborts the Task (i.e. fail-fast)
+    optional: bool, optional
+        If it is skipped when its element is absent & its failure never aborts the Task
     """
 
-    label: str
-    target: str
-    argv: list
+    __slots__ = ("label", "target", "argv", "critical", "optional", "_hash")
+
+    def __init__(self, label:str, target:str, argv:list, critical:bool=False, optional:bool=False):
+        for name, value in (("label", label), ("target", target), ("argv", argv), ("critical", critical), ("optional", optional)):
+            object.__setattr__(self, name, value)
+        # argv & some targets (e.g. EXTRACT's fields) are unhashable, equal Command objects still hash alike
+        object.__setattr__(self, "_hash", hash((label, target if isinstance(target, str) else None, critical, optional)))
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (Command, (self.label, self.target, self.argv, self.critical, self.optional))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, another):
+        if self is another: return True
+        if another.__class__ is not self.__class__: return NotImplemented
+        return (
+            self._hash == another._hash and self.label == another.label and self.target == another.target and
+            self.argv == another.argv and self.critical == another.critical and self.optional == another.optional)
+
+    def __repr__(self):
+        return f"Command(label={self.label!r}, target={self.target!r}, argv={self.argv!r}, critical={self.critical!r}, optional={self.optional!r})"
 
     def __str__(self):
         return f"INA.Command(label={self.label})"
 
 @dataclass(frozen=True)
-class Key:
+class Instruction:
+    """Define an Instruction Object
+    
+    A Command object compiled for execution: the Driver handler's name & its pre-resolved arguments
+
+    Parameters
+    ----------
+    op: str
+        The Driver handler name
+    args: tuple
+        The pre-resolved handler arguments
+    cmd: Command
+        The source Command object
+    critical: bool, optional
+        If its failure aborts the Task
+    """
+
+    op: str
+    args: tuple
+    cmd: Command
+    critical: bool = False
+
+    def __str__(self):
+        return f"INA.Instruction(op={self.op})"
+
+class Key(object):
     """Define a Key Object
     
     Is the unique ID of a Task object
+    Interned: equal Key objects alive at the same time are the same object
 
     Parameters
     ----------
@@ -43,22 +101,49 @@ class Key:
         The Task name
     """
 
-    env: str
-    name: str
+    __slots__ = ("env", "name", "_hash", "__weakref__")
+    interned = weakref.WeakValueDictionary()
+    lock = threading.Lock()
+
+    def __new__(cls, env:str, name:str):
+        key = cls.interned.get((env, name))
+        if key is not None: return key
+
+        with cls.lock:
+            key = cls.interned.get((env, name))
+            if key is None:
+                key = object.__new__(cls)
+                object.__setattr__(key, "env", env)
+                object.__setattr__(key, "name", name)
+                object.__setattr__(key, "_hash", hash((env, name)))
+                cls.interned[(env, name)] = key
+        return key
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (Key, (self.env, self.name))
 
     def __hash__(self):
-        return hash(self.env + self.name)
+        return self._hash
 
     def __eq__(self, another):
+        if self is another: return True
         return (
             hasattr(another, "env") and self.env == another.env and 
             hasattr(another, "name") and self.name == another.name)
 
+    def __repr__(self):
+        return f"Key(env={self.env!r}, name={self.name!r})"
+
     def __str__(self):
         return f"INA.Key(env={self.env}, name={self.name})"
 
-@dataclass(frozen=True)
-class Task:
+class Task(object):
     """Define a Task Object
     
     Is a sequence of Command objects executed linearly
@@ -69,14 +154,56 @@ class Task:
         The Task ID
     cmds: deque
         A deque list of Command objects
+    options: dict, optional
+        The journal options, e.g. {"pause": "BOUND", "fail_fast": true, "budget": 30.0}
+    program: tuple, optional
+        The compiled commands, a tuple of Instruction objects
     """
 
-    key: Key
-    cmds: deque
+    __slots__ = ("key", "cmds", "options", "program")
+
+    def __init__(self, key:Key, cmds:deque, options:dict=None, program:tuple=None):
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "cmds", cmds)
+        object.__setattr__(self, "options", options)
+        object.__setattr__(self, "program", program)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (Task, (self.key, self.cmds, self.options, self.program))
+
+    def __hash__(self):
+        # equal Task objects (i.e. the same key & commands) have the same key
+        return self.key._hash
+
+    def __eq__(self, another):
+        if self is another: return True
+        if another.__class__ is not self.__class__: return NotImplemented
+        return self.key == another.key and self.cmds == another.cmds
+
+    def __repr__(self):
+        return f"Task(key={self.key!r}, cmds={self.cmds!r}, options={self.options!r})"
 
     def __str__(self):
         return f"INA.Task(key={self.key})"
 
+    def cache(self, program:tuple):
+        """Cache the compiled program, cleared whenever commands are modified
+
+        Parameters
+        ----------
+        program: tuple
+            A tuple of Instruction objects or None
+        """
+
+        # frozen: the program is a cache, not part of the Task's identity
+        object.__setattr__(self, "program", program)
+
     def push(self, cmd:Command):
         """Push new command to rightmost position
 
@@ -87,6 +214,7 @@ class Task:
         """
 
         self.cmds.append(cmd)
+        self.cache(None)
 
     def pushleft(self, cmd:Command):
         """Push new command to leftmost position
@@ -98,6 +226,7 @@ class Task:
         """
 
         self.cmds.appendleft(cmd)
+        self.cache(None)
 
     def extend(self, cmds:list):
         """Extend a list of new commands to rightmost position
@@ -109,6 +238,7 @@ class Task:
         """
 
         self.cmds.extend(cmds)
+        self.cache(None)
 
     def extendleft(self, cmds:list):
         """Extend a list of new commands, in-order, to leftmost position
@@ -120,6 +250,7 @@ class Task:
         """
 
         for cmd in reversed(cmds): self.cmds.appendleft(cmd)
+        self.cache(None)
 
     def pop(self)->Command:
         """Pop rightmost command from command list
@@ -129,6 +260,7 @@ class Task:
         Command: The popped command object
         """
 
+        self.cache(None)
         return self.cmds.pop()
 
     def popleft(self)->Command:
@@ -139,4 +271,76 @@ class Task:
         Command: The popped command object
         """
 
+        self.cache(None)
         return self.cmds.popleft()
+
+class Row(object):
+    """Define a Row Object
+
+    A Job's Queued Row, Unpacked Like (task, fmt, elut, trace)
+    Its external look-up table is kept as a tuple of values & a tuple of names shared by every row of the same names,
+    i.e. its dict is only built when first read & then kept, so every read gets the same dict
+
+    Parameters
+    ----------
+    task: Task
+        The Task object
+    fmt: str, optional
+        The string format
+    elut: dict, optional
+        An external look-up table
+    trace: bool, optional
+        If its result is traced
+    """
+
+    __slots__ = ("task", "fmt", "names", "values", "trace", "_elut")
+    shapes = {}     # interned tuples of names, up to SHAPES
+    SHAPES = 1024
+
+    def __init__(self, task:Task, fmt:str=None, elut:dict=None, trace:bool=True):
+        self.task = task
+        self.fmt = fmt
+        self.trace = trace
+        self._elut = None
+        if isinstance(elut, dict):
+            names = tuple(elut)
+            shared = Row.shapes.get(names)
+            if shared is None and len(Row.shapes) < Row.SHAPES: shared = Row.shapes.setdefault(names, names)
+            self.names = shared or names
+            self.values = tuple(elut.values())
+        else:
+            self.names = None
+            self.values = elut
+
+    @property
+    def elut(self)->dict:
+        """Get the external look-up table, built on first read & kept
+
+        """
+
+        if self.names is None: return self.values
+        if self._elut is None: self._elut = dict(zip(self.names, self.values))
+        return self._elut
+
+    def get(self, name:str, default=None):
+        """Get an external look-up table value, w/o building its dict
+
+        """
+
+        if self._elut is not None: return self._elut.get(name, default)
+        if self.names is None: return default
+        try: return self.values[self.names.index(name)]
+        except ValueError: return default
+
+    def __iter__(self):
+        return iter((self.task, self.fmt, self.elut, self.trace))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, idx:int):
+        if idx in (2, -2): return self.elut
+        return (self.task, self.fmt, None, self.trace)[idx]
+
+    def __str__(self):
+        return f"INA.Row(task={self.task}, trace={self.trace})"
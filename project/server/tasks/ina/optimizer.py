@@ -0,0 +1,190 @@
+# project/server/tasks/ina/optimizer.py
+
+# === Import(s) ===
+# => Local <=
+from . import const
+from . import models
+from . import formatter
+
+# => System <=
+from collections import deque
+
+# === Constant(s) ===
+NAVIGATIONS=("get", "dget")
+XPATH_STARTS=("/", "(", ".")    # a LUT placeholder starting w/ one of these is an XPATH look-up
+
+# === Predicate(s) ===
+def reads_template(fmt)->bool:
+    """Check if a string format looks-up the current page (i.e. has an XPATH placeholder)
+
+    Parameters
+    ----------
+    fmt: str
+        The string format
+
+    Returns
+    -------
+    bool
+    """
+
+    if not isinstance(fmt, str): return False
+    return any(
+        kind is formatter.FIND_ALL or (kind is formatter.LUT and value[:1] in XPATH_STARTS)
+        for kind, value in formatter.parse(fmt).segments)
+
+def reads_page(cmd:models.Command)->bool:
+    """Check if a Command object depends on the current page
+    Unknown commands are assumed to
+
+    Parameters
+    ----------
+    cmd: models.Command
+        The Command object
+
+    Returns
+    -------
+    bool
+    """
+
+    label = cmd.label.lower()
+    if label in ("get", "pause", "emit"): return False
+    elif label in ("dget", "printf"): return reads_template(cmd.target)
+    else: return True
+
+def is_constant(cmd:models.Command)->bool:
+    """Check if a Command object is a PRINTF w/o any placeholder, i.e. the same every row
+
+    """
+
+    return (
+        cmd.label.lower() == "printf" and isinstance(cmd.target, str) and
+        all(kind is formatter.LITERAL for kind, _ in formatter.parse(cmd.target).segments))
+
+def navigates_first(cmds:list)->bool:
+    """Check if commands overwrite the page they start on (i.e. a GET or DGET) before any of them reads it
+
+    Parameters
+    ----------
+    cmds: list
+        A list of Command objects
+
+    Returns
+    -------
+    bool: False if none of them navigates
+    """
+
+    for cmd in cmds:
+        if cmd.label.lower() in NAVIGATIONS: return not reads_page(cmd)
+        if reads_page(cmd): return False
+    return False
+
+def enabled(task:models.Task)->bool:
+    """Check if a Task object is optimized, i.e. unless opted-out w/ the journal option {"optimize": false}
+
+    """
+
+    return (task.options or {}).get(const.OPTION_OPTIMIZE) is not False
+
+# === Pass(es) ===
+# Each pass takes a list of Command objects & a report (i.e. a list of changes), returns the rewritten list
+def emit_constants(cmds:list, report:list)->list:
+    """Turn constant PRINTFs into EMITs, i.e. their string is stored as is instead of formatted every row
+
+    """
+
+    res = []
+    for i, cmd in enumerate(cmds):
+        if is_constant(cmd):
+            res.append(models.Command("emit", cmd.target, None, cmd.critical, cmd.optional))
+            report.append(f"emitted PRINTF #{i} '{cmd.target}' (constant)")
+        else: res.append(cmd)
+    return res
+
+def drop_dead_navigations(cmds:list, report:list)->list:
+    """Drop every GET & DGET overwritten by a later navigation of the Task w/o a page-reading command in between
+    The Task's last navigation is always kept, i.e. its page may be the point (e.g. a confirmation)
+    Scanned backwards, so a navigation only read by a dropped one is dropped too
+
+    """
+
+    res = deque([]); dropped = []; overwritten = False
+    for i in reversed(range(len(cmds))):
+        cmd = cmds[i]
+        if cmd.label.lower() in NAVIGATIONS:
+            if overwritten:
+                dropped.append(f"dropped {cmd.label.upper()} #{i} '{cmd.target}' (overwritten by a later navigation)")
+                continue
+            overwritten = not reads_page(cmd)
+        elif reads_page(cmd): overwritten = False
+        res.appendleft(cmd)
+    
+    report.extend(reversed(dropped))
+    return list(res)
+
+def merge_pauses(cmds:list, report:list)->list:
+    """Merge adjacent PAUSEs into a single PAUSE of their total
+
+    """
+
+    res = []
+    for cmd in cmds:
+        prev = res[-1] if res else None
+        if prev and prev.label.lower() == "pause" and cmd.label.lower() == "pause":
+            try: seconds = float(prev.target) + float(cmd.target)
+            except (TypeError, ValueError):
+                res.append(cmd)
+                continue
+
+            res[-1] = models.Command(prev.label, seconds, None, prev.critical or cmd.critical, prev.optional and cmd.optional)
+            report.append(f"merged PAUSE {prev.target} & {cmd.target} => {seconds}")
+        else: res.append(cmd)
+    return res
+
+PASSES=(emit_constants, drop_dead_navigations, merge_pauses)
+
+def dead_suffix(suffix:list, tasks:list)->bool:
+    """Check if a suffix appended to every Task object (e.g. a GET, see tasks.utils.get_task_list) is dead,
+    i.e. it only navigates & every Task object overwrites the page it leaves before reading it,
+    so whichever of them runs on the next row drops its page anyway
+
+    Parameters
+    ----------
+    suffix: list
+        A list of Command objects
+    tasks: list
+        Every Task object a row can run, i.e. the loaded ones
+
+    Returns
+    -------
+    bool
+    """
+
+    return (
+        bool(suffix) and all(cmd.label.lower() in NAVIGATIONS and not reads_page(cmd) for cmd in suffix) and
+        all(navigates_first(task.cmds) for task in tasks))
+
+# === Optimizer ===
+def optimize(task:models.Task)->list:
+    """Rewrite a Task object's commands in-place, w/o changing its results
+    Opt-out w/ the journal option {"optimize": false}
+
+    Parameters
+    ----------
+    task: models.Task
+        The Task object
+
+    Returns
+    -------
+    list: A report, i.e. a description of every change made
+    """
+
+    report = []
+    if not enabled(task): return report
+
+    cmds = list(task.cmds)
+    for opt in PASSES: cmds = opt(cmds, report)
+
+    if report:
+        task.cmds.clear()
+        task.extend(cmds)
+    return report
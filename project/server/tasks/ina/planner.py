@@ -0,0 +1,193 @@
+# project/server/tasks/ina/planner.py
+
+# === Import(s) ===
+# => Local <=
+from . import config
+from . import models
+from . import formatter
+
+# => System <=
+from collections import OrderedDict
+
+# === Constant(s) ===
+NAVIGATIONS=("get", "dget", "refresh", "follow")
+WAITS=("wait", "wait_for", "settle")
+
+# === Utility Function(s) ===
+def task2url(task:models.Task, elut:dict)->str:
+    """Get the URL of the Task's first command, if it is a navigation that only depends on the external look-up table
+
+    Parameters
+    ----------
+    task: models.Task
+        The Task object
+    elut: dict
+        An external look-up table
+
+    Returns
+    -------
+    str: None otherwise, e.g. a DGET w/ an XPATH look-up
+    """
+
+    cmd = task.cmds[0] if task and task.cmds else None
+    if not cmd or not isinstance(cmd.target, str) or cmd.label.lower() not in ("get", "dget"): return None
+    if cmd.label.lower() == "get": return cmd.target
+
+    def lookup(kind:str, value:str)->str:
+        res = elut.get(value) if kind is formatter.LUT and isinstance(elut, dict) else None
+        if not res or not isinstance(res, str): raise KeyError(value)
+        return res
+
+    try: return formatter.parse(cmd.target).render(lookup)
+    except KeyError: return None
+
+# === Cost Model ===
+class Costs(object):
+    """Define a Costs Object
+
+    The Estimated Seconds of a User Swap, a Task Assignment (i.e. a Driver state reset), a Navigation & a Wait
+    """
+
+    def __init__(self, swap:float=None, assign:float=None, navigation:float=None, wait:float=None):
+        self.swap = config.DEFAULT_COST_SWAP if swap is None else swap
+        self.assign = config.DEFAULT_COST_ASSIGN if assign is None else assign
+        self.navigation = config.DEFAULT_COST_NAVIGATION if navigation is None else navigation
+        self.wait = config.DEFAULT_COST_WAIT if wait is None else wait
+
+    def __str__(self):
+        return f"INA.Costs(swap={self.swap}, assign={self.assign}, navigation={self.navigation}, wait={self.wait})"
+
+# === Object Definition ===
+class Planner(object):
+    """Define a Planner Object
+
+    Pick the execution order of a Job's queue that minimises its estimated cost (see Costs):
+    rows are grouped by usrId, then by Task key & then by their first navigation's URL,
+    i.e. fewer swaps & assignments & revisited pages (see the journal option {"revisit": "SKIP"})
+    A usrId shard's first entry (e.g. a SWAP USER) stays first, see Job.shards
+    """
+
+    def __init__(self, costs:Costs=None):
+        self.costs = costs or Costs()
+
+    def __str__(self):
+        return f"INA.Planner(costs={self.costs})"
+
+    # === Getter(s) ===
+    @staticmethod
+    def usrId(entry:tuple)->str:
+        """Get a queue entry's usrId
+
+        """
+
+        if isinstance(entry, models.Row): return entry.get("usrId")
+        elut = entry[2]
+        return elut.get("usrId") if isinstance(elut, dict) else None
+
+    @staticmethod
+    def url(entry:tuple)->str:
+        """Get the URL of a queue entry's first navigation, see 'task2url'
+
+        """
+
+        return task2url(entry[0], entry[2])
+
+    def waits(self, task:models.Task)->float:
+        """Get a Task object's estimated waiting time, i.e. its PAUSEs & waits, regardless of its order
+
+        Returns
+        -------
+        float: Seconds
+        """
+
+        seconds = 0.0
+        for cmd in task.cmds:
+            label = cmd.label.lower()
+            if label == "pause":
+                try: seconds += float(cmd.target)
+                except (TypeError, ValueError): seconds += self.costs.wait
+            elif label in WAITS: seconds += self.costs.wait
+        return seconds
+
+    def cost(self, entries:list)->float:
+        """Get the estimated cost of executing queue entries in order
+
+        Parameters
+        ----------
+        entries: list
+            A list of queue entries, i.e. (task, fmt, elut, trace)
+
+        Returns
+        -------
+        float: Seconds
+        """
+
+        total = 0.0; prev = None; per = {}
+        for entry in entries:
+            task = entry[0]
+            if not task: continue
+
+            if task.key not in per:
+                per[task.key] = (sum(cmd.label.lower() in NAVIGATIONS for cmd in task.cmds), self.waits(task))
+            navigations, waits = per[task.key]
+
+            if prev is None or self.usrId(prev) != self.usrId(entry): total += self.costs.swap
+            if prev is None or prev[0].key != task.key: total += self.costs.assign
+            url = self.url(entry)
+            if url and prev is not None and url == self.url(prev): navigations -= 1
+            total += max(0, navigations) * self.costs.navigation + waits
+            prev = entry
+        return total
+
+    # === Functional ===
+    def order(self, entries:list)->list:
+        """Get the planned execution order of queue entries
+
+        Parameters
+        ----------
+        entries: list
+            A list of queue entries, i.e. (task, fmt, elut, trace)
+
+        Returns
+        -------
+        list: The queue indices, in execution order
+        """
+
+        # => usrId shards, a usrId's shards are grouped in order of appearance <=
+        users = OrderedDict(); prev = object()
+        for idx, entry in enumerate(entries):
+            curr = self.usrId(entry)
+            if curr != prev: users.setdefault(curr, []).append([])
+            users[curr][-1].append(idx)
+            prev = curr
+
+        # => Within a shard: its first entry, then by Task key in order of appearance & then by URL <=
+        keys = {}
+        for entry in entries:
+            if entry[0] and entry[0].key not in keys: keys[entry[0].key] = len(keys)
+
+        def rank(idx:int)->tuple:
+            task = entries[idx][0]
+            return (keys[task.key] if task else -1, self.url(entries[idx]) or "", idx)
+
+        res = []
+        for shards in users.values():
+            for shard in shards: res.extend(shard[:1] + sorted(shard[1:], key=rank))
+        return res
+
+    def plan(self, entries:list)->tuple:
+        """Plan the execution order of queue entries
+
+        Parameters
+        ----------
+        entries: list
+            A list of queue entries, i.e. (task, fmt, elut, trace)
+
+        Returns
+        -------
+        tuple: (order, baseline, estimate), i.e. the queue indices in execution order
+            & the estimated cost of the queue's order & of the planned one, in seconds
+        """
+
+        order = self.order(entries)
+        return order, self.cost(entries), self.cost([entries[idx] for idx in order])
@@ -0,0 +1,248 @@
+# project/server/tasks/ina/pool.py
+
+# === Import(s) ===
+# => Local <=
+from . import utils
+from . import config
+from . import driver
+
+# => System <=
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# => External <=
+from selenium.common import exceptions
+
+# === Object Definition ===
+class Pool(object):
+    """Define a Pool Object
+
+    A Set of Long-Lived Driver Objects Leased to Job Objects
+    A Driver is scrubbed when returned & recycled after <recycle> leases
+    W/ config.DEFAULT_POOL_AFFINITY, a Driver returned logged in as a user (see Driver.user) keeps its session:
+    it is leased first to that user's next Job & only scrubbed once leased to another
+    """
+
+    def __init__(self, size:int=None, browser:str=None, recycle:int=None, factory=None):
+        self.size = size or config.DEFAULT_POOL_SIZE
+        self.browser = browser
+        self.recycle = recycle or config.DEFAULT_POOL_RECYCLE
+        self.factory = factory or driver.Driver
+        self.log = utils.get_logger("INA.Pool")
+
+        self.idle = deque([])
+        self.uses = {}
+        self.count = 0
+        self.serial = 0
+        self.cond = threading.Condition()
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        return f"INA.Pool(size={self.size}, browser={self.browser})"
+
+    # === Getter(s) ===
+    def spawn(self)->driver.Driver:
+        """Get a new Driver instance
+
+        Returns
+        -------
+        driver.Driver
+        """
+
+        with self.cond:
+            self.serial += 1
+            uid = f"pool.{self.serial}"
+        return self.factory(uid, browser=self.browser)
+
+    def users(self)->set:
+        """Get the usrIds idle Driver instances are still logged in as, see 'release'
+
+        Returns
+        -------
+        set
+        """
+
+        with self.cond: return {instance.user for instance in self.idle if instance.user is not None}
+
+    # === Functional ===
+    def warm(self):
+        """Launch Driver instances until the pool is full
+
+        """
+
+        while True:
+            with self.cond:
+                if self.count >= self.size: break
+                self.count += 1
+
+            try: instance = self.spawn()
+            except Exception:
+                with self.cond: self.count -= 1
+                raise
+
+            with self.cond:
+                self.idle.append(instance)
+                self.uses[id(instance)] = 0
+                self.cond.notify()
+
+    def pick(self, user:str=None)->driver.Driver:
+        """Take an idle Driver instance, the one logged in as <user> first, then one w/o a session
+
+        Parameters
+        ----------
+        user: str, optional
+            The usrId of the leasing Job's first row
+
+        Returns
+        -------
+        driver.Driver
+        """
+
+        instance = next((instance for instance in self.idle if user and instance.user == user), None) \
+            or next((instance for instance in self.idle if instance.user is None), None) or self.idle[0]
+        self.idle.remove(instance)
+        return instance
+
+    def acquire(self, user:str=None)->driver.Driver:
+        """Lease a Driver instance, blocks until one is available
+        An idle Driver still logged in as another user is scrubbed first
+
+        Parameters
+        ----------
+        user: str, optional
+            The usrId of the leasing Job's first row, see 'pick'
+
+        Returns
+        -------
+        driver.Driver
+        """
+
+        with self.cond:
+            while not self.idle and self.count >= self.size: self.cond.wait()
+            instance = self.pick(user) if self.idle else None
+            if not instance: self.count += 1
+
+        if instance:
+            if instance.user is None or instance.user == user: return instance
+            try: 
+                instance.scrub()
+                return instance
+            except exceptions.WebDriverException:
+                self.log.error(f"acquire: WebDriver Exception - {instance}")
+                try: instance.quit()
+                except Exception: pass
+                with self.cond: self.uses.pop(id(instance), None)
+
+        try: instance = self.spawn()
+        except Exception:
+            with self.cond:
+                self.count -= 1
+                self.cond.notify()
+            raise
+
+        with self.cond: self.uses[id(instance)] = 0
+        return instance
+
+    def release(self, instance:driver.Driver, discard:bool=False):
+        """Return a leased Driver instance, scrub & recycle it
+        W/ config.DEFAULT_POOL_AFFINITY, one logged in as a user is not scrubbed, see 'acquire'
+
+        Parameters
+        ----------
+        instance: driver.Driver
+            The leased Driver instance
+        discard: bool, optional
+            If the Driver instance is to be quit instead of re-used
+        """
+
+        with self.cond:
+            uses = self.uses.get(id(instance), 0) + 1
+
+        if discard or uses >= self.recycle: discard = True
+        elif instance.user is None or not config.DEFAULT_POOL_AFFINITY:
+            try: instance.scrub()
+            except exceptions.WebDriverException:
+                self.log.error(f"release: WebDriver Exception - {instance}")
+                discard = True
+
+        if discard:
+            try: instance.quit()
+            except Exception: pass
+
+        with self.cond:
+            if discard:
+                self.uses.pop(id(instance), None)
+                self.count -= 1
+            else:
+                self.uses[id(instance)] = uses
+                self.idle.append(instance)
+            self.cond.notify()
+
+    @contextmanager
+    def lease(self, user:str=None):
+        """Lease a Driver instance for the duration of a 'with' block
+
+        Parameters
+        ----------
+        user: str, optional
+            The usrId of the leasing Job's first row, see 'acquire'
+
+        Yields
+        ------
+        driver.Driver
+        """
+
+        instance = self.acquire(user); discard = False
+        try: yield instance
+        except exceptions.WebDriverException:
+            discard = True
+            raise
+        finally: self.release(instance, discard=discard)
+
+    def close(self):
+        """Quit every idle Driver instance
+
+        """
+
+        with self.cond:
+            instances = list(self.idle)
+            self.idle.clear()
+            self.count -= len(instances)
+
+        for instance in instances:
+            try: instance.quit()
+            except Exception: pass
+
+# === Worker Pool ===
+POOL=None
+
+def install(pool:Pool):
+    """Install <pool> as this process's Driver pool
+
+    Parameters
+    ----------
+    pool: Pool
+        The Pool object, or None to uninstall
+    """
+
+    global POOL
+    POOL = pool
+
+def installed()->Pool:
+    """Get this process's Driver pool
+
+    Returns
+    -------
+    Pool: None if no pool is installed
+    """
+
+    return POOL
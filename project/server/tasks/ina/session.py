@@ -0,0 +1,131 @@
+# project/server/tasks/ina/session.py
+
+# === Import(s) ===
+# => Local <=
+from . import config
+
+# => System <=
+import json
+import time
+import threading
+
+# === Store(s) ===
+class LocalStore(object):
+    """Define a LocalStore Object
+
+    An In-Process Store of Session Checkpoints, i.e. key => (expiry, snapshot)
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def get(self, key:str)->dict:
+        with self.lock:
+            expiry, snapshot = self.data.get(key, (0, None))
+            if expiry > time.monotonic(): return snapshot
+            self.data.pop(key, None)
+            return None
+
+    def set(self, key:str, snapshot:dict, ttl:float):
+        with self.lock: self.data[key] = (time.monotonic() + ttl, snapshot)
+
+    def delete(self, key:str):
+        with self.lock: self.data.pop(key, None)
+
+class RedisStore(object):
+    """Define a RedisStore Object
+
+    A Store of Session Checkpoints Shared by Every Worker, One Expiring JSON String per Key
+    """
+
+    def __init__(self, connection, prefix:str="ina:session:"):
+        self.connection = connection
+        self.prefix = prefix
+
+    def get(self, key:str)->dict:
+        raw = self.connection.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key:str, snapshot:dict, ttl:float):
+        self.connection.set(self.prefix + key, json.dumps(snapshot), ex=max(1, int(ttl)))
+
+    def delete(self, key:str):
+        self.connection.delete(self.prefix + key)
+
+# === Object Definition ===
+class Sessions(object):
+    """Define a Sessions Object
+
+    Checkpoints of Logged-In Browser Sessions, Keyed by (env, usrId)
+    i.e. the URL, cookies, localStorage & sessionStorage a Task (e.g. SWAP USER) left, see Driver.resume
+    """
+
+    def __init__(self, store=None, ttl:float=None):
+        self.store = store or LocalStore()
+        self.ttl = ttl or config.DEFAULT_CHECKPOINT_TTL
+
+    def __str__(self):
+        return f"INA.Sessions(store={type(self.store).__name__})"
+
+    # === Getter(s) ===
+    @staticmethod
+    def key(env:str, usrId:str)->str:
+        """Get the checkpoint key of a user
+
+        Returns
+        -------
+        str
+        """
+
+        return f"{env}/{usrId}"
+
+    def get(self, key:str)->dict:
+        """Get the checkpoint of <key>
+
+        Returns
+        -------
+        dict: {"url", "cookies", "local", "session"}, None if there is none or it expired
+        """
+
+        return self.store.get(key)
+
+    # === Setter(s) ===
+    def put(self, key:str, snapshot:dict, ttl:float=None):
+        """Checkpoint <key>'s session for <ttl> seconds, by default <self.ttl>
+
+        """
+
+        self.store.set(key, snapshot, ttl or self.ttl)
+
+    def forget(self, key:str):
+        """Forget <key>'s checkpoint, e.g. once it failed its probe
+
+        """
+
+        self.store.delete(key)
+
+# === Worker Sessions ===
+SESSIONS=Sessions() if config.DEFAULT_CHECKPOINT else None
+
+def install(sessions:Sessions):
+    """Install <sessions> as this process's session checkpoints
+
+    Parameters
+    ----------
+    sessions: Sessions
+        The Sessions object, or None to disable session checkpoints
+    """
+
+    global SESSIONS
+    SESSIONS = sessions
+
+def installed()->Sessions:
+    """Get this process's session checkpoints
+
+    Returns
+    -------
+    Sessions: None if session checkpoints are disabled
+    """
+
+    return SESSIONS
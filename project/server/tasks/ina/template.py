@@ -2,6 +2,7 @@
 
 # === Import(s) ===
 # => System <=
+import html
 import datetime
 
 # === E-mail Template ===
@@ -189,6 +190,24 @@ body_content_item = lambda i,j,k,l,last: f"""\
       </tr>\n
 """
 
+# => Record Version (i.e. EXTRACTed Columns) <=
+body_content_cells = lambda cells, indent: "".join(indent + "<td>" + html.escape(cell) + "</td>\n" for cell in cells)
+
+body_content_columns = lambda fields: f"""\
+      <!-- Content Head -->
+      <tr class="heading">
+{body_content_cells(fields, " " * 8)}\
+      </tr>
+
+      <!-- Content Items -->\n
+"""
+
+body_content_record = lambda cells, last: f"""\
+      <tr class="{'item last' if last else 'item'}">
+{body_content_cells(cells, " " * 10)}\
+      </tr>\n
+"""
+
 body_content_summary = lambda status: """\
       <!-- Content Summary -->
       <tr class="summary">
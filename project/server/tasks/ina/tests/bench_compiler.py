@@ -0,0 +1,134 @@
+# project/server/tasks/ina/tests/bench_compiler.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
+from project.server.tasks.ina import models
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import re
+import time
+import argparse
+from collections import deque
+
+# => External <=
+from selenium.common import exceptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.action_chains import ActionChains
+
+# === Baseline: The Pre-Compiler Interpreter & Handlers ===
+class LegacyDriver(fixtures.FakeDriver):
+    """Define a LegacyDriver Object
+
+    The baseline dispatch path: a getattr & raw argument parsing per command, every input command performed on its own,
+    i.e. the baseline Driver's exec & handlers of the benchmarked commands, on a fake driver
+    """
+
+    def exec(self, lut:dict=None)->dict:
+        self.lut = lut
+        for cmd in self.task.cmds:
+            try: getattr(self, cmd.label.lower())(target=cmd.target, argv=cmd.argv)
+            except Exception: pass
+        return self.results
+
+    def argv_key(self)->str:
+        argv_key = "${0}"
+        while self.results.get(argv_key):
+            pattern = re.findall(const.RE_NUMERAL, argv_key)[0]
+            argv_key = argv_key.replace(pattern, str(int(pattern)+1))
+        return argv_key
+
+    def raw2keys(self, target:str)->str:
+        for replacement in re.findall(const.RE_POSITIONAL, target):
+            target = target.replace(replacement, const.KEYS[replacement])
+        return target
+
+    def scan(self, target:str)->str:
+        for placeholder in re.findall(const.RE_POSITIONAL, target):
+            value = placeholder[2:-1]
+            if value.isdigit(): target = target.replace(placeholder, self.results.get(placeholder, "N/A"))
+            else: target = target.replace(placeholder, str(self.lut.get(value, "N/F")))
+        return target
+
+    def pause(self, target:str, argv:list=None):
+        ActionChains(self.driver).pause(float(target)).perform()
+
+    def printf(self, target:str, argv:list=None):
+        key = self.argv_key()
+        self.results[key] = ""
+        if target: self.results[key] = self.scan(target)
+
+    def wait(self, target:str, argv:list)->bool:
+        operation = argv[0]
+        condition, kind = const.EXPECTED_CONDITIONS.get(argv[1])
+        res = (By.XPATH, target) if kind == "LOCATOR" else (int(target) if kind == "INTEGER" else target)
+        try:
+            if operation == const.UNTIL_NOT: WebDriverWait(self.driver, timeout=config.DEFAULT_TIMEOUT).until_not(condition(res))
+            else: WebDriverWait(self.driver, timeout=config.DEFAULT_TIMEOUT).until(condition(res))
+            return True
+        except exceptions.TimeoutException: return False
+
+    def move_by_offset(self, target:str, argv:list):
+        ActionChains(self.driver).move_by_offset(xoffset=int(argv[0]), yoffset=int(argv[1])).perform()
+
+    def send_keys(self, target:str, argv:list):
+        ac = ActionChains(self.driver)
+        for arg in argv:
+            if isinstance(arg, (list, tuple)): logic, keys = arg[0], self.raw2keys(arg[1])
+            else: logic, keys = "SEND", self.raw2keys(str(arg))
+
+            if logic == const.KEY_DOWN:
+                for key in keys: ac.key_down(key)
+            elif logic == const.KEY_UP:
+                for key in keys: ac.key_up(key)
+            else: ac.send_keys(keys)
+        ac.perform()
+
+# === Benchmark: Per-Command Interpreter Overhead ===
+def run(rows:int, repeat:int=1)->dict:
+    """Run <rows> executions of a mixed Task on a fake driver, by the baseline interpreter & compiled
+
+    Parameters
+    ----------
+    rows: int
+        The number of Task executions
+    repeat: int, optional
+        The number of runs per mode, alternating modes, the fastest is kept
+
+    Returns
+    -------
+    dict: microseconds per command keyed by mode
+    """
+
+    task = models.Task(models.Key("BENCH", "bench_compiler"), deque([
+        models.Command("pause", "0", None),
+        models.Command("send_keys", None, [["KEY_DOWN", "${SHIFT}"], "uppercase${ENTER}", ["KEY_UP", "${SHIFT}"]]),
+        models.Command("wait", "about", ["UNTIL", "TITLE_CONTAINS"]),
+        models.Command("move_by_offset", None, ["10", "20"]),
+        models.Command("printf", "static", None)
+    ]))
+
+    results = {}
+    for _ in range(repeat):
+        for mode, factory in (("interpreted", LegacyDriver), ("compiled", fixtures.FakeDriver)):
+            instance = factory("bench_compiler")
+            instance.assign(task)
+            start = time.perf_counter()
+            for _ in range(rows):
+                instance.reset()
+                instance.exec({"usrId": "bench"})
+            usec = (time.perf_counter() - start) / (rows * len(task.cmds)) * 1e6
+            results[mode] = min(usec, results.get(mode, usec))
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-command interpreter overhead on a fake driver")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat)
+    for mode, usec in results.items(): print(f"{mode:>12}: {usec:8.2f} us/command")
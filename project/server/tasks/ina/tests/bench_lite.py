@@ -0,0 +1,63 @@
+# project/server/tasks/ina/tests/bench_lite.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import driver
+from project.server.tasks.ina import lite
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import time
+import argparse
+from collections import deque
+
+# === Benchmark: Rows/Minute of a Lookup Task, Browser vs HTTP-Only ===
+def run(rows:int, browser:str=None, lite_only:bool=False)->dict:
+    """Run <rows> executions of a DGET & PRINTF lookup Task against a local fixture site
+
+    Parameters
+    ----------
+    rows: int
+        The number of Task executions
+    browser: str, optional
+        Either 'Chrome' or 'FireFox'
+    lite_only: bool, optional
+        If the browser Driver is skipped
+
+    Returns
+    -------
+    dict: rows/minute keyed by engine
+    """
+
+    with fixtures.FixtureSite({"/order": fixtures.ORDER_PAGE}) as site:
+        task = models.Task(models.Key("BENCH", "bench_lite"), deque([
+            models.Command("dget", site.url("/order?usrId=${usrId}"), None),
+            models.Command("printf", "${usrId},${//h1[@id='title']},${@//li/span[@class='status']}", None)
+        ]))
+
+        engines = [("lite", lambda: lite.LiteDriver("bench_lite"))]
+        if not lite_only: engines.append(("browser", lambda: driver.Driver("bench_lite", browser=browser)))
+
+        results = {}
+        for label, factory in engines:
+            instance = factory()
+            try:
+                instance.assign(task)
+                start = time.perf_counter()
+                for i in range(rows):
+                    instance.reset()
+                    instance.exec({"usrId": str(i)})
+                results[label] = rows / (time.perf_counter() - start) * 60
+            finally: instance.quit()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rows/minute of a lookup Task on a browser Driver vs a LiteDriver")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--browser", default=None)
+    parser.add_argument("--lite-only", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.rows, browser=args.browser, lite_only=args.lite_only)
+    for label, rate in results.items(): print(f"{label:>8}: {rate:10.1f} rows/minute")
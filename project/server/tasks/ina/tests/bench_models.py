@@ -0,0 +1,100 @@
+# project/server/tasks/ina/tests/bench_models.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import job
+
+# => System <=
+import gc
+import time
+import argparse
+import multiprocessing
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+
+# === Baseline: The Previous Key & Queue Entry ===
+@dataclass(frozen=True)
+class LegacyKey:
+    env: str
+    name: str
+
+    def __hash__(self):
+        return hash(self.env + self.name)
+
+    def __eq__(self, another):
+        return (
+            hasattr(another, "env") and self.env == another.env and
+            hasattr(another, "name") and self.name == another.name)
+
+def legacy_entry(task:models.Task, fmt:str=None, elut:dict=None, trace:bool=True)->tuple:
+    return (task, fmt, elut, trace)
+
+# === Memory: Python Allocations & RSS Growth of N Queued Rows ===
+def vmrss()->int:
+    """Get this process's resident set size, in kB (Linux only, 0 elsewhere)
+
+    """
+
+    try:
+        with open("/proc/self/status") as f:
+            return next((int(line.split()[1]) for line in f if line.startswith("VmRSS:")), 0)
+    except OSError: return 0
+
+def queued(rows:int, users:int, legacy:bool, traced:bool)->float:
+    """Queue <rows> rows of <users> users, as create_job does, as tuples & dicts if <legacy> else as Job.entry
+
+    Returns
+    -------
+    float: Bytes allocated per row if <traced>, otherwise the RSS growth in MB
+    """
+
+    entry = legacy_entry if legacy else job.Job.entry
+    task = models.Task(models.Key("BENCH", "bench_models"), deque([models.Command("printf", "${usrId},${orderId}", None)]))
+    gc.collect()
+    if traced: tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0] if traced else vmrss()
+
+    queue = deque([])
+    for i in range(rows):
+        lut = {"orderId": str(i), "status": "open"}
+        queue.append(entry(task, None, {**{"usrId": f"user{i % users}"}, **lut}, True))
+
+    if traced: return (tracemalloc.get_traced_memory()[0] - before) / rows
+    return (vmrss() - before) / 1024
+
+def isolated(*args)->float:
+    """Run 'queued' in a fresh process, i.e. w/o memory freed by a previous run
+
+    """
+
+    with multiprocessing.Pool(1) as pool: return pool.apply(queued, args)
+
+# === Time: Key Look-Ups, i.e. create_job's TASKS_DICT.get(Key(env, name)) ===
+def lookups(n:int, factory)->float:
+    """Time <n> look-ups of a new Key in a dict of 100 Task keys
+
+    Returns
+    -------
+    float: Look-ups per second
+    """
+
+    tasks = {factory("DELTA", f"TASK {i}"): i for i in range(100)}
+    start = time.perf_counter()
+    for i in range(n): tasks.get(factory("DELTA", f"TASK {i % 100}"))
+    return n / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the memory of N queued rows & the rate of Key look-ups")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=1000000)
+    args = parser.parse_args()
+
+    for mode, legacy in (("tuple + dict", True), ("Job.entry", False)):
+        per, growth = isolated(args.rows, args.users, legacy, True), isolated(args.rows, args.users, legacy, False)
+        print(f"{mode:>14}: {per:8.1f} bytes/row {growth:10.1f} MB RSS growth for {args.rows} rows")
+
+    for mode, factory in (("dataclass Key", LegacyKey), ("interned Key", models.Key)):
+        print(f"{mode:>14}: {lookups(args.lookups, factory):12.0f} look-ups/second")
@@ -0,0 +1,62 @@
+# project/server/tasks/ina/tests/bench_pool.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import pool
+from project.server.tasks.ina import job
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import time
+import argparse
+from collections import deque
+
+# === Benchmark: Jobs/Minute With & Without a Driver Pool ===
+def run(jobs:int, size:int, browser:str=None)->dict:
+    """Run <jobs> single-row Job objects against a local fixture site
+
+    Parameters
+    ----------
+    jobs: int
+        The number of Job objects to deploy
+    size: int
+        The pool size
+    browser: str, optional
+        Either 'Chrome' or 'FireFox'
+
+    Returns
+    -------
+    dict: jobs/minute keyed by mode
+    """
+
+    with fixtures.FixtureSite({"/order": fixtures.ORDER_PAGE}) as site:
+        task = models.Task(models.Key("BENCH", "bench_pool"), deque([
+            models.Command("get", site.url("/order"), None),
+            models.Command("printf", "${usrId},${//h1[@id='title']}", None)
+        ]), options={"engine": "BROWSER"})
+
+        def deploy(drivers):
+            start = time.perf_counter()
+            for i in range(jobs):
+                handler = job.Job(f"bench.{i}", browser=browser, pool=drivers)
+                handler.push(task, elut={"usrId": str(i)})
+                handler.deploy()
+                del handler
+            return jobs / (time.perf_counter() - start) * 60
+
+        results = {"cold": deploy(None)}
+        with pool.Pool(size, browser=browser) as drivers:
+            drivers.warm()
+            results["pooled"] = deploy(drivers)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark jobs/minute with & without a warm Driver pool")
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--pool", type=int, default=1)
+    parser.add_argument("--browser", default=None)
+    args = parser.parse_args()
+
+    results = run(args.jobs, args.pool, browser=args.browser)
+    for mode, rate in results.items(): print(f"{mode:>8}: {rate:8.1f} jobs/minute")
@@ -0,0 +1,126 @@
+# project/server/tasks/ina/tests/bench_tabs.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import job
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import os
+import time
+import argparse
+import threading
+from collections import deque
+
+# === Memory: RSS of this Process's Descendants (i.e. WebDrivers & Browsers), Linux Only ===
+def descendants(pid:int)->list:
+    """Get the PIDs of every descendant process of <pid>, via /proc
+
+    """
+
+    parents = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit(): continue
+        try:
+            with open(f"/proc/{name}/stat") as f: stat = f.read()
+        except OSError: continue
+        parents.setdefault(int(stat.rsplit(")", 1)[1].split()[1]), []).append(int(name))
+
+    res = []; stack = [pid]
+    while stack:
+        children = parents.get(stack.pop(), [])
+        res.extend(children); stack.extend(children)
+    return res
+
+def rss(pids:list)->int:
+    """Get the total resident set size of <pids>, in kB
+
+    """
+
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                total += next((int(line.split()[1]) for line in f if line.startswith("VmRSS:")), 0)
+        except OSError: continue
+    return total
+
+class Sampler(threading.Thread):
+    """Define a Sampler Object
+
+    The Peak RSS of this Process's Descendants, Sampled Every <interval> Seconds
+    """
+
+    def __init__(self, interval:float=0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval): self.peak = max(self.peak, rss(descendants(os.getpid())))
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stopped.set()
+        self.join()
+
+# === Benchmark: Rows/Minute & RSS of N Tabs in a Single Browser vs N Drivers ===
+def run(rows:int, n:int, delay:float, browser:str=None)->dict:
+    """Run <rows> executions of a DGET & PRINTF lookup Task against a local fixture site, whose pages take <delay> seconds,
+    on <n> tabs of a single Driver (i.e. a single usrId shard) & on <n> Drivers (i.e. a usrId per row)
+
+    Parameters
+    ----------
+    rows: int
+        The number of Task executions
+    n: int
+        The number of tabs or Drivers
+    delay: float
+        The page latency, in seconds
+    browser: str, optional
+        Either 'Chrome' or 'FireFox'
+
+    Returns
+    -------
+    dict: (rows/minute, peak RSS in MB) keyed by mode
+    """
+
+    def order(path:str)->str:
+        time.sleep(delay)
+        return fixtures.ORDER_PAGE
+
+    with fixtures.FixtureSite({"/order": order}) as site:
+        task = models.Task(models.Key("BENCH", "bench_tabs"), deque([
+            models.Command("dget", site.url("/order?orderId=${orderId}"), None),
+            models.Command("printf", "${orderId},${//h1[@id='title']}", None)
+        ]), options={"engine": "BROWSER"})
+
+        def deploy(handler:job.Job, usrId)->tuple:
+            for i in range(rows): handler.push(task, fmt="${0}", elut={"usrId": usrId(i), "orderId": str(i)})
+            with Sampler() as sampler:
+                start = time.perf_counter()
+                handler.deploy()
+                rate = rows / (time.perf_counter() - start) * 60
+            if handler.driver: handler.driver.quit()
+            return rate, sampler.peak / 1024
+
+        return {
+            f"{n} tabs": deploy(job.Job("bench.tabs", browser=browser, tabs=n), lambda i: "bench"),
+            f"{n} drivers": deploy(job.Job("bench.drivers", browser=browser, parallelism=n), lambda i: str(i))
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rows/minute & peak RSS of N tabs in a single browser vs N Drivers")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--n", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.5)
+    parser.add_argument("--browser", default=None)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.n, args.delay, browser=args.browser)
+    for mode, (rate, peak) in results.items(): print(f"{mode:>10}: {rate:10.1f} rows/minute {peak:10.1f} MB peak RSS")
@@ -0,0 +1,90 @@
+# project/server/tasks/ina/tests/bench_waits.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
+from project.server.tasks.ina import driver
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import random
+import argparse
+import statistics
+
+# => External <=
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+# === Benchmark: Wait Latency, In-Page Observer vs WebDriverWait Polling ===
+DELAYED_PAGE = """\
+<!doctype html>
+<html>
+<head><title>Delayed</title></head>
+<body>
+  <div id="root"></div>
+  <script>
+    var delay = parseInt(new URLSearchParams(window.location.search).get("delay") || "0", 10);
+    window.__inaStart = performance.now();
+    setTimeout(function () {
+      var div = document.createElement("div");
+      div.id = "late";
+      div.textContent = "Late";
+      document.getElementById("root").appendChild(div);
+      window.__inaInserted = performance.now() - window.__inaStart;
+    }, delay);
+  </script>
+</body>
+</html>
+"""
+
+ENGINES = (
+    ("poll (0.5s)", const.WAIT_POLL, 0.5),                      # i.e. the WebDriverWait default
+    (f"poll ({config.DEFAULT_POLL}s)", const.WAIT_POLL, config.DEFAULT_POLL),
+    ("observer", const.WAIT_OBSERVER, config.DEFAULT_POLL)
+)
+
+def run(samples:int, max_delay:int, browser:str=None)->dict:
+    """Wait for an element inserted after a random delay, once per sample & per wait engine
+
+    Parameters
+    ----------
+    samples: int
+        The number of waits per engine
+    max_delay: int
+        The maximum insertion delay, in milliseconds
+    browser: str, optional
+        Either 'Chrome' or 'FireFox'
+
+    Returns
+    -------
+    dict: (median, p95) latency in milliseconds past the insertion, keyed by engine
+    """
+
+    engine, poll = config.DEFAULT_WAIT_ENGINE, config.DEFAULT_POLL
+    delays = [random.randint(0, max_delay) for _ in range(samples)]
+    results = {}
+    with fixtures.FixtureSite({"/delayed": DELAYED_PAGE}) as site, driver.Driver("bench_waits", browser=browser) as instance:
+        try:
+            for label, wait_engine, wait_poll in ENGINES:
+                config.DEFAULT_WAIT_ENGINE, config.DEFAULT_POLL = wait_engine, wait_poll
+                latencies = []
+                for delay in delays:
+                    instance.get(site.url(f"/delayed?delay={delay}"), [const.READY_NONE])
+                    instance.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//div[@id='late']"))
+                    elapsed, inserted = instance.driver.execute_script("return [performance.now() - window.__inaStart, window.__inaInserted];")
+                    latencies.append(elapsed - inserted)
+                latencies.sort()
+                results[label] = (statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1])
+        finally: config.DEFAULT_WAIT_ENGINE, config.DEFAULT_POLL = engine, poll
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the wait latency of the in-page observer vs WebDriverWait polling")
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--max-delay", type=int, default=1000)
+    parser.add_argument("--browser", default=None)
+    args = parser.parse_args()
+
+    results = run(args.samples, args.max_delay, browser=args.browser)
+    for label, (median, p95) in results.items(): print(f"{label:>12}: median {median:7.1f} ms, p95 {p95:7.1f} ms past insertion")
@@ -0,0 +1,384 @@
+# project/server/tasks/ina/tests/fixtures.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import utils
+from project.server.tasks.ina import driver
+
+# => System <=
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+# => External <=
+from selenium.common import exceptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+# === Fake WebDriver ===
+ELEMENT_KEY="element-6066-11e4-a52e-4f735466cecf"   # a W3C element reference
+
+class FakeElement(WebElement):
+    """Define a FakeElement Object
+
+    A Stand-In For a Selenium WebElement (i.e. accepted by ActionChains)
+    """
+
+    def __init__(self, parent, xpath:str, text:str):
+        super().__init__(parent, f"{xpath}#{text}@{parent.document}", w3c=True)
+        parent.issued.add(parent.document)
+        self.xpath = xpath
+        self._text = text
+
+    @property
+    def text(self)->str:
+        return self._text
+
+    def is_displayed(self)->bool:
+        return True
+
+    def is_enabled(self)->bool:
+        return True
+
+class FakeSwitchTo(object):
+    """Define a FakeSwitchTo Object
+
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+
+    def window(self, handle:str):
+        self.parent.calls.append(("switch_to.window", handle))
+        self.parent.urls[self.parent.handle] = self.parent.url
+        self.parent.handle = handle
+        self.parent.url = self.parent.urls.get(handle, self.parent.url)
+
+class FakeWebDriver(object):
+    """Define a FakeWebDriver Object
+
+    A Stand-In For a Selenium WebDriver, every call is recorded in 'calls'
+    'pages' maps a URL to a dict of XPATH => list of texts
+    Elements found before the last navigation (or 'rerender') are stale
+    Cookies are kept per origin, an HTTP(S) origin starts w/ a session cookie
+    """
+
+    w3c = True
+
+    def __init__(self, pages:dict=None):
+        self.pages = pages or {}
+        self.calls = []
+        self.waits = []
+        self.url = "about:blank"
+        self.document = 0
+        self.handles = ["window-0"]
+        self.handle = "window-0"
+        self.urls = {}      # the URL of every other tab, keyed by window handle
+        self.jar = {}           # the cookies of every origin, see 'cookies'
+        self.issued = set()     # the documents elements were found on, see 'stale'
+        self.switch_to = FakeSwitchTo(self)
+
+    # === Getter(s) ===
+    @property
+    def current_url(self)->str:
+        self.calls.append(("current_url",))
+        return self.url
+
+    @property
+    def cookies(self)->list:
+        origin = utils.origin(self.url)
+        return self.jar.setdefault(origin, [{"name": "session", "value": "fake"}] if origin else [])
+
+    @cookies.setter
+    def cookies(self, cookies:list):
+        self.jar[utils.origin(self.url)] = cookies
+
+    @property
+    def title(self)->str:
+        return self.url
+
+    @property
+    def page_source(self)->str:
+        return f"<html>{self.url}</html>"
+
+    @property
+    def current_window_handle(self)->str:
+        self.calls.append(("current_window_handle",))
+        return self.handle
+
+    @property
+    def window_handles(self)->list:
+        self.calls.append(("window_handles",))
+        return list(self.handles)
+
+    def texts(self, xpath:str)->list:
+        return self.pages.get(self.url, {}).get(xpath, [])
+
+    # === Functional ===
+    def outdated(self)->bool:
+        return len(self.issued) > 1 or (bool(self.issued) and self.document not in self.issued)
+
+    def stale(self, params)->bool:
+        if isinstance(params, dict): 
+            if ELEMENT_KEY in params: return not params[ELEMENT_KEY].endswith(f"@{self.document}")
+            return any(self.stale(value) for value in params.values())
+        if isinstance(params, (list, tuple)): return any(self.stale(value) for value in params)
+        return False
+
+    def execute(self, command:str, params:dict=None):
+        self.calls.append(("execute", command))
+        # only scanned once an element of a previous document exists, i.e. w/o adding to every command's cost
+        if self.outdated() and self.stale(params): raise exceptions.StaleElementReferenceException(command)
+        return {"value": None}
+
+    def rerender(self):
+        self.document += 1
+
+    def set_script_timeout(self, seconds:float):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script:str, *args):
+        self.calls.append(("execute_async_script", script))
+        if script == const.JS_FIND_TEXTS: return {xpath: self.texts(xpath) for xpath in args[0]}
+        if script == const.JS_READY: return True
+        if script == const.JS_EXTRACT: 
+            scope = args[1] or ""
+            return {name: self.texts(scope + selector[1:] if scope and selector.startswith(".") else selector) for name, kind, selector in args[0]}
+        if script == const.JS_WAIT:
+            self.waits.append(args)
+            return self.observe(*args[:4])
+        return None
+
+    def observe(self, name:str, until:bool, target, value=None)->dict:
+        if name.startswith(("TITLE", "URL")):
+            res = (target == self.url) if name.endswith(("_IS", "_TO_BE")) else (target in self.url)
+        elif isinstance(target, str):
+            elems = [FakeElement(self, target, text) for text in self.texts(target)]
+            if name.startswith("INVISIBILITY"): res = not elems
+            elif "_ALL_" in name or "_ANY_" in name: res = elems or False
+            else: res = elems[0] if elems else False
+        else: res = target is not None
+
+        ok = bool(res) if until else not res
+        return {"ok": ok, "value": res if ok and until and res is not True else None}
+
+    def execute_script(self, script:str, *args):
+        self.calls.append(("execute_script", script))
+        if script == "return document.readyState": return "complete"
+        if script == const.JS_OPEN_TAB:
+            handle = f"window-{len(self.calls)}"
+            self.handles.append(handle)
+            self.urls[handle] = args[0]
+        if script == const.JS_DUMP_STORAGE: return {"local": {"token": "fake"}, "session": {}}
+        if script == const.JS_NAVIGATE:
+            self.url = args[0]
+            self.document += 1
+        return None
+
+    def get(self, url:str):
+        self.calls.append(("get", url))
+        self.url = url
+        self.document += 1
+
+    def refresh(self):
+        self.calls.append(("refresh",))
+        self.document += 1
+
+    def close(self):
+        self.calls.append(("close", self.handle))
+        self.handles.remove(self.handle)
+
+    def delete_all_cookies(self):
+        self.calls.append(("delete_all_cookies",))
+        self.cookies = []
+
+    def get_cookies(self)->list:
+        self.calls.append(("get_cookies",))
+        return [dict(cookie) for cookie in self.cookies]
+
+    def add_cookie(self, cookie:dict):
+        self.calls.append(("add_cookie", cookie["name"]))
+        self.cookies.append(dict(cookie))
+
+    def quit(self):
+        self.calls.append(("quit",))
+
+    def find_element(self, by=By.XPATH, value:str=None):
+        self.calls.append(("find_element", value))
+        texts = self.texts(value)
+        if not texts: raise exceptions.NoSuchElementException(value)
+        return FakeElement(self, value, texts[0])
+
+    def find_elements(self, by=By.XPATH, value:str=None)->list:
+        self.calls.append(("find_elements", value))
+        return [FakeElement(self, value, text) for text in self.texts(value)]
+
+    def find_element_by_xpath(self, xpath:str):
+        return self.find_element(By.XPATH, xpath)
+
+    def find_elements_by_xpath(self, xpath:str)->list:
+        return self.find_elements(By.XPATH, xpath)
+
+class FakeDriver(driver.Driver):
+    """Define a FakeDriver Object
+
+    An INA Driver Backed By a FakeWebDriver
+    """
+
+    PAGES = {}
+
+    def geckodriver(self):
+        return FakeWebDriver(self.PAGES)
+
+    def chromedriver(self):
+        return FakeWebDriver(self.PAGES)
+
+# === Fake Redis ===
+class FakePipeline(object):
+    """Define a FakePipeline Object
+
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.ops = []
+
+    def __getattr__(self, name:str):
+        return lambda *args: self.ops.append((name, args))
+
+    def execute(self)->list:
+        return [getattr(self.parent, name)(*args) for name, args in self.ops]
+
+class FakeRedis(object):
+    """Define a FakeRedis Object
+
+    A Stand-In For a redis.Redis Connection, Limited to the Hash, Set, String & List Commands Used By INA & Its Router
+    Values are returned as bytes, like redis-py
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self)->FakePipeline:
+        return FakePipeline(self)
+
+    def hincrby(self, name:str, key:str, amount:int=1)->int:
+        value = self.data.setdefault(name, {})
+        value[key.encode()] = value.get(key.encode(), 0) + amount
+        return value[key.encode()]
+
+    def hgetall(self, name:str)->dict:
+        return {key: str(count).encode() for key, count in self.data.get(name, {}).items()}
+
+    def sadd(self, name:str, *values)->int:
+        value = self.data.setdefault(name, set())
+        value.update(v.encode() for v in values)
+        return len(values)
+
+    def smembers(self, name:str)->set:
+        return set(self.data.get(name, set()))
+
+    def srem(self, name:str, *values)->int:
+        self.data.get(name, set()).difference_update(v.encode() for v in values)
+        return len(values)
+
+    def delete(self, *names)->int:
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    def exists(self, *names)->int:
+        return sum(name in self.data or (isinstance(name, bytes) and name.decode() in self.data) for name in names)
+
+    def llen(self, name:str)->int:
+        return len(self.data.get(name, []))
+
+    def get(self, name:str)->bytes:
+        value = self.data.get(name)
+        return value.encode() if isinstance(value, str) else value
+
+    def set(self, name:str, value:str, ex:int=None)->bool:
+        self.data[name] = value
+        self.expiry = getattr(self, "expiry", {}); self.expiry[name] = ex
+        return True
+
+# === Fixture Site ===
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Define a FixtureHandler Object
+
+    Serve the HTML pages of the owning FixtureSite
+    """
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        body = self.server.pages.get(path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if callable(body): body = body(self.path)
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class FixtureServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+class FixtureSite(object):
+    """Define a FixtureSite Object
+
+    A Local HTTP Server For Benchmarks, Serves <pages> (i.e. path => HTML or callable(path) => HTML)
+    """
+
+    def __init__(self, pages:dict):
+        self.server = FixtureServer(("127.0.0.1", 0), FixtureHandler)
+        self.server.pages = pages
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def url(self, path:str="/")->str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}{path}"
+
+ORDER_PAGE = """\
+<!doctype html>
+<html>
+<head><title>Order</title></head>
+<body>
+  <h1 id="title">Order</h1>
+  <ul id="orders">
+    <li class="order"><span class="id">A-1</span><span class="status">Approved</span></li>
+    <li class="order"><span class="id">A-2</span><span class="status">Pending</span></li>
+    <li class="order"><span class="id">A-3</span><span class="status">Approved</span></li>
+  </ul>
+  <input name="q" type="text">
+</body>
+</html>
+"""
+
+def list_page(orders:list, next_page:str=None)->str:
+    """Render a page of orders, w/ a next page link if any
+
+    """
+
+    items = "".join(f'<li class="order"><span class="id">{i}</span><span class="status">{status}</span></li>' for i, status in orders)
+    link = f'<a class="next" href="{next_page}">Next</a>' if next_page else ""
+    return f"<!doctype html><html><head><title>Orders</title></head><body><ul>{items}</ul>{link}</body></html>"
+
+LIST_PAGES = {
+    "/orders/1": list_page([("A-1", "Approved"), ("A-2", "Pending")], "/orders/2"),
+    "/orders/2": list_page([("A-3", "Approved")])
+}
@@ -0,0 +1,132 @@
+# project/server/tasks/ina/tests/test_compiler.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
+from project.server.tasks.ina import models
+from project.server.tasks.ina import compiler
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# => External <=
+from selenium.webdriver.common.by import By
+
+# === Test Object ===
+class TestCompiler(unittest.TestCase):
+
+    def test_compile_command(self):
+        instr = compiler.compile_command(models.Command("PAUSE", "1.5", None))
+        self.assertEqual((instr.op, instr.args), ("pause", (1.5, None)))
+
+        instr = compiler.compile_command(models.Command("send_keys", None, [["KEY_DOWN", "${SHIFT}"], "a${ENTER}"]))
+        self.assertEqual(instr.op, "send_key_actions")
+        self.assertEqual(instr.args[1], (("KEY_DOWN", const.KEYS["${SHIFT}"]), ("SEND", "a" + const.KEYS["${ENTER}"])))
+
+        instr = compiler.compile_command(models.Command("wait", "//div", ["UNTIL", "PRESENCE_OF_ELEMENT_LOCATED"]))
+        self.assertEqual(instr.op, "wait_for")
+        self.assertEqual(instr.args[2:], ("LOCATOR", (By.XPATH, "//div"), None))
+
+        instr = compiler.compile_command(models.Command("wait", "//div", ["UNTIL", "TEXT_TO_BE_PRESENT_IN_ELEMENT", "Approved"]))
+        self.assertEqual(instr.args[4], "Approved")
+
+        instr = compiler.compile_command(models.Command("move_by_offset", None, ["10", 20]))
+        self.assertEqual(instr.args, (None, (10, 20)))
+
+    def test_compile_fallback(self):
+        instr = compiler.compile_command(models.Command("pause", "soon", None))
+        self.assertEqual((instr.op, instr.args), ("pause", ("soon", None)))
+
+        instr = compiler.compile_command(models.Command("wait", "//div", ["UNTIL", "NOT_A_CONDITION"]))
+        self.assertEqual(instr.op, "wait")
+
+    def test_compile_navigation(self):
+        instr = compiler.compile_command(models.Command("get", "https://www.google.com/", None))
+        self.assertEqual(instr.args, ("https://www.google.com/", config.DEFAULT_READINESS))
+
+        instr = compiler.compile_command(models.Command("dget", "${url}", ["NETWORK_IDLE"]))
+        self.assertEqual(instr.args, ("${url}", ("NETWORK_IDLE", config.DEFAULT_IDLE)))
+
+        instr = compiler.compile_command(models.Command("pause", 3.0, None), {"pause": "BOUND"})
+        self.assertEqual((instr.op, instr.args), ("settle", (3.0, None)))
+
+    def test_compile_critical(self):
+        self.assertEqual(compiler.compile_command(models.Command("get", "https://a/", None)).critical, False)
+        self.assertEqual(compiler.compile_command(models.Command("get", "https://a/", None, True)).critical, True)
+        self.assertEqual(compiler.compile_command(models.Command("unknown", None, None), {"fail_fast": True}).critical, True)
+
+    def test_compile_task(self):
+        task = models.Task(models.Key("TEST", "test_compile_task"), deque([models.Command("get", "https://www.google.com/", None)]))
+        program = compiler.compile_task(task)
+        self.assertIs(task.program, program)
+
+        task.push(models.Command("printf", "${usrId}", None))
+        self.assertEqual(task.program, None)
+
+    def test_exec(self):
+        instance = fixtures.FakeDriver("test_exec")
+        task = models.Task(models.Key("TEST", "test_exec"), deque([
+            models.Command("pause", "0", None),
+            models.Command("send_keys", None, ["${ENTER}"]),
+            models.Command("unknown", None, None),
+            models.Command("printf", "Hello ${usrId}", None)
+        ]))
+        instance.assign(task)
+        self.assertEqual(len(instance.program), 4)
+        self.assertEqual(instance.program[2][0], instance.nop)
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut["${0}"], "Hello Edward")
+
+    def test_link(self):
+        task = models.Task(models.Key("TEST", "test_link"), deque([
+            models.Command("if_present", "//div[@id='banner']", None),
+            models.Command("click", "//div[@id='banner']/button", None),
+            models.Command("else", None, None),
+            models.Command("if_not_present", "//h1", None),
+            models.Command("printf", "N/F", None),
+            models.Command("end", None, None),
+            models.Command("end", None, None),
+            models.Command("click", "//button", None, optional=True)
+        ]))
+        program = compiler.compile_task(task)
+        self.assertEqual([instr.op for instr in program], ["branch", "click", "jump", "branch", "printf", "nop", "nop", "branch", "click"])
+        self.assertEqual(program[0].args, ("//div[@id='banner']", True, 3))
+        self.assertEqual(program[2].args, (7,))
+        self.assertEqual(program[3].args, ("//h1", False, 6))
+        self.assertEqual(program[7].args, ("//button", True, 9))
+
+        for cmds in (["if_present", "else", "else", "end"], ["if_present"], ["end"]):
+            task = models.Task(models.Key("TEST", "test_link"), deque([models.Command(label, "//h1", None) for label in cmds]))
+            self.assertRaises(ValueError, compiler.compile_task, task)
+
+    def test_link_loops(self):
+        task = models.Task(models.Key("TEST", "test_link_loops"), deque([
+            models.Command("paginate", "//a[@class='next']", ["5"]),
+            models.Command("for_each", "//li", None),
+            models.Command("printf", "${./span}", None),
+            models.Command("end", None, None),
+            models.Command("end", None, None)
+        ]))
+        program = compiler.compile_task(task)
+        self.assertEqual([instr.op for instr in program], ["paginate", "for_each", "printf", "next", "turn"])
+        self.assertEqual((program[0].args, program[1].args), (("//a[@class='next']", 5, 5), ("//li", 4)))
+        self.assertEqual((program[3].args, program[4].args), ((1,), (0,)))
+
+        task.push(models.Command("else", None, None))
+        task.push(models.Command("end", None, None))
+        self.assertRaises(ValueError, compiler.compile_task, task)
+
+    def test_optional(self):
+        task = models.Task(models.Key("TEST", "test_optional"), deque([
+            models.Command("click", "//button", None, critical=True, optional=True),
+            models.Command("printf", "${usrId}", None, optional=True)
+        ]), options={"fail_fast": True})
+        program = compiler.compile_task(task)
+        self.assertEqual([instr.critical for instr in program], [False, False, False])
+
+if __name__ == "__main__":
+    unittest.main()
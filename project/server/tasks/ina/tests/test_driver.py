@@ -2,13 +2,22 @@
 
 # === Import(s) ===
 # => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
 from project.server.tasks.ina import models
 from project.server.tasks.ina import driver
+from project.server.tasks.ina import compiler
+from project.server.tasks.ina.tests import fixtures
 
 # => System <=
+import time
 import unittest
 from collections import deque
 
+# => External <=
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
 # === Test Object ===
 class TestDriver(unittest.TestCase):
     
@@ -79,5 +88,266 @@ class TestDriver(unittest.TestCase):
         ilut = instance.exec({"usrId": "Edward", "orderId": "###3###542"})
         print(ilut["SNAPSHOTS"])
 
+    def test_scan_batch(self):
+        instance = fixtures.FakeDriver("test_scan_batch")
+        instance.driver.pages["https://orders/"] = {
+            "//h1": ["Order"],
+            "//li/span[@class='id']": ["A-1", "A-2"],
+            "//li/span[@class='status']": ["Approved", "Pending"]
+        }
+        task = models.Task(models.Key("TEST", "test_scan_batch"), deque([
+            models.Command("get", "https://orders/", None),
+            models.Command("printf", "${usrId},${//h1},${//li/span[@class='id']},${@//li/span[@class='status']},${//missing}", None)
+        ]))
+        instance.assign(task)
+        
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut["${0}"], "Edward,Order,A-1,Approved; Pending,N/F")
+        scripts = [call for call in instance.driver.calls if call == ("execute_async_script", const.JS_FIND_TEXTS)]
+        self.assertEqual(len(scripts), 1)
+
+    def test_wait_observer(self):
+        instance = fixtures.FakeDriver("test_wait_observer")
+        instance.driver.pages["https://orders/"] = {"//h1": ["Order"]}
+        instance.driver.get("https://orders/")
+        
+        elem = instance.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//h1"))
+        self.assertEqual(elem.text, "Order")
+        self.assertEqual(instance.wait_for(const.UNTIL_NOT, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//missing")), True)
+        self.assertEqual(instance.wait("orders", ["UNTIL", "URL_CONTAINS"]), True)
+        
+        scripts = [call for call in instance.driver.calls if call == ("execute_async_script", const.JS_WAIT)]
+        self.assertEqual(len(scripts), 3)
+        self.assertEqual([call for call in instance.driver.calls if call[0] == "find_element"], [])
+
+    def test_wait_poll(self):
+        instance = fixtures.FakeDriver("test_wait_poll")
+        self.assertEqual(instance.wait("1", ["UNTIL", "NUMBER_OF_WINDOWS_TO_BE"]), True)
+
+        engine = config.DEFAULT_WAIT_ENGINE
+        config.DEFAULT_WAIT_ENGINE = const.WAIT_POLL
+        try: self.assertEqual(instance.wait(const.BLANK, ["UNTIL", "URL_TO_BE"]), True)
+        finally: config.DEFAULT_WAIT_ENGINE = engine
+        
+        self.assertNotIn(("execute_async_script", const.JS_WAIT), instance.driver.calls)
+
+    def test_optimistic_lookup(self):
+        instance = fixtures.FakeDriver("test_optimistic_lookup")
+        instance.driver.pages["https://orders/"] = {"//button": ["Submit"]}
+        instance.driver.get("https://orders/")
+        instance.assign(models.Task(models.Key("TEST", "test_optimistic_lookup"), deque([])))
+
+        instance.click("//button")
+        self.assertEqual([call for call in instance.driver.calls if call[0] in ("find_element", "execute_async_script")], [("find_element", "//button")])
+        self.assertEqual(instance.metrics[const.METRIC_SAVED_ROUND_TRIPS], 1)
+
+        instance.driver.calls.clear()
+        self.assertEqual(instance.find_element_by_xpath("//missing"), None)
+        self.assertEqual(instance.driver.calls, [("find_element", "//missing"), ("execute_async_script", const.JS_WAIT)])
+        self.assertEqual(instance.metrics[const.METRIC_SAVED_ROUND_TRIPS], 1)
+
+    def test_fail_fast(self):
+        instance = fixtures.FakeDriver("test_fail_fast")
+        cmds = [models.Command("click", "//missing", None, True), models.Command("printf", "after", None)]
+        instance.assign(models.Task(models.Key("TEST", "test_fail_fast"), deque(cmds)))
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(list(ilut), [const.FAILV])
+        self.assertIn("find_element_by_xpath", ilut[const.FAILV])
+        self.assertEqual(instance.metrics[const.METRIC_FAILURES], 1)
+
+        instance.assign(models.Task(models.Key("TEST", "test_fail_slow"), deque([models.Command("click", "//missing", None)] + cmds[1:])))
+        self.assertEqual(instance.exec({"usrId": "Edward"}), {"${0}": "after"})
+
+    def test_deadline(self):
+        instance = fixtures.FakeDriver("test_deadline")
+        instance.assign(models.Task(models.Key("TEST", "test_deadline"), deque([
+            models.Command("printf", "before", None),
+            models.Command("printf", "after", None)
+        ]), options={"budget": 1e-9}))
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut["${0}"], "before")
+        self.assertTrue(ilut[const.FAILV].startswith("FAILURE: deadline exceeded"))
+        self.assertEqual(instance.budget(), config.DEFAULT_TIMEOUT)
+
+        # the deadline only aborts the commands left
+        instance.assign(models.Task(models.Key("TEST", "test_deadline_last"), deque([
+            models.Command("printf", "only", None)
+        ]), options={"budget": 1e-9}))
+        self.assertEqual(instance.exec({"usrId": "Edward"}), {"${0}": "only"})
+
+    def test_blocks(self):
+        instance = fixtures.FakeDriver("test_blocks")
+        instance.driver.pages["https://orders/"] = {"//h1": ["Order"], "//div[@id='banner']/button": ["Accept"]}
+        instance.driver.get("https://orders/")
+        instance.assign(models.Task(models.Key("TEST", "test_blocks"), deque([
+            models.Command("if_present", "//div[@id='banner']/button", None),
+            models.Command("click", "//div[@id='banner']/button", None),
+            models.Command("end", None, None),
+            models.Command("if_not_present", "//h1", None),
+            models.Command("printf", "N/F", None),
+            models.Command("else", None, None),
+            models.Command("printf", "${//h1}", None),
+            models.Command("end", None, None),
+            models.Command("click", "//missing", None, optional=True),
+            models.Command("printf", "done", None)
+        ]), options={"fail_fast": True}))
+
+        start = time.monotonic()
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut, {"${0}": "Order", "${1}": "done"})
+        self.assertLess(time.monotonic() - start, config.DEFAULT_TIMEOUT)
+        self.assertEqual(instance.driver.calls.count(("execute", "actions")), 1)
+        self.assertEqual(instance.driver.calls[-1], ("find_element", "//missing"))
+
+    def test_for_each(self):
+        instance = fixtures.FakeDriver("test_for_each")
+        instance.driver.pages["https://orders/"] = {
+            "//li": ["A-1 Approved", "A-2 Pending"], 
+            "(//li)[1]/span": ["A-1"], "(//li)[2]/span": ["A-2"], "(//li)[2]/b": ["New"]
+        }
+        instance.driver.get("https://orders/")
+        instance.assign(models.Task(models.Key("TEST", "test_for_each"), deque([
+            models.Command("printf", "before", None),
+            models.Command("for_each", "//li", None),
+            models.Command("printf", "${./span}", None),
+            models.Command("if_present", "./b", None),
+            models.Command("printf", "${./b}", None),
+            models.Command("end", None, None),
+            models.Command("end", None, None),
+            models.Command("for_each", "//missing", None),
+            models.Command("printf", "never", None),
+            models.Command("end", None, None),
+            models.Command("printf", "after", None)
+        ])))
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(instance.rows, [{"${0}": "before", "${1}": "A-1"}, {"${0}": "before", "${1}": "A-2", "${2}": "New"}])
+        self.assertEqual(ilut, {"${0}": "before", "${1}": "after"})
+        self.assertEqual((instance.loops, instance.scope), ([], None))
+
+    def test_extract(self):
+        instance = fixtures.FakeDriver("test_extract")
+        instance.driver.pages["https://orders/"] = {
+            "//h1": ["Order, Inc."], "//li": ["A-1", "A-2"], "(//li)[1]/span": ["Approved"], "(//li)[2]/span": ["Pending"]
+        }
+        instance.driver.get("https://orders/")
+        instance.assign(models.Task(models.Key("TEST", "test_extract"), deque([
+            models.Command("extract", {"title": "//h1", "ids": "@//li", "memo": "//missing"}, None),
+            models.Command("printf", "${@}", None),
+            models.Command("for_each", "//li", None),
+            models.Command("extract", {"status": "./span"}, None),
+            models.Command("end", None, None)
+        ])))
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut[const.RECORDV], {"title": "Order, Inc.", "ids": ["A-1", "A-2"], "memo": None})
+        self.assertEqual(ilut["${0}"], "")
+        self.assertEqual([row[const.RECORDV]["status"] for row in instance.rows], ["Approved", "Pending"])
+        self.assertEqual(len([call for call in instance.driver.calls if call == ("execute_async_script", const.JS_EXTRACT)]), 3)
+
+    def test_fused_actions(self):
+        instance = fixtures.FakeDriver("test_fused_actions")
+        instance.driver.pages["https://search/"] = {"//input[@name='q']": [""], "//button": ["Search"]}
+        instance.driver.get("https://search/")
+        instance.assign(models.Task(models.Key("TEST", "test_fused_actions"), deque([
+            models.Command("send_keys", "//input[@name='q']", ["A beautiful mind", ["KEY_DOWN", "${SHIFT}"], "uppercase", ["KEY_UP", "${SHIFT}"]]),
+            models.Command("send_keys", None, ["review"]),
+            models.Command("click", "//input[@name='q']", None),
+            models.Command("click", "//button", None),
+            models.Command("send_keys", None, ["${ENTER}"]),
+            models.Command("printf", "done", None)
+        ])))
+
+        ilut = instance.exec({"usrId": "Edward"})
+        calls = [call for call in instance.driver.calls if call[0] in ("find_element", "execute")]
+        self.assertEqual(calls, [
+            ("find_element", "//input[@name='q']"), ("execute", "actions"), 
+            ("find_element", "//button"), ("execute", "actions")])
+        self.assertEqual(instance.metrics[const.METRIC_FUSED_ACTIONS], 3)
+        self.assertEqual(ilut, {"${0}": "done"})
+
+        # a PAUSE is fused w/ the input commands that follow it
+        instance.driver.calls.clear()
+        instance.assign(models.Task(models.Key("TEST", "test_fused_pause"), deque([
+            models.Command("pause", "0.0", None),
+            models.Command("send_keys", None, ["review"]),
+            models.Command("printf", "done", None)
+        ])))
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual([call for call in instance.driver.calls if call[0] == "execute"], [("execute", "actions")])
+
+    def test_prebuilt_typing(self):
+        instance = fixtures.FakeDriver("test_prebuilt_typing")
+        instance.discard()
+        instance.fusing = True
+        actions = compiler.raw2actions([["KEY_DOWN", "${SHIFT}${ALT}"], "a${ENTER}", ["KEY_UP", "${SHIFT}${ALT}"]])
+        encode = lambda chain: [{key: value for key, value in device.encode().items() if key != "id"} for device in chain.w3c_actions.devices]
+
+        # the pre-built key interactions encode as the ones an ActionChains builds per key, w/ & w/o an element
+        for elem in (None, fixtures.FakeElement(instance.driver, "//input", "")):
+            instance.perform_key_actions(elem, actions, compiler.actions2typing(actions))
+            prebuilt = encode(instance.chain)
+            instance.discard()
+            instance.perform_key_actions(elem, actions)
+            self.assertEqual(prebuilt, encode(instance.chain))
+            instance.discard()
+
+    def test_element_cache(self):
+        instance = fixtures.FakeDriver("test_element_cache")
+        instance.driver.pages["https://search/"] = {"//input[@name='q']": [""], "//button": ["Search"]}
+        instance.get("https://search/")
+        instance.assign(models.Task(models.Key("TEST", "test_element_cache"), deque([
+            models.Command("send_keys", "//input[@name='q']", ["A beautiful mind"]),
+            models.Command("printf", "typed", None),
+            models.Command("send_keys", "//input[@name='q']", ["${ENTER}"]),
+            models.Command("click", "//button", None)
+        ])))
+
+        finds = lambda: [call for call in instance.driver.calls if call[0] == "find_element"]
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(finds(), [("find_element", "//input[@name='q']"), ("find_element", "//button")])
+        self.assertEqual((instance.metrics[const.METRIC_ELEMENT_CACHE_HITS], instance.metrics[const.METRIC_ELEMENT_CACHE_MISSES]), (1, 2))
+
+        # the page re-rendered w/o a navigation: the stale elements are re-found & their chain performed once
+        instance.driver.rerender()
+        instance.reset()
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut, {"${0}": "typed"})
+        self.assertEqual(len(finds()), 4)
+        self.assertEqual(instance.metrics[const.METRIC_STALE_ELEMENTS], 1)
+        self.assertEqual(instance.driver.calls[-1], ("execute", "actions"))
+
+        instance.get("https://search/")
+        self.assertEqual(len(instance.elements), 0)
+
+        config.DEFAULT_ELEMENT_CACHE, size = 1, config.DEFAULT_ELEMENT_CACHE
+        try:
+            instance.element("//input[@name='q']"); instance.element("//button")
+            self.assertEqual(list(instance.elements), ["//button"])
+        finally: config.DEFAULT_ELEMENT_CACHE = size
+
+    def test_revisit(self):
+        instance = fixtures.FakeDriver("test_revisit")
+        instance.driver.pages["https://orders/"] = {"//button": ["Submit"]}
+        instance.assign(models.Task(models.Key("TEST", "test_revisit"), deque([
+            models.Command("dget", "https://${usrId}/", None),
+            models.Command("printf", "${usrId}", None)
+        ]), options={"revisit": "SKIP"}))
+
+        for _ in range(2):
+            instance.reset()
+            instance.exec({"usrId": "orders"})
+        instance.click("//button")
+        instance.reset()
+        instance.exec({"usrId": "orders"})
+        self.assertEqual([call for call in instance.driver.calls if call[0] == "get"], [("get", "https://orders/")] * 2)
+        self.assertEqual(instance.metrics[const.METRIC_SKIPPED_NAVIGATIONS], 1)
+
+        instance.assign(models.Task(models.Key("TEST", "test_always"), instance.task.cmds))
+        instance.exec({"usrId": "orders"})
+        self.assertEqual(instance.metrics[const.METRIC_SKIPPED_NAVIGATIONS], 1)
+
 if __name__ == "__main__":
     unittest.main()
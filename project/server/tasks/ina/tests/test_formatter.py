@@ -0,0 +1,56 @@
+# project/server/tasks/ina/tests/test_formatter.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import job
+from project.server.tasks.ina import config
+from project.server.tasks.ina import formatter
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+
+# === Test Object ===
+class TestFormatter(unittest.TestCase):
+
+    def test_parse(self):
+        template = formatter.parse("Hi ${usrId}: ${0}, ${@}, ${@#}, ${-1}, ${@//li}, ${//h1}!")
+        self.assertEqual(template.segments, (
+            (formatter.LITERAL, "Hi "), (formatter.LUT, "usrId"),
+            (formatter.LITERAL, ": "), (formatter.INDEX, "${0}"),
+            (formatter.LITERAL, ", "), (formatter.ARGV, "@"),
+            (formatter.LITERAL, ", "), (formatter.ELUT, "@#"),
+            (formatter.LITERAL, ", "), (formatter.LAST, "-1"),
+            (formatter.LITERAL, ", "), (formatter.FIND_ALL, "//li"),
+            (formatter.LITERAL, ", "), (formatter.LUT, "//h1"),
+            (formatter.LITERAL, "!")
+        ))
+        self.assertIs(formatter.parse(config.DEFAULT_FORMAT), formatter.parse(config.DEFAULT_FORMAT))
+
+    def test_render(self):
+        template = formatter.parse("${a}${a}-${b}")
+        calls = []
+        def lookup(kind, value):
+            calls.append(value)
+            return value.upper()
+
+        self.assertEqual(template.render(lookup), "AA-B")
+        self.assertEqual(calls, ["a", "b"])
+        self.assertEqual(formatter.parse("no placeholders").render(lookup), "no placeholders")
+
+    def test_task2str(self):
+        handler = job.Job()
+        ilut = {"${0}": "TEST,test_task2str", "${1}": "orderId: 42"}
+        line = handler.task2str(config.DEFAULT_FORMAT, {"usrId": "Edward"}, ilut)
+        self.assertEqual(line, "Edward,TEST,test_task2str,orderId: 42")
+        self.assertEqual(handler.task2str("${missing} ${@#}", {"usrId": "Edward"}, ilut), "N/F usrId: Edward")
+
+    def test_scan(self):
+        instance = fixtures.FakeDriver("test_scan")
+        instance.reset()
+        instance.lut = {"usrId": "Edward", "tags": ["a", "b"]}
+        instance.results = {"${0}": "first", "${1}": "second"}
+        self.assertEqual(instance.scan("${usrId} ${tags} ${1} ${-1} ${@}"), "Edward a, b second second first, second")
+
+if __name__ == "__main__":
+    unittest.main()
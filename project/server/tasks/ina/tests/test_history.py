@@ -0,0 +1,100 @@
+# project/server/tasks/ina/tests/test_history.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
+from project.server.tasks.ina import models
+from project.server.tasks.ina import history
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# => External <=
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+# === Test Object ===
+class TestHistory(unittest.TestCase):
+
+    def record(self, instance:history.History, key:str, seconds:float, n:int):
+        for _ in range(n): instance.record(key, seconds)
+
+    def test_timeout(self):
+        instance = history.History(samples=10, margin=1.5, floor=0.25, ceiling=10.0)
+        key = history.History.key("TEST", "test_timeout", "PRESENCE_OF_ELEMENT_LOCATED", "//h1")
+        self.assertEqual(key, "TEST/test_timeout/PRESENCE_OF_ELEMENT_LOCATED///h1")
+
+        self.record(instance, key, 0.03, 9)
+        self.assertEqual(instance.timeout(key), None)
+
+        instance.reset()
+        self.record(instance, key, 0.03, 99)
+        self.record(instance, key, 0.3, 1)
+        self.assertEqual(instance.percentile(key, 0.5), 0.05)
+        self.assertEqual(instance.percentile(key, 0.99), 0.05)
+        self.assertEqual(instance.timeout(key), 0.25)
+
+        self.record(instance, key, 60.0, 10)
+        self.assertEqual(instance.timeout(key), 0.25)   # cached
+        instance.reset()
+        self.record(instance, key, 60.0, 10)
+        self.assertEqual(instance.timeout(key), 10.0)
+
+        instance = history.History(samples=10)    # i.e. an in-page wait ends before its script times out
+        self.record(instance, key, 60.0, 10)
+        self.assertLess(instance.timeout(key), config.DEFAULT_SCRIPT_TIMEOUT)
+
+    def test_misses(self):
+        instance = history.History(samples=10)
+        key = history.History.key("TEST", "test_misses", "PRESENCE_OF_ELEMENT_LOCATED", "//h1")
+        self.record(instance, key, 0.03, 20)
+        instance.miss(key)
+        self.assertEqual(instance.timeout(key), 0.25)
+
+        instance.reset()
+        self.record(instance, key, 0.03, 20)
+        for _ in range(2): instance.miss(key)
+        self.assertEqual(instance.timeout(key), None)
+
+    def test_redis(self):
+        connection = fixtures.FakeRedis()
+        instance = history.History(history.RedisStore(connection), samples=1)
+        self.record(instance, "TEST/a/CONDITION///h1", 0.1, 2)
+        instance.miss("TEST/a/CONDITION///h1")
+        self.record(instance, "TEST/b/CONDITION///h1", 0.1, 1)
+
+        stats = instance.inspect("TEST/a")
+        self.assertEqual(list(stats), ["TEST/a/CONDITION///h1"])
+        self.assertEqual((stats["TEST/a/CONDITION///h1"]["samples"], stats["TEST/a/CONDITION///h1"]["misses"]), (2, 1))
+
+        instance.reset("TEST/a")
+        self.assertEqual(list(instance.inspect()), ["TEST/b/CONDITION///h1"])
+
+    def test_driver(self):
+        learned = history.History(samples=10)
+        default = history.installed()
+        history.install(learned)
+        try:
+            instance = fixtures.FakeDriver("test_driver")
+            instance.driver.pages["https://orders/"] = {"//h1": ["Order"]}
+            instance.driver.get("https://orders/")
+            instance.assign(models.Task(models.Key("TEST", "test_driver"), deque([])))
+
+            for _ in range(10): instance.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//h1"))
+            key = history.History.key("TEST", "test_driver", "PRESENCE_OF_ELEMENT_LOCATED", "//h1")
+            self.assertEqual(learned.inspect()[key]["samples"], 10)
+            self.assertEqual(instance.driver.waits[0][4], 5000)
+
+            instance.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//h1"))
+            self.assertEqual(instance.driver.waits[-1][4], 250)
+
+            self.assertEqual(instance.wait_for(const.UNTIL, EC.presence_of_element_located, "LOCATOR", (By.XPATH, "//missing")), False)
+            key = history.History.key("TEST", "test_driver", "PRESENCE_OF_ELEMENT_LOCATED", "//missing")
+            self.assertEqual(learned.inspect()[key]["misses"], 1)
+        finally: history.install(default)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,16 @@
 
 # === Import(s) ===
 # => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import config
 from project.server.tasks.ina import models
+from project.server.tasks.ina import pool
 from project.server.tasks.ina import job
+from project.server.tasks.ina.tests import fixtures
 
 # => System <=
 import unittest
+import tempfile
 from collections import deque
 
 # === Test Object ===
@@ -109,5 +114,234 @@ class TestJob(unittest.TestCase):
         handler.deploy("edward.yifengliu@gmail.com")
         self.assertEqual(len(handler.queue), 0)
 
+    def test_report(self):
+        handler = job.Job("test_report")
+        handler.lines = ["Edward,TEST,test_report,printf"]
+        handler.records = [{"usrId": "Edward", "env": "TEST", "name": "test_report", "orderId": "A-1"}]
+        sent = []
+        handler.send_email = lambda receipt, attachments=None: sent.extend(part.get_filename() for part in attachments)
+
+        cache = config.PATH_CACHE
+        with tempfile.TemporaryDirectory() as path:
+            config.PATH_CACHE = path
+            try: handler.notify("edward.yifengliu@gmail.com")
+            finally: config.PATH_CACHE = cache
+        
+        # the lines & the records are both reported
+        self.assertEqual(sent, ["test_report.csv", "test_report.records.csv"])
+
+    def test_shards(self):
+        key = models.Key("TEST", "test_shards")
+        task = models.Task(key, deque([models.Command("printf", "${usrId}", None)]))
+
+        handler = job.Job()
+        for name in ["Edward", "Edward", "Han", "Edward"]:
+            handler.push(task, fmt="${0}", elut={"usrId": name})
+        shards = handler.shards()
+        self.assertEqual([[idx for idx, _ in shard] for shard in shards], [[0, 1], [2], [3]])
+
+    def test_parallel(self):
+        key = models.Key("TEST", "test_parallel")
+        swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("printf", "swap", None)]))
+        task = models.Task(key, deque([models.Command("printf", "${usrId}.${n}", None)]))
+
+        drivers = pool.Pool(3, factory=fixtures.FakeDriver)
+        handler = job.Job(pool=drivers, parallelism=3)
+        expected = []
+        for name in ["Edward", "Han", "John", "Suri", "Will"]:
+            handler.push(swap, elut={"usrId": name}, trace=False)
+            for n in range(4):
+                handler.push(task, fmt="${0}", elut={"usrId": name, "n": str(n)})
+                expected.append(f"{name}.{n}")
+
+        handler.deploy()
+        self.assertEqual(len(handler.queue), 0)
+        self.assertEqual(handler.lines, expected)
+        self.assertLessEqual(drivers.count, 3)
+        drivers.close()
+
+    def test_parallel_windows(self):
+        task = models.Task(models.Key("TEST", "test_parallel_windows"), deque([models.Command("printf", "${usrId}.${n}", None)]), options={"engine": "BROWSER"})
+        leases = []
+
+        class Counting(pool.Pool):
+            def acquire(self, user:str=None):
+                leases.append(self.count)
+                return super().acquire(user)
+
+        drivers = Counting(2, factory=fixtures.FakeDriver)
+        handler = job.Job(pool=drivers, parallelism=2, window=4)
+        rows = [(name, n) for name in ["Edward", "Han", "John", "Suri"] for n in range(3)]
+        handler.feed(handler.entry(task, fmt="${0}", elut={"usrId": name, "n": str(n)}) for name, n in rows)
+
+        # 3 windows, yet each worker leased its Driver once & released it once the deploy was done
+        handler.deploy()
+        self.assertEqual(handler.lines, [f"{name}.{n}" for name, n in rows])
+        self.assertEqual(len(leases), 2)
+        self.assertEqual((len(drivers.idle), handler.workers), (2, {}))
+        drivers.close()
+
+    def test_metrics(self):
+        task = models.Task(models.Key("TEST", "test_metrics"), deque([
+            models.Command("get", "https://orders/", None),
+            models.Command("click", "//button", None),
+            models.Command("printf", "${usrId}", None)
+        ]))
+
+        handler = job.Job()
+        handler.driver = fixtures.FakeDriver("test_metrics")
+        handler.driver.driver.pages["https://orders/"] = {"//button": ["Submit"]}
+        for name in ["Edward", "Han"]: handler.push(task, fmt="${0}", elut={"usrId": name})
+        
+        handler.deploy()
+        self.assertEqual(handler.lines, ["Edward", "Han"])
+        self.assertEqual(handler.metrics[const.METRIC_SAVED_ROUND_TRIPS], 2)
+        self.assertEqual(handler.breakdown["TEST/test_metrics"][const.METRIC_SAVED_ROUND_TRIPS], 2)
+
+    def test_plan(self):
+        order = models.Task(models.Key("TEST", "order"), deque([
+            models.Command("dget", "https://orders/${orderId}", None),
+            models.Command("printf", "${usrId},${orderId}", None)
+        ]), options={"revisit": "SKIP", "engine": "BROWSER"})
+        find = models.Task(models.Key("TEST", "find"), deque([models.Command("printf", "${usrId},find", None)]), options={"engine": "BROWSER"})
+
+        handler = job.Job()
+        handler.driver = fixtures.FakeDriver("test_plan")
+        handler.driver.driver.pages = {f"https://orders/{n}": {} for n in range(3)}
+        rows = [(order, "1"), (find, None), (order, "2"), (find, None), (order, "1")]
+        for task, orderId in rows: handler.push(task, fmt="${0}", elut={"usrId": "Edward", "orderId": orderId})
+
+        handler.deploy()
+        # executed as order 1, order 1, order 2, find, find: a single GET of order 1, results in the pushed order
+        self.assertEqual(handler.lines, ["Edward,1", "Edward,find", "Edward,2", "Edward,find", "Edward,1"])
+        self.assertEqual(handler.metrics[const.METRIC_SKIPPED_NAVIGATIONS], 1)
+        self.assertLess(handler.costs["estimated"], handler.costs["baseline"])
+        self.assertGreater(handler.costs["actual"], 0)
+
+        handler = job.Job(plan=False)
+        handler.driver = fixtures.FakeDriver("test_plan")
+        handler.push(find, fmt="${0}", elut={"usrId": "Edward"})
+        handler.deploy()
+        self.assertEqual((handler.lines, handler.costs), (["Edward,find"], {}))
+
+    def test_feed(self):
+        swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("get", "https://login/", None)]), options={"engine": "BROWSER"})
+        task = models.Task(models.Key("TEST", "test_feed"), deque([models.Command("printf", "${usrId},${n}", None)]), options={"engine": "BROWSER"})
+
+        handler = job.Job(window=3)
+        handler.driver = fixtures.FakeDriver("test_feed")
+        handler.driver.driver.pages = {"https://login/": {}}
+        pulled = []
+
+        def entries():
+            for name, n in [("Edward", 4), ("Han", 1)]:
+                yield handler.entry(swap, elut={"usrId": name}, trace=False)
+                for i in range(n):
+                    pulled.append(len(handler.queue))
+                    yield handler.entry(task, fmt="${0}", elut={"usrId": name, "n": str(i)})
+
+        handler.feed(entries())
+        self.assertEqual(len(handler.queue), 0)
+        handler.deploy()
+        self.assertEqual(handler.lines, ["Edward,0", "Edward,1", "Edward,2", "Edward,3", "Han,0"])
+        self.assertLessEqual(max(pulled), 3)
+        self.assertEqual(len(handler.queue), 0)
+
+        # Edward's shard was cut by a window: a single Driver is still logged in, its SWAP did not re-run
+        logins = [call for call in handler.driver.driver.calls if call == ("get", "https://login/")]
+        self.assertEqual(len(logins), 2)
+
+        # ... but on parallel Drivers, the next window's shard may run on another one: its SWAP re-ran
+        drivers = pool.Pool(2, factory=fixtures.FakeDriver)
+        handler = job.Job(pool=drivers, parallelism=2, window=3)
+        handler.feed(entries())
+        handler.deploy()
+        self.assertEqual(handler.lines, ["Edward,0", "Edward,1", "Edward,2", "Edward,3", "Han,0"])
+        logins = [call for instance in drivers.idle for call in instance.driver.calls if call == ("get", "https://login/")]
+        self.assertEqual(len(logins), 3)
+        drivers.close()
+
+    def test_pipeline(self):
+        swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("printf", "swap", None)]))
+        task = models.Task(models.Key("TEST", "test_pipeline"), deque([
+            models.Command("dget", "https://orders/${orderId}", None),
+            models.Command("click", "//button", None),
+            models.Command("printf", "${usrId},${orderId}", None)
+        ]))
+
+        handler = job.Job(pipeline=2)
+        handler.driver = fixtures.FakeDriver("test_pipeline")
+        handler.driver.driver.pages = {f"https://orders/{n}": {"//button": ["Submit"]} for n in range(5)}
+        for name, orders in [("Edward", [0, 1, 2, 3]), ("Han", [4])]:
+            handler.push(swap, elut={"usrId": name}, trace=False)
+            for n in orders: handler.push(task, fmt="${0}", elut={"usrId": name, "orderId": str(n)})
+
+        handler.deploy()
+        calls = handler.driver.driver.calls
+        self.assertEqual(handler.lines, ["Edward,0", "Edward,1", "Edward,2", "Edward,3", "Han,4"])
+        self.assertEqual([call for call in calls if call[0] == "get"], [("get", "https://orders/0"), ("get", "https://orders/4")])
+        self.assertEqual(handler.metrics[const.METRIC_PREFETCHED], 3)
+        self.assertEqual(handler.metrics[const.METRIC_PREFETCH_WASTED], 0)
+        self.assertEqual(handler.driver.driver.handles, [handler.driver.handle])
+        self.assertEqual(job.Job().task2url(task, {"usrId": "Edward"}), None)
+
+    def test_interleave(self):
+        swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("printf", "swap", None)]))
+        task = models.Task(models.Key("TEST", "test_interleave"), deque([
+            models.Command("dget", "https://orders/${orderId}", None),
+            models.Command("click", "//button", None),
+            models.Command("printf", "${usrId},${//h1}", None)
+        ]))
+
+        handler = job.Job(tabs=3)
+        handler.driver = fixtures.FakeDriver("test_interleave")
+        handler.driver.driver.pages = {f"https://orders/{n}": {"//button": ["Submit"], "//h1": [f"Order {n}"]} for n in range(7)}
+        expected = []
+        for name, orders in [("Edward", [0, 1, 2, 3, 4]), ("Han", [5, 6])]:
+            handler.push(swap, elut={"usrId": name}, trace=False)
+            for n in orders: 
+                handler.push(task, fmt="${0}", elut={"usrId": name, "orderId": str(n)})
+                expected.append(f"{name},Order {n}")
+
+        handler.deploy()
+        calls = handler.driver.driver.calls
+        self.assertEqual(handler.lines, expected)
+        self.assertEqual([call for call in calls if call[0] == "get"], [])
+        self.assertEqual(len(handler.driver.driver.handles), 3)
+        self.assertEqual(handler.metrics[const.METRIC_INTERLEAVED], 7)
+        self.assertEqual(handler.breakdown["TEST/test_interleave"][const.METRIC_INTERLEAVED], 7)
+        self.assertEqual(handler.driver.handle, "window-0")
+
+        # every tab's row ran until its DGET left loading before any of them resumed
+        switches = [call[1] for call in calls if call[0] == "switch_to.window"]
+        self.assertEqual(len(set(switches[:3])), 3)
+
+    def test_interleave_home(self):
+        swap = models.Task(models.Key("TEST", "swap"), deque([
+            models.Command("get", "https://home", None),
+            models.Command("click", "//h1", None)
+        ]))
+        stay = models.Task(models.Key("TEST", "stay"), deque([models.Command("printf", "${usrId},${//h1}", None)]))
+        task = models.Task(models.Key("TEST", "test_interleave_home"), deque([
+            models.Command("dget", "https://orders/${orderId}", None),
+            models.Command("printf", "${usrId},${//h1}", None)
+        ]))
+
+        handler = job.Job(tabs=2, plan=False)
+        handler.driver = fixtures.FakeDriver("test_interleave_home")
+        handler.driver.driver.pages = {"https://home": {"//h1": ["Home"]}}
+        handler.driver.driver.pages.update({f"https://orders/{n}": {"//h1": [f"Order {n}"]} for n in range(3)})
+        handler.push(swap, elut={"usrId": "Edward"}, trace=False)
+        handler.push(stay, fmt="${0}", elut={"usrId": "Edward"})
+        handler.push(task, fmt="${0}", elut={"usrId": "Edward", "orderId": "0"})
+        handler.push(stay, fmt="${0}", elut={"usrId": "Edward"})
+        for n in (1, 2): handler.push(task, fmt="${0}", elut={"usrId": "Edward", "orderId": str(n)})
+
+        # a row w/o a leading navigation runs on the home tab, once the rows before it are done, not on a blank tab
+        handler.deploy()
+        self.assertEqual(handler.lines, ["Edward,Home", "Edward,Order 0", "Edward,Order 0", "Edward,Order 1", "Edward,Order 2"])
+        self.assertEqual(handler.metrics[const.METRIC_INTERLEAVED], 3)
+        self.assertEqual(handler.driver.handle, "window-0")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,165 @@
+# project/server/tasks/ina/tests/test_lite.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import models
+from project.server.tasks.ina import lite
+from project.server.tasks.ina import job
+from project.server.tasks.ina import pool
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestLite(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.site = fixtures.FixtureSite({"/order": fixtures.ORDER_PAGE, **fixtures.LIST_PAGES}).__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.site.__exit__(None, None, None)
+
+    def task(self, name:str, options:dict=None)->models.Task:
+        return models.Task(models.Key("TEST", name), deque([
+            models.Command("dget", self.site.url("/order?usrId=${usrId}"), None),
+            models.Command("printf", "${usrId},${//h1[@id='title']},${@//li/span[@class='status']}", None),
+            models.Command("pause", "3.0", None)
+        ]), options=options)
+
+    def test_eligible(self):
+        self.assertEqual(lite.eligible(self.task("test_eligible")), True)
+        self.assertEqual(lite.eligible(self.task("test_eligible", {"engine": "BROWSER"})), False)
+
+        task = self.task("test_eligible")
+        task.push(models.Command("click", "//input", None))
+        self.assertEqual(lite.eligible(task), False)
+        self.assertEqual(lite.eligible(models.Task(task.key, task.cmds, options={"engine": "LITE"})), True)
+
+    def test_exec(self):
+        instance = lite.LiteDriver("test_exec")
+        task = self.task("test_exec")
+        task.push(models.Command("snap", None, None))
+        instance.assign(task)
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut["${0}"], "Edward,Order,Approved; Pending; Approved")
+        self.assertIn("Order", ilut[const.SNAPV])
+
+        instance.scrub()
+        self.assertEqual((instance.url, instance.taskkey()), (const.BLANK, None))
+        instance.quit()
+
+    def test_blocks(self):
+        instance = lite.LiteDriver("test_blocks")
+        task = self.task("test_blocks")
+        task.extend([
+            models.Command("if_present", "//input[@name='q']", None),
+            models.Command("printf", "search", None),
+            models.Command("else", None, None),
+            models.Command("printf", "no search", None),
+            models.Command("end", None, None),
+            models.Command("if_present", "//div[@id='banner']", None),
+            models.Command("printf", "banner", None),
+            models.Command("end", None, None)
+        ])
+        self.assertEqual(lite.eligible(task), True)
+        instance.assign(task)
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual([ilut["${1}"], ilut.get("${2}")], ["search", None])
+        instance.quit()
+
+    def test_loops(self):
+        task = models.Task(models.Key("TEST", "test_loops"), deque([
+            models.Command("printf", "TEST,test_loops", None),
+            models.Command("get", self.site.url("/orders/1"), None),
+            models.Command("paginate", "//a[@class='next']", None),
+            models.Command("for_each", "//li[@class='order']", None),
+            models.Command("printf", "${./span[@class='id']}", None),
+            models.Command("printf", "${./span[@class='status']}", None),
+            models.Command("end", None, None),
+            models.Command("end", None, None)
+        ]))
+        self.assertEqual(lite.eligible(task), True)
+
+        handler = job.Job()
+        handler.push(task, fmt="${usrId},${0},${1}: ${2}", elut={"usrId": "Edward"})
+        handler.deploy()
+        self.assertEqual(handler.lines, [
+            "Edward,TEST,test_loops,A-1: Approved", 
+            "Edward,TEST,test_loops,A-2: Pending", 
+            "Edward,TEST,test_loops,A-3: Approved"])
+
+    def test_extract(self):
+        task = models.Task(models.Key("TEST", "test_extract"), deque([
+            models.Command("get", self.site.url("/orders/1"), None),
+            models.Command("for_each", "//li[@class='order']", None),
+            models.Command("extract", {"orderId": "./span[@class='id']", "status": "./span[@class='status']", "title": "//title"}, None),
+            models.Command("end", None, None)
+        ]))
+
+        handler = job.Job()
+        handler.push(task, elut={"usrId": "Edward"})
+        handler.deploy()
+        self.assertEqual(handler.records, [
+            {"usrId": "Edward", "env": "TEST", "name": "test_extract", "orderId": "A-1", "status": "Approved", "title": "Orders"},
+            {"usrId": "Edward", "env": "TEST", "name": "test_extract", "orderId": "A-2", "status": "Pending", "title": "Orders"}])
+
+    def test_revisit(self):
+        handler = job.Job()
+        task = self.task("test_revisit", {"revisit": "SKIP"})
+        for name in ["Edward", "Edward", "Han"]: handler.push(task, fmt="${0}", elut={"usrId": name})
+
+        handler.deploy()
+        self.assertEqual(handler.lines, [f"{name},Order,Approved; Pending; Approved" for name in ["Edward", "Edward", "Han"]])
+        self.assertEqual(handler.metrics[const.METRIC_SKIPPED_NAVIGATIONS], 1)
+
+    def test_session(self):
+        swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("get", "https://login/", None)]), options={"engine": "BROWSER"})
+        task = self.task("test_session")
+
+        handler = job.Job()
+        handler.driver = fixtures.FakeDriver("test_session")
+        handler.push(swap, elut={"usrId": "Edward"}, trace=False)
+        handler.push(task, fmt="${0}", elut={"usrId": "Edward"})
+        handler.push(task, fmt="${0}", elut={"usrId": "Han"})
+        handler.push(models.Task(task.key, task.cmds, options={"engine": "LITE"}), fmt="${0}", elut={"usrId": "Edward"})
+
+        handler.deploy()
+        # Edward logged in on the browser: his auto-eligible row stays there, his opted-in one & Han's run w/o it
+        urls = [call[1] for call in handler.driver.driver.calls if call[0] == "get"]
+        self.assertEqual(urls, ["https://login/", self.site.url("/order?usrId=Edward")])
+        self.assertEqual(handler.lines[1:], [f"{name},Order,Approved; Pending; Approved" for name in ["Han", "Edward"]])
+        self.assertEqual(handler.browsers, {"Edward"})
+
+    def test_windows(self):
+        browse = models.Task(models.Key("TEST", "browse"), deque([models.Command("printf", "${usrId},browser", None)]), options={"engine": "BROWSER"})
+        task = models.Task(models.Key("TEST", "test_windows"), deque([models.Command("printf", "${usrId},${n}", None)]))
+
+        drivers = pool.Pool(2, factory=fixtures.FakeDriver)
+        handler = job.Job(pool=drivers, parallelism=2, window=2)
+        entries = [handler.entry(browse, fmt="${0}", elut={"usrId": "Edward"})]
+        entries.extend(handler.entry(task, fmt="${0}", elut={"usrId": "Edward", "n": str(n)}) for n in range(3))
+        handler.feed(iter(entries))
+
+        # the last window only holds Edward's auto-eligible rows, they still need his browser
+        handler.deploy()
+        self.assertEqual(handler.lines, ["Edward,browser", "Edward,0", "Edward,1", "Edward,2"])
+        drivers.close()
+
+    def test_job(self):
+        handler = job.Job(parallelism=2)
+        task = self.task("test_job")
+        for name in ["Edward", "Han", "John"]: handler.push(task, fmt="${0}", elut={"usrId": name})
+
+        handler.deploy()
+        self.assertEqual(handler.lines, [f"{name},Order,Approved; Pending; Approved" for name in ["Edward", "Han", "John"]])
+        self.assertEqual(handler.driver, None)
+
+if __name__ == "__main__":
+    unittest.main()
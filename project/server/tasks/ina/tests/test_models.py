@@ -6,7 +6,9 @@ from project.server.tasks.ina import utils
 from project.server.tasks.ina import models
 
 # => System <=
+import pickle
 import unittest
+from dataclasses import FrozenInstanceError
 from collections import deque
 
 # === Test Object ===
@@ -36,6 +38,13 @@ class TestModels(unittest.TestCase):
         lut[key_b] = "Hello KeyB"
         self.assertEqual(lut[key_b], "Hello KeyB")
 
+        # interned, hashed once & frozen
+        self.assertIs(key_a, key_c)
+        self.assertNotEqual(hash(models.Key("AB", "C")), hash(models.Key("A", "BC")))
+        self.assertEqual(pickle.loads(pickle.dumps(key_a)), key_a)
+        with self.assertRaises(FrozenInstanceError): key_a.name = "TestB"
+        self.assertFalse(hasattr(key_a, "__dict__"))
+
     def test_task(self):
         cmd_a = models.Command(label="dsend_keys", target="AN_XPATH_VALUE", argv=["Beau", "Edward"])
         cmd_b = models.Command(label="dsend_keys", target="AN_XPATH_VALUE", argv=["Jim"])
@@ -49,6 +58,27 @@ class TestModels(unittest.TestCase):
         self.assertEqual(task.cmds, deque([cmd_a, cmd_b, cmd_c]))
         self.assertEqual(task.cmds.pop(), cmd_c)
         self.assertEqual(task.cmds, deque([cmd_a, cmd_b]))
+
+        self.assertEqual(task, models.Task(key, deque([cmd_a, cmd_b]), options={"pause": "BOUND"}))
+        self.assertEqual({task: 1}[models.Task(key, deque([cmd_a, cmd_b]))], 1)
+        with self.assertRaises(FrozenInstanceError): task.cmds = deque([])
+        self.assertFalse(hasattr(task, "__dict__") or hasattr(cmd_a, "__dict__"))
+
+    def test_row(self):
+        task = models.Task(models.Key("TEST", "test_row"), deque([]))
+        row_a = models.Row(task, "${0}", {"usrId": "Edward", "orderId": "1"}, False)
+        row_b = models.Row(task, elut={"usrId": "Han", "orderId": "2"})
+
+        task_a, fmt_a, elut_a, trace_a = row_a
+        self.assertEqual((task_a, fmt_a, elut_a, trace_a), (task, "${0}", {"usrId": "Edward", "orderId": "1"}, False))
+        self.assertEqual((row_b[0], row_b[2], row_b[3]), (task, {"usrId": "Han", "orderId": "2"}, True))
+        self.assertEqual((row_b.get("usrId"), row_b.get("name")), ("Han", None))
+        self.assertIs(row_a.names, row_b.names)
+        self.assertEqual(models.Row(task).elut, None)
+
+        self.assertIs(row_b.elut, row_b[2])     # i.e. built once
+        row_b.elut["orderId"] = "3"
+        self.assertEqual((row_b.get("orderId"), list(row_b)[2]), ("3", {"usrId": "Han", "orderId": "3"}))
         
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+# project/server/tasks/ina/tests/test_optimizer.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import optimizer
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestOptimizer(unittest.TestCase):
+
+    def task(self, *cmds, options:dict=None)->models.Task:
+        return models.Task(models.Key("TEST", "test_optimizer"), deque(models.Command(*cmd) for cmd in cmds), options=options)
+
+    def test_emit_constants(self):
+        task = self.task(("printf", "TEST,test_emit_constants", None), ("printf", "${usrId}", None))
+        report = optimizer.optimize(task)
+        self.assertEqual([cmd.label for cmd in task.cmds], ["emit", "printf"])
+        self.assertEqual(len(report), 1)
+
+    def test_drop_dead_navigations(self):
+        task = self.task(
+            ("get", "https://a/", None),
+            ("dget", "https://b/${orderId}", None),
+            ("printf", "${//h1}", None),
+            ("get", "https://c/", None),
+            ("dget", "https://d/${//a}", None),
+            ("pause", 1.0, None),
+            ("get", "https://e/", None)
+        )
+        optimizer.optimize(task)
+        self.assertEqual([cmd.target for cmd in task.cmds], ["https://b/${orderId}", "${//h1}", 1.0, "https://e/"])
+
+        # neither the last navigation nor one read by a later command is dropped
+        task = self.task(("get", "https://logout/", None), ("click", "//button", None), ("get", "https://done/", None))
+        self.assertEqual(optimizer.optimize(task), [])
+
+    def test_dead_suffix(self):
+        suffix = [models.Command("get", "https://home/", None)]
+        first = self.task(("printf", "TEST,first", None), ("pause", 1.0, None), ("dget", "https://a/${orderId}", None), ("click", "//a", None))
+        reads = self.task(("click", "//a", None), ("get", "https://a/", None))
+        looks = self.task(("dget", "https://a/${//a/@href}", None))
+
+        self.assertEqual([optimizer.navigates_first(task.cmds) for task in (first, reads, looks)], [True, False, False])
+        self.assertTrue(optimizer.dead_suffix(suffix, [first]))
+        self.assertFalse(optimizer.dead_suffix(suffix, [first, reads]))
+        self.assertFalse(optimizer.dead_suffix(suffix + [models.Command("printf", "${//h1}", None)], [first]))
+        self.assertFalse(optimizer.dead_suffix([], [first]))
+
+    def test_merge_pauses(self):
+        task = self.task(("get", "https://a/", None), ("pause", "1.5", None), ("pause", 2.0, None), ("pause", "soon", None))
+        optimizer.optimize(task)
+        self.assertEqual([(cmd.label, cmd.target) for cmd in task.cmds], [("get", "https://a/"), ("pause", 3.5), ("pause", "soon")])
+
+    def test_opt_out(self):
+        task = self.task(("get", "https://a/", None), options={"optimize": False})
+        self.assertEqual(optimizer.optimize(task), [])
+        self.assertEqual(len(task.cmds), 1)
+
+    def test_exec(self):
+        instance = fixtures.FakeDriver("test_exec")
+        task = self.task(("get", "https://a/", None), ("printf", "TEST,test_exec", None), ("printf", "${usrId}", None), ("get", "https://b/", None))
+        optimizer.optimize(task)
+        instance.assign(task)
+
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut, {"${0}": "TEST,test_exec", "${1}": "Edward"})
+        self.assertEqual([call for call in instance.driver.calls if call[0] == "get"], [("get", "https://b/")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# project/server/tasks/ina/tests/test_planner.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import models
+from project.server.tasks.ina import planner
+
+# => System <=
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.swap = models.Task(models.Key("TEST", "swap"), deque([models.Command("get", "https://login/", None)]))
+        self.order = models.Task(models.Key("TEST", "order"), deque([
+            models.Command("dget", "https://orders/${orderId}", None),
+            models.Command("pause", "0.5", None)
+        ]))
+        self.find = models.Task(models.Key("TEST", "find"), deque([models.Command("printf", "${usrId}", None)]))
+        self.planner = planner.Planner(planner.Costs(swap=10.0, assign=1.0, navigation=2.0, wait=0.1))
+
+    def entry(self, task:models.Task, usrId:str, orderId:str="0", trace:bool=True)->tuple:
+        return (task, None, {"usrId": usrId, "orderId": orderId}, trace)
+
+    def test_order(self):
+        entries = [
+            self.entry(self.swap, "Edward", trace=False),
+            self.entry(self.order, "Edward", "2"),
+            self.entry(self.find, "Edward"),
+            self.entry(self.order, "Edward", "1"),
+            self.entry(self.find, "Edward"),
+            self.entry(self.order, "Edward", "1"),
+            self.entry(self.swap, "Han", trace=False),
+            self.entry(self.find, "Han"),
+            self.entry(self.swap, "Edward", trace=False),
+            self.entry(self.order, "Edward", "3")
+        ]
+
+        # the SWAP heads each shard, a usrId's shards are grouped, then by Task key & URL
+        order = self.planner.order(entries)
+        self.assertEqual(order, [0, 3, 5, 1, 2, 4, 8, 9, 6, 7])
+
+    def test_cost(self):
+        entries = [self.entry(self.order, "Edward", "1"), self.entry(self.find, "Edward"), self.entry(self.order, "Edward", "1")]
+        # swap + 3 assigns + 2 navigations + 2 pauses
+        self.assertAlmostEqual(self.planner.cost(entries), 10.0 + 3.0 + 4.0 + 1.0)
+
+        order, baseline, estimate = self.planner.plan(entries)
+        self.assertEqual(order, [0, 2, 1])
+        # swap + 2 assigns + 1 navigation (the same URL twice in a row) + 2 pauses
+        self.assertAlmostEqual(estimate, 10.0 + 2.0 + 2.0 + 1.0)
+        self.assertLess(estimate, baseline)
+
+        self.assertEqual(planner.task2url(self.order, {"orderId": "7"}), "https://orders/7")
+        self.assertEqual(planner.task2url(self.find, {}), None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# project/server/tasks/ina/tests/test_pool.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import models
+from project.server.tasks.ina import pool
+from project.server.tasks.ina import job
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestPool(unittest.TestCase):
+
+    def test_lease(self):
+        drivers = pool.Pool(2, factory=fixtures.FakeDriver)
+        drivers.warm()
+        self.assertEqual(drivers.count, 2)
+        self.assertEqual(len(drivers.idle), 2)
+
+        with drivers.lease() as instance:
+            self.assertEqual(len(drivers.idle), 1)
+            instance.driver.handles.append("window-1")
+
+        self.assertEqual(len(drivers.idle), 2)
+        self.assertEqual(instance.driver.handles, ["window-0"])
+        self.assertEqual(instance.driver.cookies, [])
+        self.assertEqual(instance.driver.url, "about:blank")
+        self.assertEqual(instance.taskkey(), None)
+        drivers.close()
+        self.assertEqual(drivers.count, 0)
+
+    def test_scrub(self):
+        drivers = pool.Pool(1, factory=fixtures.FakeDriver)
+        with drivers.lease() as instance:
+            instance.get("https://login/")
+            instance.driver.add_cookie({"name": "token", "value": "Edward"})
+            instance.get("https://orders/")
+
+        # the login page's origin is no longer the current one, yet its cookies did not survive the release
+        self.assertIn(("get", "https://login/robots.txt"), instance.driver.calls)
+        self.assertEqual(instance.driver.url, "about:blank")
+        for url in ("https://login/", "https://orders/"):
+            instance.driver.url = url
+            self.assertEqual(instance.driver.cookies, [])
+        self.assertEqual(instance.origins, set())
+        drivers.close()
+
+    def test_recycle(self):
+        drivers = pool.Pool(1, recycle=2, factory=fixtures.FakeDriver)
+        with drivers.lease() as first: pass
+        with drivers.lease() as second: pass
+        self.assertIs(first, second)
+        self.assertEqual(second.driver, None)
+
+        with drivers.lease() as third: pass
+        self.assertIsNot(first, third)
+        drivers.close()
+
+    def test_job(self):
+        drivers = pool.Pool(1, factory=fixtures.FakeDriver)
+        key = models.Key("TEST", "test_job")
+        task = models.Task(key, deque([
+            models.Command("get", "https://www.google.com/", None),
+            models.Command("printf", "Hello ${usrId}", None)
+        ]), options={"engine": "BROWSER"})
+
+        for name in ["Edward", "Han"]:
+            handler = job.Job(pool=drivers)
+            handler.push(task, fmt="${0}", elut={"usrId": name})
+            handler.deploy()
+            self.assertEqual(handler.lines, [f"Hello {name}"])
+            self.assertEqual(handler.driver, None)
+
+        self.assertEqual(drivers.serial, 1)
+        drivers.close()
+
+    def test_affinity(self):
+        drivers = pool.Pool(1, factory=fixtures.FakeDriver)
+        swap = models.Task(models.Key("TEST", "test_swap"), deque([models.Command("get", "https://login/", None)]), options={"engine": "BROWSER"})
+        task = models.Task(models.Key("TEST", "test_affinity"), deque([
+            models.Command("get", "https://orders/", None),
+            models.Command("printf", "Hello ${usrId}", None)
+        ]), options={"engine": "BROWSER"})
+
+        def deploy(name:str)->job.Job:
+            handler = job.Job(pool=drivers, plan=False)
+            handler.push(swap, elut={"usrId": name}, trace=False)
+            handler.push(task, fmt="${0}", elut={"usrId": name})
+            handler.deploy()
+            self.assertEqual(handler.lines, [f"Hello {name}"])
+            return handler
+
+        deploy("Edward")
+        instance = drivers.idle[0]
+        instance.driver.add_cookie({"name": "token", "value": "Edward"})
+        logins = lambda: instance.driver.calls.count(("get", "https://login/"))
+
+        # released logged in as Edward: not scrubbed, his next Job skips its SWAP USER
+        handler = deploy("Edward")
+        self.assertEqual((instance.user, logins()), ("Edward", 1))
+        self.assertEqual(handler.metrics[const.METRIC_WARM_SESSIONS], 1)
+        self.assertIn({"name": "token", "value": "Edward"}, instance.driver.cookies)
+
+        # leased to another user: scrubbed first, its SWAP USER runs
+        handler = deploy("Han")
+        self.assertEqual((instance.user, logins()), ("Han", 2))
+        self.assertEqual(handler.metrics[const.METRIC_WARM_SESSIONS], 0)
+        self.assertNotIn({"name": "token", "value": "Edward"}, instance.driver.cookies)
+        self.assertEqual(drivers.serial, 1)
+        drivers.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# project/server/tasks/ina/tests/test_session.py
+
+# === Import(s) ===
+# => Local <=
+from project.server.tasks.ina import const
+from project.server.tasks.ina import models
+from project.server.tasks.ina import session
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import time
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.default = session.installed()
+        self.sessions = session.Sessions()
+        session.install(self.sessions)
+
+    def tearDown(self):
+        session.install(self.default)
+
+    def swap(self, probe:str="//a[@id='logout']")->models.Task:
+        return models.Task(models.Key("TEST", "swap"), deque([
+            models.Command("get", "https://login/", None),
+            models.Command("click", "//input", None),
+            models.Command("pause", "0.0", None)
+        ]), options={"checkpoint": {"probe": probe}})
+
+    def driver(self, uid:str, logged:bool=True)->fixtures.FakeDriver:
+        instance = fixtures.FakeDriver(uid)
+        instance.driver.pages["https://login/"] = {"//input": [""]}
+        if logged: instance.driver.pages["https://login/"]["//a[@id='logout']"] = ["Logout"]
+        return instance
+
+    def test_stores(self):
+        local = session.LocalStore()
+        local.set("TEST/Edward", {"url": "https://login/"}, 0.05)
+        self.assertEqual(local.get("TEST/Edward"), {"url": "https://login/"})
+        time.sleep(0.06)
+        self.assertEqual(local.get("TEST/Edward"), None)
+
+        connection = fixtures.FakeRedis()
+        shared = session.Sessions(session.RedisStore(connection), ttl=60)
+        shared.put(session.Sessions.key("TEST", "Edward"), {"url": "https://login/", "cookies": []})
+        self.assertEqual(shared.get("TEST/Edward"), {"url": "https://login/", "cookies": []})
+        self.assertEqual(connection.expiry["ina:session:TEST/Edward"], 60)
+        shared.forget("TEST/Edward")
+        self.assertEqual(shared.get("TEST/Edward"), None)
+
+    def test_resume(self):
+        instance = self.driver("test_resume")
+        instance.assign(self.swap())
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual(self.sessions.get("TEST/Edward")["local"], {"token": "fake"})
+        self.assertIn(("execute", "actions"), instance.driver.calls)
+
+        # another Driver (e.g. a later Job) restores the checkpoint instead of executing the Task
+        instance = self.driver("test_resume")
+        instance.driver.cookies = []
+        instance.assign(self.swap())
+        ilut = instance.exec({"usrId": "Edward"})
+        self.assertEqual(ilut, {})
+        self.assertEqual(instance.metrics[const.METRIC_RESTORED_SESSIONS], 1)
+        self.assertNotIn(("execute", "actions"), instance.driver.calls)
+        self.assertEqual(instance.driver.cookies, [{"name": "session", "value": "fake"}])
+
+        instance.exec({"usrId": "Han"})
+        self.assertIn(("execute", "actions"), instance.driver.calls)
+
+    def test_stale(self):
+        instance = self.driver("test_stale")
+        instance.assign(self.swap())
+        instance.exec({"usrId": "Edward"})
+
+        # the session expired server-side: the probe is absent, the Task executes in full & is not checkpointed
+        instance = self.driver("test_stale", logged=False)
+        instance.assign(self.swap())
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual(instance.metrics[const.METRIC_STALE_SESSIONS], 1)
+        self.assertIn(("execute", "actions"), instance.driver.calls)
+        self.assertEqual(self.sessions.get("TEST/Edward"), None)
+
+    def test_failed(self):
+        # the login field is missing: the click fails, nothing is checkpointed even though the probe is present
+        instance = self.driver("test_failed")
+        del instance.driver.pages["https://login/"]["//input"]
+        instance.assign(self.swap())
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual(self.sessions.get("TEST/Edward"), None)
+
+        # w/o a probe, a session is never checkpointed
+        instance = self.driver("test_failed")
+        task = self.swap()
+        instance.assign(models.Task(task.key, task.cmds, options={"checkpoint": True}))
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual(self.sessions.get("TEST/Edward"), None)
+
+if __name__ == "__main__":
+    unittest.main()
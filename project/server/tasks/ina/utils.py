@@ -8,9 +8,11 @@ from . import config
 # => System <=
 import os
 import re
+import csv
 import json
 import logging
 import datetime
+from urllib.parse import urlsplit
 
 # => External <=
 import pytz
@@ -55,6 +57,23 @@ def get_logger(uid:str)->logging.Logger:
     log.addHandler(handle)
     return log
 
+def origin(url:str)->str:
+    """Get a URL's origin, i.e. <scheme>://<host>[:<port>]
+
+    Parameters
+    ----------
+    url: str
+        A URL string
+
+    Returns
+    -------
+    str: None unless it is an HTTP(S) URL
+    """
+
+    try: parts = urlsplit(url)
+    except (TypeError, ValueError): return None
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
 def cache_key(prefix:str, postfix:str)->str:
     """Get next available file path of the format: <prefix>r"([0-9]+)"<postfix>
     Starting with the numerical number of '1'
@@ -142,6 +161,70 @@ def write(lines:[str], path:str):
         fp.write("usrId,env,name,orderId,memos\n") 
         fp.write("\n".join(lines))
 
+def columns(records:[dict])->list:
+    """Get the columns of <records>, i.e. every field in order of appearance
+
+    Parameters
+    ----------
+    records: [dict]
+        A list of records
+
+    Returns
+    -------
+    list
+    """
+
+    return list(dict.fromkeys(field for record in records for field in record))
+
+def cell(value)->str:
+    """Format a record's value as a table cell, i.e. a list is joined w/ "; " & None is empty
+
+    Parameters
+    ----------
+    value: object
+        A str, a list of str or None
+
+    Returns
+    -------
+    str
+    """
+
+    if value is None: return ""
+    elif isinstance(value, list): return "; ".join(value)
+    else: return str(value)
+
+def write_records(records:[dict], path:str):
+    """Write <records> as a CSV file (i.e. quoted where needed) located at <path>
+
+    Parameters
+    ----------
+    records: [dict]
+        A list of records, see Driver.extract
+    path: str
+        The file path
+    """
+
+    fields = columns(records)
+    with open(path, "w", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(fields)
+        for record in records: writer.writerow([cell(record.get(field)) for field in fields])
+
+def texts(results:dict)->list:
+    """Get the text values of a Driver's results, i.e. w/o snapshots & records
+
+    Parameters
+    ----------
+    results: dict
+        The internal look-up table
+
+    Returns
+    -------
+    list
+    """
+
+    return [value for value in results.values() if isinstance(value, str)]
+
 def remove(path:str):
     """Remove a file
 
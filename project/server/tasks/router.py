@@ -0,0 +1,224 @@
+# project/server/tasks/router.py
+
+# === Import(s) ===
+# => Local <=
+from . import config
+from . import utils
+
+# => System <=
+import json
+from collections import OrderedDict
+
+# => External <=
+from rq import Queue
+
+# === Object Definition ===
+class Router(object):
+    """Define a Router Object
+
+    Session-Affinity Routing of Payload Rows to the Workers Already Logged In as Their Users
+    A worker w/ a Driver pool pins the usrIds its idle Drivers are still logged in as (see ina.Pool.users) to its dedicated queue
+    (i.e. usrId => queue, expiring after <ttl> seconds), a payload is split by pinned queue & rows of unpinned users are left
+    to the shared queue <queue>
+    Rows spill over to the shared queue if the pinned worker lags, i.e. <spill> jobs are waiting on its queue, or is gone
+    """
+
+    def __init__(self, connection, queue:str="default", home:str=None, spill:int=None, ttl:float=None, prefix:str="ina:affinity:"):
+        self.connection = connection
+        self.queue = queue
+        self.home = home
+        self.spill = spill or config.DEFAULT_ROUTE_SPILL
+        self.ttl = ttl or config.DEFAULT_ROUTE_TTL
+        self.prefix = prefix
+        self.held = set()   # the usrIds this worker pinned, see 'pin'
+        self.log = utils.get_logger("server.tasks.Router")
+
+    def __str__(self):
+        return f"server.tasks.Router(queue={self.queue}, home={self.home})"
+
+    # === Getter(s) ===
+    @staticmethod
+    def dedicated(name:str)->str:
+        """Get the dedicated queue of the worker <name>
+
+        Returns
+        -------
+        str
+        """
+
+        return f"ina.{name}"
+
+    def pinned(self, usrId:str)->str:
+        """Get the dedicated queue <usrId> is pinned to
+
+        Returns
+        -------
+        str: None if <usrId> is not pinned or its pin expired
+        """
+
+        raw = self.connection.get(self.prefix + usrId)
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    def live(self, queue:str)->bool:
+        """Check if a worker still listens on <queue>, i.e. its rq worker key has not expired
+
+        """
+
+        keys = self.connection.smembers(f"rq:workers:{queue}")
+        return any(self.connection.exists(key) for key in keys)
+
+    def lagging(self, queue:str)->bool:
+        """Check if the worker of <queue> lags, i.e. <self.spill> jobs are waiting on it
+
+        """
+
+        return self.connection.llen(Queue(queue, connection=self.connection).key) >= self.spill
+
+    def destination(self, usrId:str)->str:
+        """Get the queue <usrId>'s rows are enqueued on
+
+        Returns
+        -------
+        str: The pinned queue, otherwise (i.e. unpinned, spilled over or gone) the shared queue
+        """
+
+        queue = self.pinned(usrId) if usrId and config.DEFAULT_ROUTING else None
+        if not queue: return self.queue
+        if not self.live(queue):
+            self.log.info(f"destination: Gone - {usrId} => {queue}")
+            self.unpin(usrId)
+            return self.queue
+        if self.lagging(queue):
+            self.log.info(f"destination: Spilled Over - {usrId} => {queue}")
+            return self.queue
+        return queue
+
+    def route(self, data:list)->OrderedDict:
+        """Split payload rows by destination queue, rows keep their order
+
+        Parameters
+        ----------
+        data: list
+            The payload rows
+
+        Returns
+        -------
+        OrderedDict: A list of rows keyed by queue name
+        """
+
+        routes = {}; parts = OrderedDict()
+        for row in data:
+            usrId = row.get("usrId") if isinstance(row, dict) else None
+            if usrId not in routes: routes[usrId] = self.destination(usrId)
+            parts.setdefault(routes[usrId], []).append(row)
+        return parts
+
+    def plan(self, raw:dict, job_id:str)->list:
+        """Plan the RQ jobs of a payload: a single job <job_id> unless its rows are split across queues,
+        then a job <job_id>.<n> per queue, each emails its own receipt
+
+        Parameters
+        ----------
+        raw: dict
+            The payload
+        job_id: str
+            The job id returned to the API client
+
+        Returns
+        -------
+        list: A list of (queue name, payload, job id)
+        """
+
+        parts = self.route(raw.get("data") or []) if isinstance(raw, dict) else {}
+        if len(parts) <= 1: return [(next(iter(parts), self.queue), raw, job_id)]
+        return [(queue, {**raw, "data": rows}, f"{job_id}.{n}") for n, (queue, rows) in enumerate(parts.items())]
+
+    def children(self, job_id:str)->list:
+        """Get the ids of the jobs a payload <job_id> was split into
+
+        Returns
+        -------
+        list: None if <job_id> was not split
+        """
+
+        raw = self.connection.get(f"{self.prefix}job:{job_id}")
+        return json.loads(raw) if raw else None
+
+    # === Setter(s) ===
+    def pin(self, usrIds):
+        """Pin <usrIds> to this worker's dedicated queue for <self.ttl> seconds, i.e. the users whose sessions it holds
+        The users it pinned before & no longer holds are unpinned, unless pinned to another worker since
+
+        Parameters
+        ----------
+        usrIds: iter
+            An iterator of usrId values, falsy values are skipped
+        """
+
+        if not self.home: return
+        usrIds = set(filter(None, usrIds))
+        for usrId in self.held - usrIds:
+            if self.pinned(usrId) == self.home: self.unpin(usrId)
+        for usrId in usrIds:
+            self.connection.set(self.prefix + usrId, self.home, ex=max(1, int(self.ttl)))
+        self.held = usrIds
+
+    def unpin(self, usrId:str):
+        """Unpin <usrId>, e.g. once its worker is gone
+
+        """
+
+        self.connection.delete(self.prefix + usrId)
+
+    # === Functional ===
+    def enqueue(self, func, raw:dict, job_id:str, browser:str=None)->list:
+        """Enqueue <func>(payload, job id, browser) per planned job, see Router.plan
+
+        Parameters
+        ----------
+        func: func
+            The task, i.e. create_job or create_scan
+        raw: dict
+            The payload
+        job_id: str
+            The job id returned to the API client
+        browser: str, optional
+            Either 'Chrome' or 'FireFox'
+
+        Returns
+        -------
+        list: A list of rq.job.Job objects
+        """
+
+        jobs = [
+            Queue(queue, connection=self.connection).enqueue(func, args=(payload, uid, browser,), job_id=uid)
+            for queue, payload, uid in self.plan(raw, job_id)
+        ]
+        if len(jobs) > 1:
+            self.connection.set(f"{self.prefix}job:{job_id}", json.dumps([job.get_id() for job in jobs]), ex=config.DEFAULT_ROUTE_RECORD_TTL)
+        return jobs
+
+# === Worker Router ===
+ROUTER=None
+
+def install(router:Router):
+    """Install <router> as this process's Router, i.e. the one pinning the usrIds of its pool's sessions to this worker
+
+    Parameters
+    ----------
+    router: Router
+        The Router object, or None to uninstall
+    """
+
+    global ROUTER
+    ROUTER = router
+
+def installed()->Router:
+    """Get this process's Router
+
+    Returns
+    -------
+    Router: None if no Router is installed
+    """
+
+    return ROUTER
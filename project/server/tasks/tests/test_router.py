@@ -0,0 +1,92 @@
+# project/server/tasks/tests/test_router.py
+
+# === Import(s) ===
+# => Local <=
+from project.server import tasks
+from project.server.tasks import ina
+from project.server.tasks import router
+from project.server.tasks.ina.tests import fixtures
+
+# => System <=
+import unittest
+from collections import deque
+
+# === Test Object ===
+class TestRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = fixtures.FakeRedis()
+        self.routing = router.Router(self.connection, spill=2)
+
+    def worker(self, name:str)->router.Router:
+        home = router.Router.dedicated(name)
+        self.connection.sadd(f"rq:workers:{home}", f"rq:worker:{name}")
+        self.connection.set(f"rq:worker:{name}", "alive")
+        return router.Router(self.connection, home=home)
+
+    def test_pin(self):
+        self.worker("w1").pin(["Edward", None, "Edward"])
+        self.assertEqual(self.routing.pinned("Edward"), "ina.w1")
+        self.assertEqual(self.routing.pinned("Han"), None)
+        self.assertEqual(self.connection.expiry["ina:affinity:Edward"], int(self.routing.ttl))
+
+        # a Router w/o a dedicated queue (e.g. the API's) does not pin
+        self.routing.pin(["Han"])
+        self.assertEqual(self.routing.pinned("Han"), None)
+
+        # a user whose session is no longer held is unpinned, unless pinned to another worker since
+        w1 = self.worker("w1"); w1.pin(["Edward", "Han"])
+        self.worker("w2").pin(["Han"])
+        w1.pin(["John"])
+        self.assertEqual([self.routing.pinned(usrId) for usrId in ("Edward", "Han", "John")], [None, "ina.w2", "ina.w1"])
+
+    def test_route(self):
+        self.worker("w1").pin(["Edward"])
+        self.worker("w2").pin(["Han"])
+        data = [{"usrId": "Edward", "n": 0}, {"usrId": "John", "n": 1}, {"usrId": "Han", "n": 2}, {"usrId": "Edward", "n": 3}]
+
+        parts = self.routing.route(data)
+        self.assertEqual(list(parts), ["ina.w1", "default", "ina.w2"])
+        self.assertEqual([row["n"] for row in parts["ina.w1"]], [0, 3])
+
+        plan = self.routing.plan({"receipt": "r", "data": data}, "job")
+        self.assertEqual([(queue, uid) for queue, _, uid in plan], [("ina.w1", "job.0"), ("default", "job.1"), ("ina.w2", "job.2")])
+        self.assertEqual(plan[0][1], {"receipt": "r", "data": [data[0], data[3]]})
+
+        # a payload w/ a single destination keeps the API's job id
+        self.assertEqual(self.routing.plan({"data": data[:1]}, "job"), [("ina.w1", {"data": data[:1]}, "job")])
+        self.assertEqual(self.routing.plan({"data": []}, "job"), [("default", {"data": []}, "job")])
+
+    def test_spill(self):
+        self.worker("w1").pin(["Edward", "Han"])
+
+        # the pinned worker lags: rows spill over to the shared queue, the pin is kept
+        self.connection.data["rq:queue:ina.w1"] = ["a", "b"]
+        self.assertEqual(list(self.routing.route([{"usrId": "Edward"}])), ["default"])
+        self.assertEqual(self.routing.pinned("Edward"), "ina.w1")
+
+        # the pinned worker is gone: rows go to the shared queue & the user is unpinned
+        self.connection.data["rq:queue:ina.w1"] = []
+        self.connection.delete("rq:worker:w1")
+        self.assertEqual(list(self.routing.route([{"usrId": "Han"}])), ["default"])
+        self.assertEqual(self.routing.pinned("Han"), None)
+
+    def test_pool(self):
+        drivers = ina.Pool(2, factory=fixtures.FakeDriver)
+        task = ina.Task(ina.Key("TEST", "test_pool"), deque([ina.Command("printf", "${usrId}", None)]), options={"engine": "BROWSER"})
+        handler = ina.Job(pool=drivers)
+        handler.push(task, fmt="${0}", elut={"usrId": "Edward"})
+        handler.deploy()
+
+        # a worker pins the users its pool's idle Drivers are still logged in as
+        router.install(self.worker("w1")); ina.pool.install(drivers)
+        try: tasks.pin()
+        finally: 
+            router.install(None)
+            ina.pool.install(None)
+        self.assertEqual(drivers.users(), {"Edward"})
+        self.assertEqual(self.routing.pinned("Edward"), "ina.w1")
+        drivers.close()
+
+if __name__ == "__main__":
+    unittest.main()
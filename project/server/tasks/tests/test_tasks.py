@@ -103,5 +103,18 @@ class TestTasks(unittest.TestCase):
         }
         self.assertEqual(tasks.create_job(raw), True)
 
+    def test_malformed(self):
+        # malformed rows are skipped up front, instead of failing the job mid-way, i.e. no browser is launched
+        raw = {
+            "data": [
+                {"usrId": "Edward", "env": "TEST", "name": "TEST MOUSE"},
+                {"usrId": "Han", "env": "TEST", "name": "TEST LUT", "lut": "orderId"}
+            ]
+        }
+        self.assertEqual(tasks.create_job(raw), True)
+
+        raw = {"data": [{"usrId": "Edward", "lut": ""}, {"orderId": "HanOrderId"}]}
+        self.assertEqual(tasks.create_scan(raw), True)
+
 if __name__ == "__main__":
     unittest.main()
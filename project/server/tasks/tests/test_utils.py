@@ -4,8 +4,12 @@
 # => Local <=
 from project.server.tasks import ina
 from project.server.tasks import utils
+from project.server.tasks import config
+from project.server.tasks.ina.tests import fixtures
 
 # => System <=
+import os
+import time
 import unittest
 
 # === Test Object ===
@@ -32,11 +36,55 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(ina.Key("TEST", "TEST MOUSE") in tasks, True)
         self.assertEqual(ina.Key("TEST", "TEST PRINTF") in tasks, True)
 
+    def test_get_task_dict_optimized(self):
+        tasks = utils.get_task_dict(suffix=config.DEFAULT_SUFFIX)
+        task = tasks[ina.Key("TEST", "TEST KEYBOARD")]
+
+        self.assertEqual(task.cmds[0], ina.Command("emit", "TEST,TEST KEYBOARD", None))
+        self.assertEqual(task.program[0].op, "emit")
+
+        # every loaded Task starts w/ a navigation, i.e. the suffix's GET is overwritten by whichever row runs next
+        self.assertEqual(list(task.cmds), list(utils.get_task_dict()[task.key].cmds))
+
+    def test_get_task_dict_budget(self):
+        # a loaded Task's waits draw from the default deadline budget, unless its journal sets {"budget": ...}
+        task = utils.get_task_dict()[ina.Key("TEST", "TEST PRINTF")]
+        self.assertNotIn("budget", task.options)
+        remaining = []
+
+        class Spy(fixtures.FakeDriver):
+            def printf(self, target:str, argv:list=None):
+                remaining.append(self.deadline - time.monotonic())
+                return super().printf(target, argv)
+
+        instance = Spy("test_get_task_dict_budget")
+        instance.assign(task)
+        instance.exec({"usrId": "Edward"})
+        self.assertEqual(len(remaining), 3)
+        self.assertTrue(all(0 < seconds <= ina.config.DEFAULT_BUDGET for seconds in remaining))
+
+    def test_json2task_options(self):
+        task = utils.json2task(os.path.join(config.PATH_JOURNAL, "DELTA/swap_user.json"))
+        self.assertEqual(task.options, {"pause": "BOUND", "checkpoint": {"probe": "//ol[@id='b_results']"}})
+        self.assertEqual(task.program[-1].op, "settle")
+
     def test_partition(self):
         odds, evens = utils.partition(lambda row: row % 2, range(10))
 
         self.assertEqual(list(odds), [1, 3, 5, 7, 9])
         self.assertEqual(list(evens), [0, 2, 4, 6, 8])
 
+    def test_group(self):
+        rows = [{"usrId": "Han"}, {"usrId": "Edward"}, {}, {"usrId": "Han"}]
+        self.assertEqual(utils.group(rows, lambda row: row.get("usrId")), {"Han": [0, 3], "Edward": [1]})
+
+    def test_wellformed(self):
+        rows = [{"usrId": "Han", "lut": None}, {"usrId": "Edward"}, {"usrId": "Han", "lut": "id=1"}, "Han", {"usrId": "Suri", "lut": {}}]
+        self.assertEqual(utils.group(rows, lambda row: row["usrId"] if utils.wellformed(row, ("usrId", "lut")) else None), {"Han": [0], "Suri": [4]})
+
+    def test_parallelism(self):
+        self.assertEqual(utils.parallelism([{}]), 1)
+        self.assertEqual(utils.parallelism([{}] * config.DEFAULT_PARALLEL_THRESHOLD), config.DEFAULT_PARALLELISM)
+
 if __name__ == "__main__":
     unittest.main()
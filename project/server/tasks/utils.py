@@ -57,6 +57,9 @@ def get_logger(uid:str)->logging.Logger:
 def get_task_list(log:logging.Logger=None, prefix:list=None, suffix:list=None)->list:
     """Get 'list' of Task Objects via JSONs from "journal/*.json"
 
+    The suffix is dropped from optimized Task objects if it is dead (see ina.optimizer.dead_suffix),
+    i.e. every Task overwrites the page it leaves on the next row, before reading it
+
     Returns
     -------
     list
@@ -66,16 +69,21 @@ def get_task_list(log:logging.Logger=None, prefix:list=None, suffix:list=None)->
     for jsonpath in list(Path(config.PATH_JOURNAL).rglob("*.[jJ][sS][oO][nN]")):
         if log: log.info(f"parsing task: {jsonpath}")
         task = json2task(jsonpath)
-        if task.key.env != config.DEFAULT_NA:
-            if prefix: task.extendleft(prefix)
-            if suffix: task.extend(suffix)
+        if task.key.env != config.DEFAULT_NA and prefix: task.extendleft(prefix)
         task.pushleft(ina.Command("printf", f"{task.key.env},{task.key.name}", None))
-
         tasks.append(task)
+
+    dead = config.DEFAULT_OPTIMIZE and ina.optimizer.dead_suffix(suffix, tasks)
+    for task in tasks:
+        if task.key.env != config.DEFAULT_NA and suffix:
+            if not (dead and ina.optimizer.enabled(task)): task.extend(suffix)
+            elif log: log.info(f"optimized task: {task.key} - dropped the suffix (overwritten by the next row's first navigation)")
+        optimize(task, log)
+        ina.compile_task(task)
     return tasks
 
 def get_task_dict(log:logging.Logger=None, prefix:list=None, suffix:list=None)->dict:
-    """Get 'dict' of Task Objects via JSONs from "journal/*.json"
+    """Get 'dict' of Task Objects via JSONs from "journal/*.json", see 'get_task_list'
     
     Keys are their respective INA.Key objects
 
@@ -84,20 +92,10 @@ def get_task_dict(log:logging.Logger=None, prefix:list=None, suffix:list=None)->
     dict
     """
     
-    tasks = {}
-    for jsonpath in list(Path(config.PATH_JOURNAL).rglob("*.[jJ][sS][oO][nN]")):
-        if log: log.info(f"parsing task: {jsonpath}")
-        task = json2task(jsonpath)
-        if task.key.env != config.DEFAULT_NA:
-            if prefix: task.extendleft(prefix)
-            if suffix: task.extend(suffix)
-        task.pushleft(ina.Command("printf", f"{task.key.env},{task.key.name}", None))
-        
-        tasks[task.key] = task
-    return tasks
+    return {task.key: task for task in get_task_list(log, prefix, suffix)}
 
 def get_tupled_task_dict(log:logging.Logger=None, prefix:list=None, suffix:list=None)->dict:
-    """Get 'dict' of Task Objects via JSONs from "journal/*.json"
+    """Get 'dict' of Task Objects via JSONs from "journal/*.json", see 'get_task_list'
     
     Keys are tuple2s of INA.Key.env & INA.Key.name
     
@@ -106,30 +104,46 @@ def get_tupled_task_dict(log:logging.Logger=None, prefix:list=None, suffix:list=
     dict
     """
 
-    tasks = {}
-    for jsonpath in list(Path(config.PATH_JOURNAL).rglob("*.[jJ][sS][oO][nN]")):
-        if log: log.info(f"parsing task: {jsonpath}")
-        task = json2task(jsonpath)
-        if task.key.env != config.DEFAULT_NA:
-            if prefix: task.extendleft(prefix)
-            if suffix: task.extend(suffix)
-        task.pushleft(ina.Command("printf", f"{task.key.env},{task.key.name}", None))
-        
-        tasks[(task.key.env, task.key.name)] = task
-    return tasks
+    return {(task.key.env, task.key.name): task for task in get_task_list(log, prefix, suffix)}
+
+def optimize(task:ina.Task, log:logging.Logger=None)->list:
+    """Optimize (i.e. rewrite) the Task object's commands, if config.DEFAULT_OPTIMIZE
+
+    Parameters
+    ----------
+    task: ina.Task
+        The Task object
+    log: logging.Logger, optional
+        Logs the optimizer's report
+
+    Returns
+    -------
+    list: The optimizer's report
+    """
+
+    if not config.DEFAULT_OPTIMIZE: return []
+
+    report = ina.optimize(task)
+    if log:
+        for change in report: log.info(f"optimized task: {task.key} - {change}")
+    return report
 
 # => Parser(s) <=
 def json2task(jsonpath:str)->ina.Task:
     """Construct an INA Task Object via JSON
+    The Task is compiled (i.e. INA.Task.program) at load time
 
     Required JSON Format:
     {
         "name": <INA.Key.name>
         "env: <INA.Key.env>
+        "options": optional <INA.Task.options>, e.g. {"pause": "BOUND"}
         "commands": [
             [<INA.Command.label>, {
                 "target": <INA.Command.target>,
-                "argv": <INA.Command.argv>
+                "argv": <INA.Command.argv>,
+                "critical": optional <INA.Command.critical>,
+                "optional": optional <INA.Command.optional>
             }], 
             
             ...
@@ -155,19 +169,115 @@ def json2task(jsonpath:str)->ina.Task:
             label = cmd[0].lower() # possible index error
             target = None
             argv = None
+            critical = False
+            optional = False
 
             if len(cmd) > 1:
                 if isinstance(cmd[1], dict): 
                     target = cmd[1].get("target", None)
                     argv = cmd[1].get("argv", None)
+                    critical = bool(cmd[1].get("critical", False))
+                    optional = bool(cmd[1].get("optional", False))
                     if argv and not isinstance(argv, list): argv = [argv]
                 else: target = cmd[1]
             
-            cmds.append(ina.Command(label, target, argv))
-        return ina.Task(ina.Key(raw["env"], raw["name"]), cmds)
+            cmds.append(ina.Command(label, target, argv, critical, optional))
+        
+        task = ina.Task(ina.Key(raw["env"], raw["name"]), cmds, options=raw.get("options") or {})
+        ina.compile_task(task)
+        return task
     
     except IndexError: raise IndexError(f"server.tasks.json2task: Index Error - {jsonpath}")
 
+def parallelism(data:list)->int:
+    """Get the number of Drivers a Job over <data> is sharded across
+
+    Parameters
+    ----------
+    data: list
+        The payload rows
+
+    Returns
+    -------
+    int: 1 unless the payload is large
+    """
+
+    if len(data) >= config.DEFAULT_PARALLEL_THRESHOLD: return config.DEFAULT_PARALLELISM
+    return 1
+
+def pipeline(raw:dict)->int:
+    """Get the number of background tabs a Job over <raw> prefetches its next rows in,
+    w/ the payload key {"pipeline": <TABS>}
+
+    Parameters
+    ----------
+    raw: dict
+        The payload
+
+    Returns
+    -------
+    int: By default ina.config.DEFAULT_PIPELINE, i.e. disabled
+    """
+
+    try: return max(0, int(raw.get("pipeline") or ina.config.DEFAULT_PIPELINE))
+    except (TypeError, ValueError): return ina.config.DEFAULT_PIPELINE
+
+def plan(raw:dict)->bool:
+    """Check if a Job over <raw> orders its rows by estimated cost (see ina.planner),
+    opt-out w/ the payload key {"plan": false}
+
+    Parameters
+    ----------
+    raw: dict
+        The payload
+
+    Returns
+    -------
+    bool: By default ina.config.DEFAULT_PLAN
+    """
+
+    value = raw.get("plan")
+    return ina.config.DEFAULT_PLAN if value is None else bool(value)
+
+def group(rows:list, key)->dict:
+    """Group rows by <key> in a single hash-based pass, w/o copying them
+
+    Parameters
+    ----------
+    rows: list
+        The payload rows
+    key: func
+        Gets a row's group, rows whose group is None are skipped
+
+    Returns
+    -------
+    dict: The indices of each group's rows, in order, keyed by group
+    """
+
+    groups = {}
+    for idx, row in enumerate(rows):
+        value = key(row)
+        if value is not None: groups.setdefault(value, []).append(idx)
+    return groups
+
+def wellformed(row:dict, keys:tuple)->bool:
+    """Check if a payload row has every key of <keys> & a look-up table, if any, that is a dict
+    i.e. a row that would fail mid-job is skipped up front, while grouping (see 'group')
+
+    Parameters
+    ----------
+    row: dict
+        A payload row
+    keys: tuple
+        The keys the row is read by
+
+    Returns
+    -------
+    bool
+    """
+
+    return isinstance(row, dict) and all(key in row for key in keys) and isinstance(row.get("lut") or {}, dict)
+
 def partition(pred, iterable):
     """Use a predicate to partition entries into true entries and false entries
 
@@ -3,6 +3,7 @@
 # === Import(s) ===
 # => Local <=
 from .. import tasks
+from ..tasks import router
 
 # => System <=
 import uuid
@@ -23,10 +24,13 @@ def get_keys():
 
 @api.route("/job/<job_id>", methods=["GET"])
 def get_status(job_id):
-    with Connection(redis.from_url(current_app.config["REDIS_URL"])):
+    connection = redis.from_url(current_app.config["REDIS_URL"])
+    with Connection(connection):
         q = Queue()
         job = q.fetch_job(job_id)
-    
+        children = None if job else router.Router(connection).children(job_id)
+        jobs = [q.fetch_job(child) for child in children or []]
+
     if job:
         response = {
             "status": "success",
@@ -34,6 +38,26 @@ def get_status(job_id):
                 "job_id": job.get_id(),
                 "job_status": job.get_status(),
                 "job_result": job.result,
+                "job_records": job.meta.get("records"),
+                "job_costs": job.meta.get("costs"),
+            },
+        }
+    elif jobs and all(jobs):
+        # a payload split across workers by session affinity, see tasks.router
+        statuses = [job.get_status() for job in jobs]
+        status = next((s for s in ("failed", "started", "deferred", "queued") if s in statuses), "finished")
+        records = [record for job in jobs for record in job.meta.get("records") or []]
+        costs = {}
+        for job in jobs:
+            for key, cost in (job.meta.get("costs") or {}).items(): costs[key] = costs.get(key, 0.0) + (cost or 0.0)    # i.e. summed over its parts
+        response = {
+            "status": "success",
+            "data": {
+                "job_id": job_id,
+                "job_status": status,
+                "job_result": all(job.result for job in jobs) if status == "finished" else None,
+                "job_records": records or None,
+                "job_costs": costs or None,
             },
         }
     else:
@@ -43,15 +67,16 @@ def get_status(job_id):
 # Method: Post(s)
 @api.route("/job", methods=["POST"])
 def run_job():
-    with Connection(redis.from_url(current_app.config["REDIS_URL"])):
+    connection = redis.from_url(current_app.config["REDIS_URL"])
+    with Connection(connection):
         job_id = str(uuid.uuid4())
-        q = Queue()
-        job = q.enqueue(tasks.create_job, args=(request.json, job_id, current_app.config["WEBDRIVER"],), job_id=job_id)
+        routing = router.Router(connection, queue=current_app.config["QUEUES"][0])
+        routing.enqueue(tasks.create_job, request.json, job_id, current_app.config["WEBDRIVER"])
 
     response = {
         "status": "success",
         "data": {
-            "job_id": job.get_id(),
+            "job_id": job_id,
         },
     }
 
@@ -59,15 +84,16 @@ def run_job():
 
 @api.route("/scan", methods=["POST"])
 def run_scan():
-    with Connection(redis.from_url(current_app.config["REDIS_URL"])):
+    connection = redis.from_url(current_app.config["REDIS_URL"])
+    with Connection(connection):
         job_id = str(uuid.uuid4())
-        q = Queue()
-        job = q.enqueue(tasks.create_scan, args=(request.json, job_id, current_app.config["WEBDRIVER"],), job_id=job_id)
+        routing = router.Router(connection, queue=current_app.config["QUEUES"][0])
+        routing.enqueue(tasks.create_scan, request.json, job_id, current_app.config["WEBDRIVER"])
     
     response = {
         "status": "success",
         "data": {
-            "job_id": job.get_id(),
+            "job_id": job_id,
         },
     }
 